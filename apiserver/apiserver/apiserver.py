@@ -33,6 +33,42 @@ def execute():
     
     return flask.jsonify(result)
 
+@app.route('/execute_binary', methods=['POST'])
+def execute_binary():
+    code = flask.request.json
+
+    info(f'execute_binary: {code}')
+
+    jir = Env.hail().expr.ir.IRParser.parse_value_ir(code, {}, {})
+
+    typ = hl.dtype(jir.typ().toString())
+    value = Env.hail().expr.ir.Interpret.interpretBinary(jir)
+
+    return flask.Response(bytes(value),
+                          mimetype='application/octet-stream',
+                          headers={'Hail-Type': str(typ)})
+
+@app.route('/execute_batch', methods=['POST'])
+def execute_batch():
+    codes = flask.request.json
+
+    info(f'execute_batch: {codes}')
+
+    code = '(MakeTuple {})'.format(' '.join(codes))
+    jir = Env.hail().expr.ir.IRParser.parse_value_ir(code, {}, {})
+
+    typ = hl.dtype(jir.typ().toString())
+    value = Env.hail().expr.ir.Interpret.interpretJSON(jir)
+
+    result = {
+        'type': str(typ),
+        'value': value
+    }
+
+    info(f'result: {result}')
+
+    return flask.jsonify(result)
+
 @app.route('/type/value', methods=['POST'])
 def value_type():
     code = flask.request.json
@@ -1,6 +1,7 @@
 from .utils import run_all, run_single, initialize
 from .matrix_table_benchmarks import *
 from .methods_benchmarks import *
+from .python_benchmarks import *
 from .table_benchmarks import *
 
 __all__ = [
@@ -0,0 +1,113 @@
+import json
+from functools import lru_cache
+
+import numpy as np
+
+import hail as hl
+from hail.typecheck import typecheck, nullable, oneof
+from hail.typecheck.check import check_all, only
+from benchmark.utils import benchmark
+
+
+def _build_expressions():
+    e = hl.utils.range_table(10).idx
+    for i in range(5_000):
+        e = e * 2 + i
+
+
+@benchmark
+def python_construct_expr():
+    _build_expressions()
+
+
+@benchmark
+def python_construct_expr_no_internal_checks():
+    hl.typecheck.set_internal_checks(False)
+    try:
+        _build_expressions()
+    finally:
+        hl.typecheck.set_internal_checks(True)
+
+
+_checks = {'x': int, 'y': nullable(str), 'z': oneof(int, float)}
+
+
+def _f(x, y=None, z=1.0):
+    return x
+
+
+@benchmark
+def python_typecheck_call():
+    f = typecheck(**_checks)(_f)
+    for _ in range(1_000_000):
+        f(1, 'a', z=2)
+
+
+@benchmark
+def python_typecheck_call_generic():
+    # the per-call signature walk used before checkers were compiled
+    checks = {k: only(v) for k, v in _checks.items()}
+    for _ in range(1_000_000):
+        args, kwargs = check_all(_f, (1, 'a'), {'z': 2}, checks, is_method=False)
+        _f(*args, **kwargs)
+
+
+@lru_cache()
+def _json_array(element_type):
+    n = 10_000_000
+    if element_type == hl.tfloat64:
+        return json.dumps([i / 3 for i in range(n)])
+    return json.dumps(list(range(n)))
+
+
+@benchmark
+def python_float64_array_from_json():
+    hl.tarray(hl.tfloat64)._from_json(_json_array(hl.tfloat64))
+
+
+@benchmark
+def python_int32_array_from_json():
+    hl.tarray(hl.tint32)._from_json(_json_array(hl.tint32))
+
+
+_wide_struct_type = str(hl.tstruct(**{f'f{i}': [hl.tint32, hl.tarray(hl.tstr), hl.tstruct(x=hl.tfloat64)][i % 3]
+                                      for i in range(2_000)}))
+
+
+@benchmark
+def python_parse_wide_struct_type():
+    for _ in range(10):
+        hl.dtype.cache_clear()
+        hl.dtype(_wide_struct_type)
+
+
+@benchmark
+def python_construct_wide_struct():
+    ht = hl.utils.range_table(10)
+    s = hl.struct(**{f'f{i}': ht.idx + i for i in range(10_000)})
+    hl.struct(x=s, y=hl.agg.sum(s.f9999))
+
+
+@benchmark
+def python_construct_aggregation_chain():
+    ht = hl.utils.range_table(10)
+    e = hl.agg.sum(ht.idx)
+    for i in range(5_000):
+        e = hl.agg.count() + e
+
+
+@benchmark
+def python_literal_numpy_vector():
+    x = np.random.rand(1_000_000)
+    for _ in range(10):
+        e = hl.literal(x)
+        e.dtype._to_binary(e._ir.value)
+
+
+@benchmark
+def python_literal_list():
+    ints = list(range(1_000_000))
+    strs = [str(i) for i in range(1_000_000)]
+    for _ in range(5):
+        hl.literal(ints)
+        hl.literal(strs)
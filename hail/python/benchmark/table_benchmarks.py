@@ -1,3 +1,6 @@
+import numpy as np
+import pandas as pd
+
 import hail as hl
 from benchmark.utils import benchmark, resource
 
@@ -31,6 +34,30 @@ def table_range_force_count():
     hl.utils.range_table(100_000_000)._force_count()
 
 
+def _table_collect_ir():
+    ht = hl.utils.range_table(1_000_000, 8)
+    ht = ht.annotate(x=hl.float(ht.idx) / 3, s=hl.str(ht.idx), a=hl.range(0, ht.idx % 10))
+    return ht.collect(_localize=False)._ir
+
+
+@benchmark
+def table_collect():
+    hl.utils.java.Env.backend().execute(_table_collect_ir())
+
+
+@benchmark
+def table_collect_json():
+    hl.utils.java.Env.backend()._execute_json(_table_collect_ir())
+
+
+@benchmark
+def table_iter_rows():
+    ht = hl.utils.range_table(1_000_000, 8)
+    ht = ht.annotate(x=hl.float(ht.idx) / 3, s=hl.str(ht.idx), a=hl.range(0, ht.idx % 10))
+    for _ in ht.iter_rows():
+        pass
+
+
 @benchmark
 def table_python_construction():
     N = 100
@@ -39,6 +66,16 @@ def table_python_construction():
         ht = ht.annotate(**{f'x_{i}': 0})
 
 
+@benchmark
+def table_python_construction_read():
+    N = 200
+    for i in range(N):
+        ht = hl.read_matrix_table(resource('profile.mt')).rows()
+        ht = ht.select(x=ht.locus.position + i)
+        ht = ht.filter(ht.x % 2 == 0)
+        ht = ht.key_by('x')
+
+
 @benchmark
 def table_big_aggregate_compilation():
     N = 1_000
@@ -90,3 +127,55 @@ def table_annotate_many_nested_dependence():
     for i in range(1, M):
         ht = ht.annotate(**{f'x{i}': i + ht[f'x{i - 1}']})
     ht._force_count()
+
+
+@benchmark
+def table_annotate_many_nested_dependence_render_and_parse():
+    M = 100
+    ht = hl.utils.range_table(1_000_000).annotate(x0=1)
+    for i in range(1, M):
+        ht = ht.annotate(**{f'x{i}': i + ht[f'x{i - 1}']})
+    hl.utils.java.Env.backend()._to_java_ir(ht._tir)
+
+
+@benchmark
+def table_annotate_shared_subexpressions_render_and_parse():
+    M = 20
+    ht = hl.utils.range_table(1_000_000)
+    x = ht.idx
+    for i in range(M):
+        x = x + x
+    ht = ht.annotate(**{f'x{i}': x for i in range(M)})
+    hl.utils.java.Env.backend()._to_java_ir(ht._tir)
+
+
+@benchmark
+def table_to_pandas():
+    ht = hl.utils.range_table(10_000_000, 16)
+    ht = ht.annotate(x=hl.float(ht.idx) / 3, y=hl.int64(ht.idx) * 7)
+    ht.to_pandas()
+
+
+@benchmark
+def table_from_pandas():
+    n = 10_000_000
+    df = pd.DataFrame({'idx': np.arange(n, dtype=np.int32),
+                       'x': np.arange(n) / 3,
+                       'y': np.arange(n, dtype=np.int64) * 7})
+    hl.Table.from_pandas(df)._force_count()
+
+
+@benchmark
+def table_filter_large_literal():
+    ids = hl.literal({f'1:{i}:A:T' for i in range(100_000)})
+    ht = hl.utils.range_table(1_000_000, 16)
+    for i in range(5):
+        ht.filter(ids.contains(hl.str('1:') + hl.str(ht.idx + i) + ':A:T'))._force_count()
+
+
+@benchmark
+def table_parallelize_records():
+    n = 10_000_000
+    a = np.zeros(n, dtype=[('idx', 'i8'), ('x', 'f8'), ('y', 'f4')])
+    a['idx'] = np.arange(n)
+    hl.Table.parallelize(a)._force_count()
@@ -23,9 +23,11 @@ To report a bug, please open an issue: https://github.com/hail-is/hail/issues
 
 from .context import init, stop, spark_context, default_reference, \
     get_reference, set_global_seed, _set_flags, \
-    _set_upload_url, set_upload_email, enable_pipeline_upload, disable_pipeline_upload, upload_log
+    _set_upload_url, set_upload_email, enable_pipeline_upload, disable_pipeline_upload, upload_log, \
+    enable_result_cache, disable_result_cache, result_cache, enable_auto_persist, disable_auto_persist, auto_persist
 from .table import Table, GroupedTable, asc, desc
 from .matrixtable import MatrixTable, GroupedMatrixTable
+from .profiling import profile
 from .expr import *
 from .genetics import *
 from .methods import *
@@ -55,6 +57,13 @@ __all__ = [
     'enable_pipeline_upload',
     'disable_pipeline_upload',
     'upload_log',
+    'enable_result_cache',
+    'disable_result_cache',
+    'result_cache',
+    'enable_auto_persist',
+    'disable_auto_persist',
+    'auto_persist',
+    'profile',
     'Table',
     'GroupedTable',
     'MatrixTable',
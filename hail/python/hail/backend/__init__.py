@@ -4,5 +4,8 @@ __all__ = [
     'Backend',
     'LocalBackend',
     'SparkBackend',
-    'ServiceBackend'
+    'ServiceBackend',
+    'ParseCache',
+    'ResultCache',
+    'AutoPersist'
 ]
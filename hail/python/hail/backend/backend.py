@@ -1,23 +1,165 @@
 import abc
+import concurrent.futures
+import contextlib
+import hashlib
+import struct
+import threading
+from collections import OrderedDict
 
 from hail.utils.java import *
-from hail.expr.types import dtype
+from hail.utils.misc import wrap_to_list, new_temp_file
+from hail.utils.hadoop_utils import hadoop_stat
+from hail.expr.types import dtype, tarray, tstruct, tbool, tint32, tint64, tfloat32, tfloat64, tstr
 from hail.expr.table_type import *
 from hail.expr.matrix_type import *
 from hail.expr.blockmatrix_type import *
-from hail.ir.renderer import Renderer
+from hail.ir import MakeTuple, TableIR, MatrixIR, TableWrite, MatrixWrite, MatrixMultiWrite, \
+    BlockMatrixWrite, TableToValueApply, MatrixToValueApply, TableExport, TableRead, TableRange, JavaTable, \
+    MatrixRead, JavaMatrix, TableNativeReader, MatrixNativeReader
+from hail.ir.renderer import CSERenderer
+from hail.ir.plan import ir_children
+from hail.profiling import profiled, profiled_action
 from hail.table import Table
 from hail.matrixtable import MatrixTable
 
 import requests
 
+import numpy as np
+import pandas
 import pyspark
 
 class Backend(abc.ABC):
+    # whether large literals are passed to the backend in local files, see `Literal`
+    literal_files = False
+
+    def __init__(self):
+        self._read_types = {}
+        self._executor = None
+        # cache of action results, see `hl.enable_result_cache`
+        self.result_cache = None
+        # planner persisting reused intermediates, see `hl.enable_auto_persist`
+        self.auto_persist = None
+        # per-thread state of the executions of this backend
+        self._thread_state = threading.local()
+
     @abc.abstractmethod
     def execute(self, ir):
         return
 
+    @profiled_action
+    def _execute_binary(self, ir):
+        """Execute `ir`, returning its type and the binary encoding of its value.
+
+        If the result cache is enabled, the result is looked up in it first,
+        and intermediates are only persisted for actions that are run.
+        """
+        cache = self.result_cache
+        key = _result_key(ir, self.literal_files) if cache is not None else None
+        if key is not None:
+            result = cache.get(key)
+            if result is not None:
+                return result
+        if self.auto_persist is not None:
+            self.auto_persist._plan(ir)
+        result = self._run_binary(ir)
+        if key is not None:
+            cache.put(key, type(ir).__name__, result)
+        return result
+
+    @abc.abstractmethod
+    def _run_binary(self, ir):
+        """Execute `ir` in the backend, returning its type and the binary encoding of its value."""
+        return
+
+    @profiled_action
+    def execute_columns(self, ir):
+        """Execute `ir`, a struct of arrays, returning a dict of NumPy arrays.
+
+        Arrays of Booleans and numbers are decoded without making Python
+        objects, and are masked arrays if they have missing elements. Arrays
+        of other types are NumPy arrays of dtype object.
+        """
+        typ, b = self._execute_binary(ir)
+        columns = {}
+        i = 1
+        for f, t in typ.items():
+            values, missing, i = _decode_numpy_column(t.element_type, b, i + 1)
+            if missing is not None:
+                values = np.ma.masked_array(values, mask=missing)
+            columns[f] = values
+        return columns
+
+    def execute_async(self, ir):
+        """Execute `ir` on a background thread.
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
+            Future result of :meth:`.execute`.
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix='hail-execute')
+        return self._executor.submit(self.execute, ir)
+
+    def stop(self):
+        """Wait for asynchronous executions to finish and release their threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @profiled_action
+    def execute_batch(self, irs):
+        """Execute several value IRs in one round trip, returning a list of the results."""
+        if len(irs) == 0:
+            return []
+        return list(self.execute(MakeTuple(irs)))
+
+    def _read_type(self, ir, path):
+        """Type of `ir`, a read of the native file at `path`.
+
+        Types are cached for the session, until the session writes a native
+        file, so reading the same file repeatedly asks the backend once.
+        """
+        key = (type(ir).__name__, path)
+        t = self._read_types.get(key)
+        if t is None:
+            if isinstance(ir, TableIR):
+                t = self.table_type(ir)
+            elif isinstance(ir, MatrixIR):
+                t = self.matrix_type(ir)
+            else:
+                t = self.blockmatrix_type(ir)
+            self._read_types[key] = t
+        return t
+
+    def _clear_read_types(self, ir):
+        # writes of new temporary files, such as checkpoints made by
+        # auto persist, change no file that was read before
+        if getattr(self._thread_state, 'temporary_writes', False):
+            return
+        # the value functions include writers such as MatrixWriteBlockMatrix;
+        # `execute_batch` runs several actions as the fields of a tuple
+        irs = ir.children if isinstance(ir, MakeTuple) else [ir]
+        if any(isinstance(x, (TableWrite, MatrixWrite, MatrixMultiWrite, BlockMatrixWrite,
+                              TableToValueApply, MatrixToValueApply)) for x in irs):
+            self._read_types.clear()
+            # modification times may not tell apart files rewritten within a second
+            if self.result_cache is not None:
+                self.result_cache._invalidate()
+
+    @contextlib.contextmanager
+    def _temporary_writes(self):
+        """Context in which the writes of this thread are of new temporary files."""
+        self._thread_state.temporary_writes = True
+        try:
+            yield
+        finally:
+            self._thread_state.temporary_writes = False
+
+    def _optimized_ir(self, ir):
+        """Text of `ir` as optimized by the backend, or ``None`` if the backend cannot show it."""
+        return None
+
     @abc.abstractmethod
     def value_type(self, ir):
         return
@@ -79,28 +221,400 @@ class Backend(abc.ABC):
         pass
 
 
+class ParseCache(object):
+    """Bounded LRU cache of parsed Java IR, keyed by the rendered IR text.
+
+    Rendered text that refers to already-parsed Java IR (``(JavaTable m0)``
+    and friends) is keyed together with the identities of those Java objects.
+
+    Parameters
+    ----------
+    capacity : :obj:`int`
+        Maximum number of parsed IRs to keep.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def parse(self, ir, code, ir_map):
+        key = (type(ir).parse, code, tuple(jir._target_id for jir in ir_map.values()))
+        with self._lock:
+            jir = self._cache.get(key)
+            if jir is not None:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return jir
+            self.misses += 1
+        # FIXME parse should be static
+        jir = ir.parse(code, ir_map=ir_map)
+        with self._lock:
+            self._cache[key] = jir
+            if len(self._cache) > self.capacity:
+                self._cache.popitem(last=False)
+        return jir
+
+    def __repr__(self):
+        return f'ParseCache(size={len(self)}, capacity={self.capacity}, hits={self.hits}, misses={self.misses})'
+
+
+class ResultCache(object):
+    """Bounded LRU cache of the results of actions.
+
+    Results are keyed by a hash of the rendered IR of the action, together
+    with the modification times and sizes of the files it reads, so an
+    action is run again if its pipeline changes or its inputs are rewritten.
+    Actions that write files, and actions reading files that cannot be
+    listed ahead of time, such as files matched by glob patterns, are never
+    cached.
+
+    Parameters
+    ----------
+    max_bytes : :obj:`int`
+        Maximum total size of the encoded results to keep.
+    """
+
+    def __init__(self, max_bytes=1 << 28):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        """Remove all results, and reset the hit and miss counts."""
+        with self._lock:
+            self._cache.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _invalidate(self):
+        with self._lock:
+            self._cache.clear()
+            self.nbytes = 0
+
+    def entries(self):
+        """The cached results, least recently used first.
+
+        Returns
+        -------
+        :obj:`list` of :obj:`dict`
+            For each result, a dictionary with keys ``'action'`` (the name of
+            the IR of the action), ``'bytes'`` (the size of its encoding) and
+            ``'inputs'`` (the files read).
+        """
+        with self._lock:
+            return [{'action': action, 'bytes': len(b), 'inputs': [path for path, _, _ in key[2]]}
+                    for key, (action, _, b) in self._cache.items()]
+
+    def get(self, key):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._cache.move_to_end(key)
+            _, typ, b = entry
+            return typ, b
+
+    def put(self, key, action, result):
+        typ, b = result
+        if len(b) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self.nbytes -= len(old[2])
+            self._cache[key] = (action, typ, b)
+            self.nbytes += len(b)
+            while self.nbytes > self.max_bytes:
+                _, (_, _, evicted) = self._cache.popitem(last=False)
+                self.nbytes -= len(evicted)
+
+    def __repr__(self):
+        return f'ResultCache(size={len(self)}, bytes={self.nbytes}, max_bytes={self.max_bytes}, ' \
+               f'hits={self.hits}, misses={self.misses})'
+
+
+class _InputsRenderer(CSERenderer):
+    """Renderer recording the nodes and readers it renders."""
+
+    def __init__(self, stop_at_jir=False, literal_files=False):
+        super().__init__(stop_at_jir, literal_files)
+        self.nodes = []
+
+    def _template(self, x):
+        self.nodes.append(x)
+        return super()._template(x)
+
+
+def _result_key(ir, literal_files):
+    """Key of the result of `ir` in a :class:`.ResultCache`, or ``None`` if it must not be cached.
+
+    Nodes already converted to the backend's IR, such as intermediates
+    persisted by :class:`.AutoPersist`, are rendered in full, so the key does
+    not change when they are converted.
+    """
+    r = _InputsRenderer(stop_at_jir=False, literal_files=literal_files)
+    code = r(ir)
+    paths = set()
+    for x in r.nodes:
+        if isinstance(x, (TableWrite, MatrixWrite, MatrixMultiWrite, BlockMatrixWrite, TableExport,
+                          TableToValueApply, MatrixToValueApply)):
+            return None
+        input_files = getattr(x, '_input_files', None)
+        if input_files is not None:
+            files = input_files()
+            if files is None:
+                return None
+            paths.update(files)
+    inputs = []
+    for path in sorted(paths):
+        try:
+            stat = hadoop_stat(path)
+        except Exception:
+            # e.g. a glob pattern, or a backend without a file system
+            return None
+        inputs.append((path, stat['modification_time'], stat['size_bytes']))
+    return (hashlib.sha256(code.encode('utf-8')).hexdigest(),
+            tuple(jir._target_id for jir in r.jirs.values()),
+            tuple(inputs))
+
+
+# relational IR that is as cheap to compute again as to read back once persisted
+_source_irs = (TableRead, TableRange, JavaTable, MatrixRead, JavaMatrix)
+
+
+class _Persisted(object):
+    __slots__ = ['node', 'persisted', 'executions', 'path']
+
+    def __init__(self, node, persisted, path):
+        self.node = node
+        # the persisted Table or MatrixTable, or None if checkpointed to `path`
+        self.persisted = persisted
+        self.executions = node._executions
+        self.path = path
+
+
+class AutoPersist(object):
+    """Planner persisting the tables and matrix tables that actions reuse.
+
+    Before each action, the planner counts the executions of every relational
+    IR node the action runs. The first node found, from the root of the
+    action, that is run for the second time is persisted, so that this and
+    later actions reuse it instead of computing it again. Reads and ranges
+    are never persisted. Actions answered by the result cache (see
+    :func:`.enable_result_cache`) run nothing, and are not counted.
+
+    Parameters
+    ----------
+    storage_level : :obj:`str`
+        Storage level of the persisted intermediates, see :meth:`.Table.persist`.
+    checkpoint : :obj:`bool`
+        If true, intermediates are written to temporary files and read back
+        instead of being persisted.
+    max_persisted : :obj:`int`
+        Maximum number of intermediates to keep; the least recently used is
+        unpersisted when another is persisted.
+    """
+
+    def __init__(self, storage_level='MEMORY_AND_DISK', checkpoint=False, max_persisted=16):
+        self.storage_level = storage_level
+        self.checkpoint = checkpoint
+        self.max_persisted = max_persisted
+        self.n_persisted = 0
+        self.n_evicted = 0
+        self._persisted = OrderedDict()
+        # actions may run on several threads, see `Backend.execute_async`
+        self._lock = threading.Lock()
+        self._thread_state = threading.local()
+
+    def __len__(self):
+        return len(self._persisted)
+
+    def _plan(self, ir):
+        # persisting an intermediate runs actions on this thread
+        if getattr(self._thread_state, 'planning', False):
+            return
+        self._thread_state.planning = True
+        try:
+            with self._lock:
+                self._plan_locked(ir)
+        finally:
+            self._thread_state.planning = False
+
+    def _plan_locked(self, ir):
+        visited = set()
+        stack = [ir]
+        while stack:
+            x = stack.pop()
+            if id(x) in visited:
+                continue
+            visited.add(id(x))
+            if isinstance(x, (TableIR, MatrixIR)):
+                p = self._persisted.get(id(x))
+                if p is not None:
+                    p.executions += 1
+                    self._persisted.move_to_end(id(x))
+                    continue
+                x._executions = getattr(x, '_executions', 0) + 1
+                if x._executions > 1 and not isinstance(x, _source_irs) and self._persist(x):
+                    continue
+            stack.extend(ir_children(x))
+
+    def _persist(self, x):
+        backend = Env.backend()
+        path = None
+        persisted = None
+        if self.checkpoint:
+            if isinstance(x, TableIR):
+                path = new_temp_file(suffix='ht')
+                with backend._temporary_writes():
+                    Table(x).write(path)
+                jir = backend._to_java_ir(TableRead(TableNativeReader(path)))
+            else:
+                path = new_temp_file(suffix='mt')
+                with backend._temporary_writes():
+                    MatrixTable(x).write(path)
+                jir = backend._to_java_ir(MatrixRead(MatrixNativeReader(path)))
+        else:
+            if isinstance(x, TableIR):
+                persisted = backend.persist_table(Table(x), self.storage_level)
+                persisted_ir = persisted._tir
+            else:
+                persisted = backend.persist_matrix_table(MatrixTable(x), self.storage_level)
+                persisted_ir = persisted._mir
+            if persisted_ir is x:
+                # the backend does not persist
+                return False
+            jir = persisted_ir._jir
+        x._jir = jir
+        self._persisted[id(x)] = _Persisted(x, persisted, path)
+        self.n_persisted += 1
+        while len(self._persisted) > self.max_persisted:
+            _, p = self._persisted.popitem(last=False)
+            self._unpersist(p)
+            self.n_evicted += 1
+        return True
+
+    def _unpersist(self, p):
+        if p.persisted is not None:
+            if isinstance(p.node, TableIR):
+                Env.backend().unpersist_table(p.persisted)
+            else:
+                Env.backend().unpersist_matrix_table(p.persisted)
+        # the node is parsed again the next time it is run
+        del p.node._jir
+
+    def clear(self):
+        """Unpersist all intermediates."""
+        with self._lock:
+            while self._persisted:
+                _, p = self._persisted.popitem(last=False)
+                self._unpersist(p)
+
+    def entries(self):
+        """The persisted intermediates, least recently used first.
+
+        Returns
+        -------
+        :obj:`list` of :obj:`dict`
+            For each intermediate, a dictionary with keys ``'kind'``
+            (``'Table'`` or ``'MatrixTable'``), ``'ir'`` (the name of its IR
+            node), ``'executions'`` (the number of actions that ran it) and
+            ``'path'`` (the checkpoint file, or ``None`` if persisted).
+        """
+        with self._lock:
+            return [{'kind': 'Table' if isinstance(p.node, TableIR) else 'MatrixTable',
+                     'ir': type(p.node).__name__,
+                     'executions': p.executions,
+                     'path': p.path}
+                    for p in self._persisted.values()]
+
+    def explain(self):
+        """Description of the persisted intermediates.
+
+        Returns
+        -------
+        :obj:`str`
+        """
+        how = 'checkpoint' if self.checkpoint else f'persist {self.storage_level}'
+        lines = [f'auto persist ({how}): {len(self)} of at most {self.max_persisted} intermediates kept, '
+                 f'{self.n_persisted} persisted, {self.n_evicted} evicted']
+        for e in reversed(self.entries()):
+            where = e['path'] if e['path'] is not None else self.storage_level
+            lines.append(f'  {e["kind"]:<12}{e["ir"]:<28}{e["executions"]:>6} executions  {where}')
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return f'AutoPersist(size={len(self)}, max_persisted={self.max_persisted}, ' \
+               f'persisted={self.n_persisted}, evicted={self.n_evicted})'
+
+
 class SparkBackend(Backend):
+    literal_files = True
+
+    def __init__(self):
+        super().__init__()
+        self.parse_cache = ParseCache()
+
+    @profiled('to_java_ir')
     def _to_java_ir(self, ir):
         if not hasattr(ir, '_jir'):
-            r = Renderer(stop_at_jir=True)
+            r = CSERenderer(stop_at_jir=True, literal_files=self.literal_files)
             code = r(ir)
-            # FIXME parse should be static
-            ir._jir = ir.parse(code, ir_map=r.jirs)
+            ir._jir = self.parse_cache.parse(ir, code, r.jirs)
         return ir._jir
 
+    def _optimized_ir(self, ir):
+        jir = Env.hail().expr.ir.Optimize.apply(self._to_java_ir(ir), False, False)
+        return Env.hail().expr.ir.Pretty.apply(jir, True)
+
+    @profiled_action
     def execute(self, ir):
+        typ, b = self._execute_binary(ir)
+        return typ._from_binary(b)
+
+    def _run_binary(self, ir):
+        self._clear_read_types(ir)
+        return ir.typ, Env.hail().expr.ir.Interpret.interpretBinary(self._to_java_ir(ir))
+
+    @profiled_action
+    def _execute_json(self, ir):
+        self._clear_read_types(ir)
         return ir.typ._from_json(
             Env.hail().expr.ir.Interpret.interpretJSON(
                 self._to_java_ir(ir)))
 
+    @profiled('infer_type')
     def value_type(self, ir):
         jir = self._to_java_ir(ir)
         return dtype(jir.typ().toString())
 
+    @profiled('infer_type')
     def table_type(self, tir):
         jir = self._to_java_ir(tir)
         return ttable._from_java(jir.typ())
 
+    @profiled('infer_type')
     def matrix_type(self, mir):
         jir = self._to_java_ir(mir)
         return tmatrix._from_java(jir.typ())
@@ -117,6 +631,7 @@ class SparkBackend(Backend):
     def unpersist_matrix_table(self, mt):
         return MatrixTable._from_java(mt._jmt.unpersist())
     
+    @profiled('infer_type')
     def blockmatrix_type(self, bmir):
         jir = self._to_java_ir(bmir)
         return tblockmatrix._from_java(jir.typ())
@@ -131,10 +646,30 @@ class SparkBackend(Backend):
         return pyspark.sql.DataFrame(t._jt.toDF(Env.hc()._jsql_context), Env.sql_context())
 
     def to_pandas(self, t, flatten):
-        return self.to_spark(t, flatten).toPandas()
+        t = t.expand_types()
+        if flatten:
+            t = t.flatten()
+        if not all(typ in _numpy_column_types or typ == tstr for typ in t.row.dtype.types):
+            return self.to_spark(t, False).toPandas()
+
+        typ, b = self._execute_binary(t._collect_columns_ir())
+        data = {}
+        i = 1
+        for f, t in typ.items():
+            values, missing, i = _decode_numpy_column(t.element_type, b, i + 1)
+            data[f] = _pandas_column(t.element_type, values, missing)
+        return pandas.DataFrame(data, columns=list(typ))
 
     def from_pandas(self, df, key):
-        return Table.from_spark(Env.sql_context().createDataFrame(df), key)
+        row_type = _pandas_row_type(df)
+        if row_type is None:
+            return Table.from_spark(Env.sql_context().createDataFrame(df), key)
+        b = bytearray(b'\x01')
+        for f, typ in row_type.items():
+            b.append(1)
+            _encode_numpy_column(typ, df[f].values, b)
+        return Table._from_java(Env.hail().table.Table.fromBinaryColumns(
+            Env.hc()._jhc, bytes(b), row_type._parsable_string(), wrap_to_list(key)))
 
     def add_reference(self, config):
         Env.hail().variant.ReferenceGenome.fromJSON(json.dumps(config))
@@ -167,33 +702,155 @@ class SparkBackend(Backend):
 
 
 class LocalBackend(Backend):
+    literal_files = True
+
     def __init__(self):
-        pass
+        super().__init__()
+        self.parse_cache = ParseCache()
 
+    @profiled('to_java_ir')
     def _to_java_ir(self, ir):
         if not hasattr(ir, '_jir'):
-            r = Renderer(stop_at_jir=True)
+            r = CSERenderer(stop_at_jir=True, literal_files=self.literal_files)
             code = r(ir)
-            # FIXME parse should be static
-            ir._jir = ir.parse(code, ir_map=r.jirs)
+            ir._jir = self.parse_cache.parse(ir, code, r.jirs)
         return ir._jir
 
+    def _optimized_ir(self, ir):
+        jir = Env.hail().expr.ir.Optimize.apply(self._to_java_ir(ir), False, False)
+        return Env.hail().expr.ir.Pretty.apply(jir, True)
+
+    @profiled_action
     def execute(self, ir):
+        typ, b = self._execute_binary(ir)
+        return typ._from_binary(b)
+
+    def _run_binary(self, ir):
+        self._clear_read_types(ir)
+        return ir.typ, Env.hail().expr.ir.LocalBackend.executeBinary(self._to_java_ir(ir))
+
+    @profiled_action
+    def _execute_json(self, ir):
+        self._clear_read_types(ir)
         return ir.typ._from_json(
             Env.hail().expr.ir.LocalBackend.executeJSON(
                 self._to_java_ir(ir)))
 
+
+# big-endian NumPy types of the binary encoding of fixed-width values
+_numpy_column_types = {tbool: '?', tint32: '>i4', tint64: '>i8', tfloat32: '>f4', tfloat64: '>f8'}
+_pandas_column_types = {np.dtype('bool'): tbool, np.dtype('int32'): tint32, np.dtype('int64'): tint64,
+                        np.dtype('float32'): tfloat32, np.dtype('float64'): tfloat64}
+
+
+def _decode_numpy_column(element_type, b, i):
+    """Decode a present array of `element_type` at offset `i` of `b` as a NumPy array.
+
+    Returns the values, a Boolean array marking the missing values or ``None``
+    if no value is missing, and the offset past the array. Booleans and
+    numbers are read from the buffer without making Python objects; other
+    values are decoded into an array of dtype object, with missing values
+    ``None``.
+    """
+    dt = _numpy_column_types.get(element_type)
+    if dt is None:
+        elements, i = tarray(element_type)._make_binary_decoder()(b, i)
+        values = np.empty(len(elements), dtype=object)
+        for j, x in enumerate(elements):
+            values[j] = x
+        return values, None, i
+    n, = struct.unpack_from('>i', b, i)
+    missing = None
+    if b[i + 4]:
+        missing = np.frombuffer(b, '?', n, i + 5) == 0
+        i += n
+        if not missing.any():
+            missing = None
+    i += 5
+    dt = np.dtype(dt)
+    values = np.frombuffer(b, dt, n, i).astype(dt.newbyteorder('='))
+    return values, missing, i + n * dt.itemsize
+
+
+def _pandas_column(element_type, values, missing):
+    """Column of a :class:`pandas.DataFrame` holding `values`.
+
+    As in :meth:`pyspark.sql.DataFrame.toPandas`, missing floats are NaN,
+    integer columns with missing values become floats, and other columns
+    with missing values have dtype object.
+    """
+    if missing is None:
+        return values
+    if element_type == tbool:
+        values = values.astype(object)
+        values[missing] = None
+    else:
+        if element_type in (tint32, tint64):
+            values = values.astype(np.float64)
+        values[missing] = np.nan
+    return values
+
+
+def _pandas_row_type(df):
+    """Row type of `df` if all of its columns have a binary encoding as a block, otherwise ``None``."""
+    if not df.columns.is_unique:
+        return None
+    fields = []
+    for f, dt in df.dtypes.items():
+        if not isinstance(f, str):
+            return None
+        typ = _pandas_column_types.get(dt)
+        if typ is None:
+            if dt != np.dtype(object) or not all(x is None or isinstance(x, str) for x in df[f].values):
+                return None
+            typ = tstr
+        fields.append((f, typ))
+    return tstruct(**dict(fields))
+
+
+def _encode_numpy_column(element_type, values, b):
+    """Append the binary encoding of a present array of `element_type` holding `values` to `b`."""
+    b += struct.pack('>i', len(values))
+    if element_type == tstr:
+        for x in values:
+            if x is None:
+                b.append(0)
+            else:
+                x = x.encode('utf-8')
+                b += struct.pack('>bi', 1, len(x))
+                b += x
+    else:
+        b.append(0)
+        b += values.astype(_numpy_column_types[element_type]).tobytes()
+
+
 class ServiceBackend(Backend):
     def __init__(self, url):
+        super().__init__()
         self.url = url
 
     def _render(self, ir):
-        r = Renderer()
+        r = CSERenderer()
         code = r(ir)
         assert len(r.jirs) == 0
         return code
 
+    @profiled_action
     def execute(self, ir):
+        typ, b = self._execute_binary(ir)
+        return typ._from_binary(b)
+
+    def _run_binary(self, ir):
+        self._clear_read_types(ir)
+        code = self._render(ir)
+        resp = requests.post(f'{self.url}/execute_binary', json=code)
+        resp.raise_for_status()
+
+        return dtype(resp.headers['Hail-Type']), resp.content
+
+    @profiled_action
+    def _execute_json(self, ir):
+        self._clear_read_types(ir)
         code = self._render(ir)
         resp = requests.post(f'{self.url}/execute', json=code)
         resp.raise_for_status()
@@ -205,6 +862,23 @@ class ServiceBackend(Backend):
         
         return typ._from_json(result)
 
+    @profiled_action
+    def execute_batch(self, irs):
+        if len(irs) == 0:
+            return []
+        for ir in irs:
+            self._clear_read_types(ir)
+        codes = [self._render(ir) for ir in irs]
+        resp = requests.post(f'{self.url}/execute_batch', json=codes)
+        resp.raise_for_status()
+
+        resp_json = resp.json()
+
+        typ = dtype(resp_json['type'])
+        result = resp_json['value']
+
+        return list(typ._from_json(result))
+
     def _request_type(self, ir, kind):
         code = self._render(ir)
         resp = requests.post(f'{self.url}/type/{kind}', json=code)
@@ -212,18 +886,22 @@ class ServiceBackend(Backend):
         
         return resp.json()
 
+    @profiled('infer_type')
     def value_type(self, ir):
         resp = self._request_type(ir, 'value')
         return dtype(resp)
 
+    @profiled('infer_type')
     def table_type(self, tir):
         resp = self._request_type(tir, 'table')
         return ttable._from_json(resp)
 
+    @profiled('infer_type')
     def matrix_type(self, mir):
         resp = self._request_type(mir, 'matrix')
         return tmatrix._from_json(resp)
 
+    @profiled('infer_type')
     def blockmatrix_type(self, bmir):
         resp = self._request_type(bmir, 'blockmatrix')
         return tblockmatrix._from_json(resp)
@@ -5,9 +5,10 @@ from pyspark.sql import SQLContext
 import hail
 from hail.genetics.reference_genome import ReferenceGenome
 from hail.typecheck import nullable, typecheck, typecheck_method, enumeration
-from hail.utils import wrap_to_list, get_env_or_default
+from hail.utils import wrap_to_list, get_env_or_default, storage_level
 from hail.utils.java import Env, joption, FatalError, connect_logger, install_exception_handler, uninstall_exception_handler
-from hail.backend import Backend, ServiceBackend, SparkBackend
+from hail.backend import Backend, ServiceBackend, SparkBackend, ResultCache, AutoPersist
+from hail.profiling import _set_profile_frontend
 
 import sys
 import os
@@ -153,6 +154,7 @@ class HailContext(object):
         return self._default_ref
 
     def stop(self):
+        self._backend.stop()
         Env.hail().HailContext.clear()
         self.sc.stop()
         self.sc = None
@@ -324,6 +326,127 @@ def set_global_seed(seed):
     Env.set_seed(seed)
 
 
+@typecheck(max_bytes=int)
+def enable_result_cache(max_bytes=1 << 28):
+    """Cache the results of actions, so that repeating an action returns at once.
+
+    Examples
+    --------
+
+    >>> hl.enable_result_cache()  # doctest: +SKIP
+    >>> mt.count()  # doctest: +SKIP
+    >>> mt.count()  # doctest: +SKIP
+    >>> hl.result_cache()  # doctest: +SKIP
+    ResultCache(size=1, bytes=18, max_bytes=268435456, hits=1, misses=1)
+
+    Notes
+    -----
+    Results of actions such as :meth:`.Table.count`, :meth:`.Table.aggregate`,
+    :meth:`.Table.collect` and :meth:`.Table.show` are kept for the session,
+    keyed by a hash of the pipeline and by the modification times and sizes
+    of the files it reads. An action is run again if its pipeline changes or
+    one of its inputs is rewritten. Actions that write files are never
+    cached, nor are actions reading files matched by glob patterns.
+
+    The least recently used results are evicted when the cache holds more
+    than `max_bytes` bytes of results. Use :func:`.result_cache` to inspect
+    and clear the cache.
+
+    Parameters
+    ----------
+    max_bytes : :obj:`int`
+        Maximum total size of the cached results, in bytes.
+    """
+    Env.backend().result_cache = ResultCache(max_bytes)
+
+
+def disable_result_cache():
+    """Stop caching the results of actions, and drop the cached results.
+
+    See :func:`.enable_result_cache`.
+    """
+    Env.backend().result_cache = None
+
+
+def result_cache():
+    """The cache of action results, or ``None`` if it is not enabled.
+
+    See :func:`.enable_result_cache`.
+
+    Returns
+    -------
+    :class:`.ResultCache` or :obj:`None`
+    """
+    return Env.backend().result_cache
+
+
+@typecheck(storage_level=storage_level, checkpoint=bool, max_persisted=int)
+def enable_auto_persist(storage_level='MEMORY_AND_DISK', checkpoint=False, max_persisted=16):
+    """Persist the tables and matrix tables that actions compute more than once.
+
+    Examples
+    --------
+
+    >>> hl.enable_auto_persist()  # doctest: +SKIP
+    >>> t = table1.group_by(table1.HT).aggregate(n=hl.agg.count())  # doctest: +SKIP
+    >>> t.count()  # doctest: +SKIP
+    >>> t.aggregate(hl.agg.sum(t.n))  # doctest: +SKIP
+    >>> print(hl.auto_persist().explain())  # doctest: +SKIP
+    auto persist (persist MEMORY_AND_DISK): 1 of at most 16 intermediates kept, 1 persisted, 0 evicted
+      Table       TableKeyByAndAggregate           2 executions  MEMORY_AND_DISK
+
+    Notes
+    -----
+    Hail counts the actions that run each step of the pipelines built in the
+    session. When an action runs a step for the second time, the step is
+    persisted as with :meth:`.Table.persist`, so that this action and later
+    actions reuse its result instead of computing it again. Only the last
+    step of the reused part of the pipeline is persisted. Reads are never
+    persisted.
+
+    With `checkpoint`, steps are written to temporary files and read back,
+    which costs a write but keeps their results across executor failures.
+    When more than `max_persisted` steps are kept, the least recently used
+    is unpersisted.
+
+    Use :func:`.auto_persist` to see what was persisted.
+
+    Parameters
+    ----------
+    storage_level : :obj:`str`
+        Storage level of persisted steps, see :meth:`.Table.persist`.
+    checkpoint : :obj:`bool`
+        Write steps to temporary files instead of persisting them.
+    max_persisted : :obj:`int`
+        Maximum number of steps to keep persisted.
+    """
+    disable_auto_persist()
+    Env.backend().auto_persist = AutoPersist(storage_level, checkpoint, max_persisted)
+
+
+def disable_auto_persist():
+    """Stop persisting reused steps of pipelines, and unpersist the steps persisted.
+
+    See :func:`.enable_auto_persist`.
+    """
+    backend = Env.backend()
+    if backend.auto_persist is not None:
+        backend.auto_persist.clear()
+        backend.auto_persist = None
+
+
+def auto_persist():
+    """The planner persisting reused steps of pipelines, or ``None`` if it is not enabled.
+
+    See :func:`.enable_auto_persist`.
+
+    Returns
+    -------
+    :class:`.AutoPersist` or :obj:`None`
+    """
+    return Env.backend().auto_persist
+
+
 def read_version_info() -> str:
     # https://stackoverflow.com/questions/6028000/how-to-read-a-static-file-from-inside-a-python-package
     return pkg_resources.resource_string(__name__, 'hail_version').decode().strip()
@@ -389,9 +512,13 @@ def upload_log():
 
 def _set_flags(**flags):
     available = set(Env.hc()._jhc.flags().available())
+    available.add('profile_frontend')
     invalid = []
     for flag, value in flags.items():
-        if flag in available:
+        if flag == 'profile_frontend':
+            # profiling of the Python front end, see `hl.profile`
+            _set_profile_frontend(value is not None and value is not False and value != '0')
+        elif flag in available:
             Env.hc()._jhc.flags().set(flag, value)
         else:
             invalid.append(flag)
@@ -2,7 +2,7 @@ from .types import *
 from .table_type import *
 from .matrix_type import *
 from .blockmatrix_type import *
-from .expressions import eval, eval_typed
+from .expressions import eval, eval_typed, eval_many
 from .functions import *
 from .functions import _sort_by, _compare
 __all__ = ['HailType',
@@ -31,6 +31,7 @@ __all__ = ['HailType',
            'hts_entry_schema',
            'eval',
            'eval_typed',
+           'eval_many',
            'literal',
            'chi_squared_test',
            'cond',
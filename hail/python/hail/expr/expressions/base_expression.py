@@ -1,7 +1,10 @@
 from typing import *
 
+import numpy as np
+
 from hail.expr import expressions
 from hail.expr.types import *
+from hail.expr.types import _numpy_element_type
 from hail.ir import *
 from hail.typecheck import linked_list
 from hail.utils.java import *
@@ -21,10 +24,75 @@ class ExpressionWarning(Warning):
         super(ExpressionWarning, self).__init__(msg)
 
 
+# types of Python values of primitive types other than int
+_primitive_python_types = {bool: tbool, float: tfloat64, str: tstr}
+
+
+def _primitive_element_type(xs):
+    """Type of the elements of the non-empty collection `xs` if they are all
+    Python values of the same primitive type, otherwise None."""
+    python_types = set(map(type, xs))
+    if len(python_types) != 1:
+        return None
+    python_type = python_types.pop()
+    if python_type is int:
+        lo, hi = min(xs), max(xs)
+        if tint32.min_value <= lo and hi <= tint32.max_value:
+            return tint32
+        elif tint64.min_value <= lo and hi <= tint64.max_value:
+            return tint64
+        return None
+    return _primitive_python_types.get(python_type)
+
+
+def _primitive_container_type(x):
+    """Type of the non-empty list, set or dict `x` if its elements, or its keys
+    and its values, are Python values of one primitive type, otherwise None.
+
+    This scans `x` a few times in C, and is much faster than imputing and
+    checking the type of each element.
+    """
+    if type(x) is list:
+        element_type = _primitive_element_type(x) if x else None
+        return None if element_type is None else tarray(element_type)
+    elif type(x) is set:
+        element_type = _primitive_element_type(x) if x else None
+        return None if element_type is None else tset(element_type)
+    elif type(x) is dict and x:
+        key_type = _primitive_element_type(x.keys())
+        value_type = _primitive_element_type(x.values())
+        if key_type is None or value_type is None:
+            return None
+        return tdict(key_type, value_type)
+    return None
+
+
+def _holds_primitive_values(t, value_type):
+    """Whether every Python value of primitive type `value_type` is a value of type `t`."""
+    return (t == value_type
+            or (is_numeric(t) and is_numeric(value_type)
+                and (t in (tfloat32, tfloat64) or (t == tint64 and value_type == tint32))))
+
+
+def _holds_primitive_container(t, value_type):
+    """Whether every value of `value_type`, a type returned by
+    :func:`_primitive_container_type`, is a value of type `t`."""
+    if isinstance(value_type, tdict):
+        return (isinstance(t, tdict)
+                and _holds_primitive_values(t.key_type, value_type.key_type)
+                and _holds_primitive_values(t.value_type, value_type.value_type))
+    return (type(t) is type(value_type)
+            and _holds_primitive_values(t.element_type, value_type.element_type))
+
+
 def impute_type(x):
     from hail.genetics import Locus, Call
     from hail.utils import Interval, Struct
-    
+
+    t = _primitive_container_type(x)
+    if t is not None:
+        return t
+
     if isinstance(x, Expression):
         return x.dtype
     elif isinstance(x, bool):
@@ -82,6 +150,15 @@ def impute_type(x):
             raise ExpressionException("Hail does not support heterogeneous dicts: "
                                       "found dict with values of types {} ".format(list(vts)))
         return tdict(unified_key_type, unified_value_type)
+    elif isinstance(x, np.ndarray):
+        element_type = _numpy_element_type(x.dtype)
+        if element_type is None:
+            if x.dtype.kind != 'O':
+                raise ExpressionException("Hail cannot impute the type of a NumPy array of dtype '{}'".format(x.dtype))
+            return impute_type(x.tolist())
+        for _ in range(x.ndim):
+            element_type = tarray(element_type)
+        return element_type
     elif x is None:
         raise ExpressionException("Hail cannot impute the type of 'None'")
     elif isinstance(x, (hl.expr.builders.CaseBuilder, hl.expr.builders.SwitchBuilder)):
@@ -121,8 +198,8 @@ def _to_expr(e, dtype):
                 assert dtype == tint32
                 return hl.int32(e)
         return e
-    elif not is_compound(dtype):
-        # these are not container types and cannot contain expressions if we got here
+    elif not is_compound(dtype) or isinstance(e, np.ndarray):
+        # these are not container types, or NumPy arrays, and cannot contain expressions if we got here
         return e
     elif isinstance(dtype, tstruct):
         new_fields = []
@@ -237,10 +314,7 @@ def unify_all(*exprs) -> Tuple[Indices, LinkedList]:
             fields=''.join("\n        {}: {}".format(src, fds) for src, fds in sources.items())
         )) from None
     first, rest = exprs[0], exprs[1:]
-    aggregations = first._aggregations
-    for e in rest:
-        aggregations = aggregations.push(*e._aggregations)
-    return new_indices, aggregations
+    return new_indices, first._aggregations.concat(*[e._aggregations for e in rest])
 
 
 def unify_types_limited(*ts):
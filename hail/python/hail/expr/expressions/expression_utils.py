@@ -129,8 +129,8 @@ def analyze(caller: str,
         raise errors[0]
 
 
-@typecheck(expression=expr_any)
-def eval(expression):
+@typecheck(expression=expr_any, _async=bool)
+def eval(expression, _async=False):
     """Evaluate a Hail expression, returning the result.
 
     This method is extremely useful for learning about Hail expressions and
@@ -155,6 +155,13 @@ def eval(expression):
     -------
     Any
     """
+    if _async:
+        from hail.utils.java import Env
+
+        analyze('eval', expression, Indices(expression._indices.source))
+        if expression._indices.source is not None:
+            expression = expression.collect(_localize=False)[0]
+        return Env.backend().execute_async(expression._ir)
     return eval_typed(expression)[0]
 
 
@@ -201,6 +208,73 @@ def eval_typed(expression):
         return expression.collect()[0], expression.dtype
 
 
+@typecheck(exprs=expr_any)
+def eval_many(*exprs):
+    """Evaluate several Hail expressions at once, returning a list of the results.
+
+    The expressions are executed together in a single backend round trip,
+    and aggregations of the same table or matrix table share a single pass
+    over the data. Use this instead of several calls to :func:`.eval` to pay
+    for compilation and execution once.
+
+    Examples
+    --------
+    >>> hl.eval_many(hl.int32(1) + 2, hl.str('Hail'))
+    [3, 'Hail']
+
+    Compute several aggregations in one pass:
+
+    >>> hl.eval_many(table1.aggregate(hl.agg.fraction(table1.SEX == 'M'), _localize=False),
+    ...              table1.aggregate(hl.agg.mean(table1.X), _localize=False))
+    [0.5, 6.5]
+
+    Notes
+    -----
+    Each expression is subject to the same constraints as in :func:`.eval`.
+
+    Parameters
+    ----------
+    exprs : varargs of :class:`.Expression`
+        Expressions to evaluate.
+
+    Returns
+    -------
+    :obj:`list`
+    """
+    from hail.utils.java import Env
+    from hail.ir import MakeTuple, TableAggregate, MatrixAggregate
+
+    irs = []
+    for expr in exprs:
+        analyze('eval_many', expr, Indices(expr._indices.source))
+        if expr._indices.source is None:
+            irs.append(expr._ir)
+        else:
+            irs.append(expr.collect(_localize=False)[0]._ir)
+
+    # aggregations of the same relational IR are combined into one
+    batch = []
+    slots = []
+    aggregates = {}
+    for ir in irs:
+        if isinstance(ir, (TableAggregate, MatrixAggregate)):
+            key = (type(ir), id(ir.child))
+            if key not in aggregates:
+                aggregates[key] = (len(batch), ir, [])
+                batch.append(None)
+            i, _, queries = aggregates[key]
+            slots.append((i, len(queries)))
+            queries.append(ir.query)
+        else:
+            slots.append((len(batch), None))
+            batch.append(ir)
+    for i, ir, queries in aggregates.values():
+        batch[i] = type(ir)(ir.child, MakeTuple(queries))
+
+    results = Env.backend().execute_batch(batch)
+    return [results[i] if j is None else results[i][j] for i, j in slots]
+
+
 def _get_refs(expr: Expression, builder: Dict[str, Indices]) -> None:
     from hail.ir import GetField, TopLevelReference
 
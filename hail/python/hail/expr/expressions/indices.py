@@ -22,19 +22,28 @@ class Indices(object):
 
     @staticmethod
     def unify(*indices):
-        axes = set()
-        src = None
+        # returns one of `indices` if it has the source and axes of the result
+        result = None
         for ind in indices:
-            if src is None:
-                src = ind.source
-            else:
-                if ind.source is not None and ind.source is not src:
-                    from . import ExpressionException
-                    raise ExpressionException()
-
-            axes = axes.union(ind.axes)
+            if result is None:
+                result = ind
+                continue
+            if ind is result:
+                continue
+            if ind.source is not None and result.source is not None and ind.source is not result.source:
+                from . import ExpressionException
+                raise ExpressionException()
+            src = result.source if result.source is not None else ind.source
+            if src is result.source and ind.axes <= result.axes:
+                continue
+            if src is ind.source and result.axes <= ind.axes:
+                result = ind
+                continue
+            result = Indices(src, result.axes | ind.axes)
 
-        return Indices(src, axes)
+        if result is None:
+            return Indices()
+        return result
 
     @property
     def protected_key(self) -> List[str]:
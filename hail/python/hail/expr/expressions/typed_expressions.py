@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import *
 
 import hail as hl
@@ -6,6 +7,7 @@ from hail.expr.expressions import Expression, to_expr, ExpressionException, \
 from hail.expr.expressions.expression_typecheck import *
 from hail.expr.types import *
 from hail.ir import *
+from hail.profiling import profiled
 from hail.typecheck import *
 from hail.utils.java import *
 from hail.utils.linkedlist import LinkedList
@@ -1244,28 +1246,37 @@ class StructExpression(Mapping[str, Expression], Expression):
         ir = MakeStruct([(n, expr._ir) for (n, expr) in fields.items()])
         indices, aggregations = unify_all(*fields.values())
         s = StructExpression.__new__(cls)
-        s._fields = {}
-        for k, v in fields.items():
-            s._set_field(k, v)
         super(StructExpression, s).__init__(ir, t, indices, aggregations)
+        s._fields = _StructFields(s, dict(fields))
+        s._set_shadowing_fields()
         return s
 
     @typecheck_method(ir=IR, type=HailType, indices=Indices, aggregations=LinkedList)
     def __init__(self, ir, type, indices=Indices(), aggregations=LinkedList(Aggregation)):
         super(StructExpression, self).__init__(ir, type, indices, aggregations)
-        self._fields: Dict[str, Expression] = {}
-
-        for i, (f, t) in enumerate(self.dtype.items()):
-            if isinstance(self._ir, MakeStruct):
-                expr = construct_expr(self._ir.fields[i][1], t, self._indices,
-                                          self._aggregations)
-            elif isinstance(self._ir, SelectFields):
-                expr = construct_expr(GetField(self._ir.old, f), t, self._indices,
-                                      self._aggregations)
-            else:
-                expr = construct_expr(GetField(self._ir, f), t, self._indices,
-                                          self._aggregations)
-            self._set_field(f, expr)
+        self._fields: Mapping[str, Expression] = _StructFields(self)
+        self._set_shadowing_fields()
+
+    def _set_shadowing_fields(self):
+        # fields are found by __getattr__, unless they share their name with
+        # an attribute of the class
+        attributes = _class_attributes(type(self))
+        fields = self.dtype._field_types
+        if len(attributes) < len(fields):
+            shadowing = [f for f in attributes if f in fields]
+        else:
+            shadowing = [f for f in fields if f in attributes]
+        for f in shadowing:
+            self._set_field(f, self._fields[f])
+
+    def _field_expr(self, f, field_irs):
+        t = self.dtype[f]
+        if isinstance(self._ir, MakeStruct):
+            return construct_expr(field_irs()[f], t, self._indices, self._aggregations)
+        elif isinstance(self._ir, SelectFields):
+            return construct_expr(GetField(self._ir.old, f), t, self._indices, self._aggregations)
+        else:
+            return construct_expr(GetField(self._ir, f), t, self._indices, self._aggregations)
 
     def _set_field(self, key, value):
         self._fields[key] = value
@@ -1281,8 +1292,10 @@ class StructExpression(Mapping[str, Expression], Expression):
     def __getattr__(self, item):
         if item in self.__dict__:
             return self.__dict__[item]
-        else:
-            raise AttributeError(get_nice_attr_error(self, item))
+        fields = self.__dict__.get('_fields')
+        if fields is not None and item in fields:
+            return fields[item]
+        raise AttributeError(get_nice_attr_error(self, item))
 
     def __len__(self):
         return len(self._fields)
@@ -1334,7 +1347,7 @@ class StructExpression(Mapping[str, Expression], Expression):
         def get_type(field):
             e = insertions_dict.get(field)
             if e is None:
-                e = self._fields[field]
+                return self.dtype[field]
             return e.dtype
 
         new_type = hl.tstruct(**{f: get_type(f) for f in field_order})
@@ -1466,6 +1479,51 @@ class StructExpression(Mapping[str, Expression], Expression):
         return self.select(*to_keep)
 
 
+class _StructFields(Mapping):
+    """Field expressions of a :class:`.StructExpression`.
+
+    The expression of a field is constructed when it is first accessed, so
+    constructing a struct expression takes time independent of the number
+    of its fields.
+    """
+
+    def __init__(self, struct, exprs=None):
+        self._struct = struct
+        self._exprs = {} if exprs is None else exprs
+        self._field_irs = None
+
+    def _get_field_irs(self):
+        if self._field_irs is None:
+            self._field_irs = dict(self._struct._ir.fields)
+        return self._field_irs
+
+    def __getitem__(self, key):
+        expr = self._exprs.get(key)
+        if expr is None:
+            if key not in self:
+                raise KeyError(key)
+            expr = self._struct._field_expr(key, self._get_field_irs)
+            self._exprs[key] = expr
+        return expr
+
+    def __setitem__(self, key, value):
+        self._exprs[key] = value
+
+    def __contains__(self, key):
+        return key in self._struct.dtype._field_types
+
+    def __iter__(self):
+        return iter(self._struct.dtype._field_types)
+
+    def __len__(self):
+        return len(self._struct.dtype._field_types)
+
+
+@lru_cache()
+def _class_attributes(cls):
+    return frozenset(dir(cls))
+
+
 class TupleExpression(Expression, Sequence):
     """Expression of type :class:`.ttuple`.
 
@@ -3003,19 +3061,22 @@ def apply_expr(f, result_type, *args):
     ir = f(*[arg._ir for arg in args])
     return construct_expr(ir, result_type, indices, aggregations)
 
+@profiled('construct_expr')
 @typecheck(ir=IR, type=nullable(HailType), indices=Indices, aggregations=LinkedList)
 def construct_expr(ir: IR,
                    type: HailType,
                    indices: Indices = Indices(),
                    aggregations: LinkedList = LinkedList(Aggregation)):
+    ir = intern_ir(ir)
     if type is None:
         return Expression(ir, None, indices, aggregations)
     if isinstance(type, tarray) and is_numeric(type.element_type):
         return ArrayNumericExpression(ir, type, indices, aggregations)
-    elif type in scalars:
-        return scalars[type](ir, type, indices, aggregations)
+    # look up the class first: hashing a type hashes its string representation
     elif type.__class__ in typ_to_expr:
         return typ_to_expr[type.__class__](ir, type, indices, aggregations)
+    elif type in scalars:
+        return scalars[type](ir, type, indices, aggregations)
     else:
         raise NotImplementedError(type)
 
@@ -1,10 +1,14 @@
 import builtins
 from typing import *
 
+import numpy as np
+
 import hail as hl
 from hail.expr.expressions import *
+from hail.expr.expressions.base_expression import _primitive_container_type, _holds_primitive_container
 from hail.expr.expressions.expression_typecheck import *
 from hail.expr.types import *
+from hail.expr.types import _numpy_dtypes
 from hail.genetics.reference_genome import reference_genome_type, ReferenceGenome
 from hail.ir import *
 from hail.typecheck import *
@@ -87,6 +91,11 @@ def literal(x: Any, dtype: Optional[Union[HailType, str]] = None):
     function provides an alternative to adding an object as a global annotation on a
     :class:`.Table` or :class:`.MatrixTable`.
 
+    A :class:`numpy.ndarray` is captured as an array, nested once per
+    dimension. A one-dimensional array of booleans or numbers is captured
+    without visiting its elements in Python, so large vectors are cheap to
+    broadcast.
+
     Parameters
     ----------
     x
@@ -96,6 +105,13 @@ def literal(x: Any, dtype: Optional[Union[HailType, str]] = None):
     -------
     :class:`.Expression`
     """
+    if isinstance(x, np.ndarray):
+        if dtype is None:
+            dtype = impute_type(x)
+        x = _numpy_literal_value(x, dtype)
+        if isinstance(x, np.ndarray):
+            return construct_expr(Literal(dtype, x), dtype)
+
     wrapper = {'has_expr': False}
     def typecheck_expr(t, x):
         if isinstance(x, Expression):
@@ -112,14 +128,18 @@ def literal(x: Any, dtype: Optional[Union[HailType, str]] = None):
         else:
             t._typecheck_one_level(x)
             return True
+    # a container of Python values of one primitive type is typed in one pass
+    primitive_type = _primitive_container_type(x)
     if dtype is None:
-        dtype = impute_type(x)
+        dtype = impute_type(x) if primitive_type is None else primitive_type
 
-    try:
-        dtype._traverse(x, typecheck_expr)
-    except TypeError as e:
-        raise TypeError("'literal': object did not match the passed type '{}'"
-                        .format(dtype)) from e
+    if primitive_type is None or not _holds_primitive_container(dtype, primitive_type):
+        x = _nested_numpy_to_lists(x)
+        try:
+            dtype._traverse(x, typecheck_expr)
+        except TypeError as e:
+            raise TypeError("'literal': object did not match the passed type '{}'"
+                            .format(dtype)) from e
 
     if wrapper['has_expr']:
         return literal(hl.eval(to_expr(x, dtype)), dtype)
@@ -151,6 +171,49 @@ def literal(x: Any, dtype: Optional[Union[HailType, str]] = None):
     else:
         return construct_expr(Literal(dtype, x), dtype)
 
+
+def _nested_numpy_to_lists(x):
+    """`x` with the NumPy arrays in its containers converted to nested lists."""
+    if isinstance(x, np.ndarray):
+        return x.tolist()
+    elif isinstance(x, builtins.list):
+        return [_nested_numpy_to_lists(v) for v in x]
+    elif isinstance(x, builtins.tuple):
+        return builtins.tuple(_nested_numpy_to_lists(v) for v in x)
+    elif isinstance(x, builtins.dict):
+        # NumPy arrays are not hashable, so keys and set elements hold none
+        return {k: _nested_numpy_to_lists(v) for k, v in x.items()}
+    elif isinstance(x, hl.utils.Struct):
+        return hl.utils.Struct(**{k: _nested_numpy_to_lists(v) for k, v in x.items()})
+    return x
+
+
+def _numpy_literal_value(x, dtype):
+    """Value of the NumPy array `x` as a literal of type `dtype`.
+
+    A one-dimensional array of booleans or numbers of an array type of
+    primitive elements is copied into a read-only array of the element type;
+    any other array is converted to nested lists.
+    """
+    if (x.ndim == 1
+            and x.dtype.kind in 'biuf'
+            and isinstance(dtype, tarray)
+            and dtype.element_type in _numpy_dtypes):
+        target = _numpy_dtypes[dtype.element_type]
+        if not np.can_cast(x.dtype, target, 'same_kind'):
+            raise TypeError("'literal': object did not match the passed type '{}': "
+                            "cannot convert NumPy array of dtype '{}'".format(dtype, x.dtype))
+        if target.kind == 'i' and x.dtype.kind in 'iu' and x.size > 0:
+            info = np.iinfo(target)
+            if x.min() < info.min or x.max() > info.max:
+                raise TypeError("'literal': object did not match the passed type '{}': "
+                                "NumPy array has values out of range".format(dtype))
+        value = np.array(x, dtype=target)
+        value.flags.writeable = False
+        return value
+    return x.tolist()
+
+
 @typecheck(condition=expr_bool, consequent=expr_any, alternate=expr_any, missing_false=bool)
 def cond(condition,
          consequent,
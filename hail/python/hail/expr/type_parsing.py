@@ -1,3 +1,5 @@
+import re
+
 from parsimonious import Grammar, NodeVisitor
 import hail as hl
 from hail.utils.java import unescape_parsable
@@ -130,3 +132,149 @@ class TypeConstructor(NodeVisitor):
 
 
 type_node_visitor = TypeConstructor()
+
+
+class _ParseFailure(Exception):
+    pass
+
+
+_whitespace = re.compile(r'\s*')
+_simple_identifier = re.compile(r'\w+')
+_escaped_identifier = re.compile(r'`([^`\\]|\\.)*`')
+
+_primitive_types = {
+    'void': 'tvoid', 'tvoid': 'tvoid',
+    'int64': 'tint64', 'tint64': 'tint64',
+    'int32': 'tint32', 'tint32': 'tint32', 'int': 'tint32', 'tint': 'tint32',
+    'float32': 'tfloat32', 'tfloat32': 'tfloat32',
+    'float64': 'tfloat64', 'tfloat64': 'tfloat64', 'tfloat': 'tfloat64', 'float': 'tfloat64',
+    'bool': 'tbool', 'tbool': 'tbool',
+    'call': 'tcall', 'tcall': 'tcall',
+    'str': 'tstr', 'tstr': 'tstr',
+}
+
+_container_types = {
+    'array': 'tarray', 'tarray': 'tarray',
+    'ndarray': 'tndarray', 'tndarray': 'tndarray',
+    'set': 'tset', 'tset': 'tset',
+    'interval': 'tinterval', 'tinterval': 'tinterval',
+}
+
+
+class TypeParser(object):
+    """Recursive-descent parser for the language of :data:`type_grammar`.
+
+    Parsing is linear in the length of the string. On invalid input, the
+    string is parsed with :data:`type_grammar` instead, to raise its error.
+    """
+
+    __slots__ = ['s', 'i']
+
+    def __init__(self, s):
+        self.s = s
+        self.i = 0
+
+    def parse(self):
+        try:
+            t = self.type()
+            if self.i == len(self.s):
+                return t
+        except _ParseFailure:
+            pass
+        return type_node_visitor.visit(type_grammar.parse(self.s))
+
+    def skip(self):
+        self.i = _whitespace.match(self.s, self.i).end()
+
+    def expect(self, c):
+        self.skip()
+        if not self.s.startswith(c, self.i):
+            raise _ParseFailure()
+        self.i += len(c)
+
+    def match(self, regex):
+        m = regex.match(self.s, self.i)
+        if m is None:
+            raise _ParseFailure()
+        self.i = m.end()
+        return m.group()
+
+    def peek(self, c):
+        self.skip()
+        return self.s.startswith(c, self.i)
+
+    def type(self):
+        self.skip()
+        if self.s.startswith('?', self.i):
+            self.i += 1
+            name = self.match(_simple_identifier)
+            cond = None
+            if self.s.startswith(':', self.i):
+                self.i += 1
+                cond = self.match(_simple_identifier)
+            t = hl.tvariable(name, cond)
+        else:
+            t = self.named_type(self.match(_simple_identifier))
+        self.skip()
+        return t
+
+    def named_type(self, name):
+        primitive = _primitive_types.get(name)
+        if primitive is not None:
+            return getattr(hl, primitive)
+        container = _container_types.get(name)
+        if container is not None:
+            self.expect('<')
+            t = self.type()
+            self.expect('>')
+            return getattr(hl, container)(t)
+        if name in ('dict', 'tdict'):
+            self.expect('<')
+            kt = self.type()
+            self.expect(',')
+            vt = self.type()
+            self.expect('>')
+            return hl.tdict(kt, vt)
+        if name in ('struct', 'tstruct'):
+            self.expect('{')
+            fields = {}
+            if not self.peek('}'):
+                while True:
+                    field = self.identifier()
+                    self.expect(':')
+                    fields[field] = self.type()
+                    if not self.peek(','):
+                        break
+                    self.i += 1
+            self.expect('}')
+            return hl.tstruct(**fields)
+        if name in ('tuple', 'ttuple'):
+            self.expect('(')
+            types = []
+            if not self.peek(')'):
+                types.append(self.type())
+                while self.peek(','):
+                    self.i += 1
+                    types.append(self.type())
+            self.expect(')')
+            return hl.ttuple(*types)
+        if name in ('locus', 'tlocus'):
+            self.expect('<')
+            rg = self.identifier()
+            self.expect('>')
+            return hl.tlocus(rg)
+        raise _ParseFailure()
+
+    def identifier(self):
+        self.skip()
+        if self.s.startswith('`', self.i):
+            name = unescape_parsable(self.match(_escaped_identifier)[1:-1])
+        else:
+            name = self.match(_simple_identifier)
+        self.skip()
+        return name
+
+
+def parse_type(s):
+    """Parse the :class:`.HailType` with string representation `s`."""
+    return TypeParser(s).parse()
@@ -1,12 +1,19 @@
 import abc
+import array
 import json
 import math
+import struct
+import sys
 from collections import Mapping, Sequence
+from functools import lru_cache
+
+import numpy as np
 
 import hail as hl
 from hail import genetics
-from hail.expr.type_parsing import type_grammar, type_node_visitor
+from hail.expr.type_parsing import parse_type
 from hail.genetics.reference_genome import reference_genome_type
+from hail.profiling import profiled
 from hail.typecheck import *
 from hail.utils.java import scala_object, jset, Env, escape_parsable
 
@@ -42,6 +49,8 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=4096)
+@profiled('dtype')
 def dtype(type_str):
     r"""Parse a type from its string representation.
 
@@ -67,6 +76,9 @@ def dtype(type_str):
     -----
     This function is able to reverse ``str(t)`` on a :class:`.HailType`.
 
+    Types are immutable, so the result is cached: parsing the same string
+    again returns the same type.
+
     The grammar is defined as follows:
 
     .. code-block:: text
@@ -102,8 +114,7 @@ def dtype(type_str):
     -------
     :class:`.HailType`
     """
-    tree = type_grammar.parse(type_str)
-    return type_node_visitor.visit(tree)
+    return parse_type(type_str)
 
 
 class HailType(object):
@@ -191,6 +202,7 @@ class HailType(object):
     def _convert_to_json(self, x):
         return x
 
+    @profiled('from_json', size=lambda x, self, s: len(s) if isinstance(s, str) else 0)
     def _from_json(self, s):
         x = json.loads(s)
         return self._convert_from_json_na(x)
@@ -204,6 +216,29 @@ class HailType(object):
     def _convert_from_json(self, x):
         return x
 
+    @profiled('from_binary', size=lambda x, self, b: len(b))
+    def _from_binary(self, b):
+        """Decode a value of this type from the binary encoding of the backend."""
+        x, _ = _binary_present_decoder(self)(b, 0)
+        return x
+
+    def _make_binary_decoder(self):
+        """Function decoding a present value of this type at an offset of a buffer.
+
+        The function returns the value and the offset just past it.
+        """
+        raise NotImplementedError(self)
+
+    def _to_binary(self, x):
+        """Encode a value of this type in the binary encoding of the backend."""
+        out = bytearray()
+        _binary_present_encoder(self)(x, out)
+        return bytes(out)
+
+    def _make_binary_encoder(self):
+        """Function appending the encoding of a present value of this type to a :obj:`bytearray`."""
+        raise NotImplementedError(self)
+
 
     def _traverse(self, obj, f):
         """Traverse a nested type and object.
@@ -237,6 +272,12 @@ class _tvoid(HailType):
     def __init__(self):
         super(_tvoid, self).__init__()
 
+    def _make_binary_decoder(self):
+        return lambda b, i: (None, i)
+
+    def _make_binary_encoder(self):
+        return lambda x, out: None
+
     def __str__(self):
         return "void"
 
@@ -267,6 +308,12 @@ class _tint32(HailType):
     def __init__(self):
         super(_tint32, self).__init__()
 
+    def _make_binary_decoder(self):
+        return _binary_fixed_decoder('i')
+
+    def _make_binary_encoder(self):
+        return _binary_fixed_encoder('i')
+
     def _typecheck_one_level(self, annotation):
         if annotation is not None:
             if not isinstance(annotation, int):
@@ -313,6 +360,12 @@ class _tint64(HailType):
     def __init__(self):
         super(_tint64, self).__init__()
 
+    def _make_binary_decoder(self):
+        return _binary_fixed_decoder('q')
+
+    def _make_binary_encoder(self):
+        return _binary_fixed_encoder('q')
+
     def _typecheck_one_level(self, annotation):
         if annotation is not None:
             if not isinstance(annotation, int):
@@ -357,6 +410,12 @@ class _tfloat32(HailType):
     def __init__(self):
         super(_tfloat32, self).__init__()
 
+    def _make_binary_decoder(self):
+        return _binary_fixed_decoder('f')
+
+    def _make_binary_encoder(self):
+        return _binary_fixed_encoder('f')
+
     def _typecheck_one_level(self, annotation):
         if annotation is not None and not isinstance(annotation, (float, int)):
             raise TypeError("type 'float32' expected Python 'float', but found type '%s'" % type(annotation))
@@ -398,6 +457,12 @@ class _tfloat64(HailType):
     def __init__(self):
         super(_tfloat64, self).__init__()
 
+    def _make_binary_decoder(self):
+        return _binary_fixed_decoder('d')
+
+    def _make_binary_encoder(self):
+        return _binary_fixed_encoder('d')
+
     def _typecheck_one_level(self, annotation):
         if annotation is not None and not isinstance(annotation, (float, int)):
             raise TypeError("type 'float64' expected Python 'float', but found type '%s'" % type(annotation))
@@ -438,6 +503,12 @@ class _tstr(HailType):
     def __init__(self):
         super(_tstr, self).__init__()
 
+    def _make_binary_decoder(self):
+        return _binary_decode_str
+
+    def _make_binary_encoder(self):
+        return _binary_encode_str
+
     def _typecheck_one_level(self, annotation):
         if annotation and not isinstance(annotation, str):
             raise TypeError("type 'str' expected Python 'str', but found type '%s'" % type(annotation))
@@ -470,6 +541,12 @@ class _tbool(HailType):
     def __init__(self):
         super(_tbool, self).__init__()
 
+    def _make_binary_decoder(self):
+        return _binary_fixed_decoder('?')
+
+    def _make_binary_encoder(self):
+        return _binary_fixed_encoder('?')
+
     def _typecheck_one_level(self, annotation):
         if annotation is not None and not isinstance(annotation, bool):
             raise TypeError("type 'bool' expected Python 'bool', but found type '%s'" % type(annotation))
@@ -623,9 +700,19 @@ class tarray(HailType):
         return "Array[" + self.element_type._parsable_string() + "]"
 
     def _convert_from_json(self, x):
-        return [self.element_type._convert_from_json_na(elt) for elt in x]
+        return _json_elements(self.element_type, x)
+
+    def _make_binary_decoder(self):
+        return _binary_elements_decoder(self.element_type, list)
+
+    def _make_binary_encoder(self):
+        return _binary_elements_encoder(self.element_type)
 
     def _convert_to_json(self, x):
+        if isinstance(x, np.ndarray):
+            if x.dtype.names is not None:
+                return [self.element_type._convert_to_json_na(dict(zip(x.dtype.names, row))) for row in x.tolist()]
+            return x.tolist()
         return [self.element_type._convert_to_json_na(elt) for elt in x]
 
     def _propagate_jtypes(self, jtype):
@@ -703,7 +790,13 @@ class tset(HailType):
         return "Set[" + self.element_type._parsable_string() + "]"
 
     def _convert_from_json(self, x):
-        return {self.element_type._convert_from_json_na(elt) for elt in x}
+        return set(_json_elements(self.element_type, x))
+
+    def _make_binary_decoder(self):
+        return _binary_elements_decoder(self.element_type, set)
+
+    def _make_binary_encoder(self):
+        return _binary_elements_encoder(self.element_type)
 
     def _convert_to_json(self, x):
         return [self.element_type._convert_to_json_na(elt) for elt in x]
@@ -803,8 +896,33 @@ class tdict(HailType):
         return "Dict[{},{}]".format(self.key_type._parsable_string(), self.value_type._parsable_string())
 
     def _convert_from_json(self, x):
-        return {self.key_type._convert_from_json_na(elt['key']): self.value_type._convert_from_json_na(elt['value']) for
-                elt in x}
+        return dict(zip(_json_elements(self.key_type, [elt['key'] for elt in x]),
+                        _json_elements(self.value_type, [elt['value'] for elt in x])))
+
+    def _make_binary_decoder(self):
+        decode_key = _binary_present_decoder(self.key_type)
+        decode_value = _binary_present_decoder(self.value_type)
+
+        def decode(b, i):
+            n, = _binary_int32.unpack_from(b, i)
+            i += 4
+            d = {}
+            for _ in range(n):
+                k, i = decode_key(b, i)
+                d[k], i = decode_value(b, i)
+            return d, i
+        return decode
+
+    def _make_binary_encoder(self):
+        encode_key = _binary_present_encoder(self.key_type)
+        encode_value = _binary_present_encoder(self.value_type)
+
+        def encode(x, out):
+            out += _binary_int32.pack(len(x))
+            for k, v in x.items():
+                encode_key(k, out)
+                encode_value(v, out)
+        return encode
 
     def _convert_to_json(self, x):
         return [{'key': self.key_type._convert_to_json(k),
@@ -922,8 +1040,27 @@ class tstruct(HailType, Mapping):
             ','.join('{}:{}'.format(escape_parsable(f), t._parsable_string()) for f, t in self.items()))
 
     def _convert_from_json(self, x):
-        from hail.utils import Struct
-        return Struct(**{f: t._convert_from_json_na(x.get(f)) for f, t in self.items()})
+        return _tstruct_builder(self)(tuple(t._convert_from_json_na(x.get(f)) for f, t in self.items()))
+
+    def _make_binary_decoder(self):
+        build = _tstruct_builder(self)
+        decoders = [_binary_present_decoder(t) for t in self.values()]
+
+        def decode(b, i):
+            values = []
+            for decode_field in decoders:
+                x, i = decode_field(b, i)
+                values.append(x)
+            return build(tuple(values)), i
+        return decode
+
+    def _make_binary_encoder(self):
+        encoders = [(f, _binary_present_encoder(t)) for f, t in self.items()]
+
+        def encode(x, out):
+            for f, encode_field in encoders:
+                encode_field(x[f], out)
+        return encode
 
     def _convert_to_json(self, x):
         return {f: t._convert_to_json_na(x[f]) for f, t in self.items()}
@@ -1060,6 +1197,25 @@ class ttuple(HailType):
     def _convert_from_json(self, x):
         return tuple(self.types[i]._convert_from_json_na(x[i]) for i in range(len(self.types)))
 
+    def _make_binary_decoder(self):
+        decoders = [_binary_present_decoder(t) for t in self.types]
+
+        def decode(b, i):
+            values = []
+            for decode_element in decoders:
+                x, i = decode_element(b, i)
+                values.append(x)
+            return tuple(values), i
+        return decode
+
+    def _make_binary_encoder(self):
+        encoders = [_binary_present_encoder(t) for t in self.types]
+
+        def encode(x, out):
+            for encode_element, elt in zip(encoders, x):
+                encode_element(elt, out)
+        return encode
+
     def _convert_to_json(self, x):
         return [self.types[i]._convert_to_json_na(x[i]) for i in range(len(self.types))]
 
@@ -1105,6 +1261,12 @@ class _tcall(HailType):
     def _convert_from_json(self, x):
         return hl.Call._from_java(hl.Call._call_jobject().parse(x))
 
+    def _make_binary_decoder(self):
+        def decode(b, i):
+            c, = _binary_int32.unpack_from(b, i)
+            return hl.Call._from_java(c), i + 4
+        return decode
+
     def _convert_to_json(self, x):
         return str(x)
 
@@ -1176,6 +1338,21 @@ class tlocus(HailType):
     def _convert_from_json(self, x):
         return genetics.Locus(x['contig'], x['position'], reference_genome=self.reference_genome)
 
+    def _make_binary_decoder(self):
+        rg = self.reference_genome
+
+        def decode(b, i):
+            contig, i = _binary_decode_str(b, i)
+            position, = _binary_int32.unpack_from(b, i)
+            return genetics.Locus(contig, position, reference_genome=rg), i + 4
+        return decode
+
+    def _make_binary_encoder(self):
+        def encode(x, out):
+            _binary_encode_str(x.contig, out)
+            out += _binary_int32.pack(x.position)
+        return encode
+
     def _convert_to_json(self, x):
         return {'contig': x.contig, 'position': x.position}
 
@@ -1257,6 +1434,27 @@ class tinterval(HailType):
                         x['includeStart'],
                         x['includeEnd'])
 
+    def _make_binary_decoder(self):
+        from hail.utils import Interval
+        point_type = self.point_type
+        decode_point = _binary_present_decoder(point_type)
+
+        def decode(b, i):
+            start, i = decode_point(b, i)
+            end, i = decode_point(b, i)
+            return Interval(start, end, b[i] != 0, b[i + 1] != 0, point_type=point_type), i + 2
+        return decode
+
+    def _make_binary_encoder(self):
+        encode_point = _binary_present_encoder(self.point_type)
+
+        def encode(x, out):
+            encode_point(x.start, out)
+            encode_point(x.end, out)
+            out.append(x.includes_start)
+            out.append(x.includes_end)
+        return encode
+
     def _convert_to_json(self, x):
         return {'start': self.point_type._convert_to_json_na(x.start),
                 'end': self.point_type._convert_to_json_na(x.end),
@@ -1459,6 +1657,209 @@ class tvariable(HailType):
         return s
 
 
+def _json_elements(element_type, x):
+    """Values of the elements of the JSON array `x` of `element_type`, as a list."""
+    if type(element_type)._convert_from_json is HailType._convert_from_json:
+        # the JSON values are the values
+        return x
+    if element_type == tfloat64 or element_type == tfloat32:
+        try:
+            return array.array('d', x).tolist()
+        except TypeError:
+            # missing elements, or NaN or infinities, which are strings in JSON
+            pass
+    return [element_type._convert_from_json_na(elt) for elt in x]
+
+
+# NumPy dtypes of the values of primitive types
+_numpy_dtypes = {tbool: np.dtype(np.bool_), tint32: np.dtype(np.int32), tint64: np.dtype(np.int64),
+                 tfloat32: np.dtype(np.float32), tfloat64: np.dtype(np.float64)}
+
+
+def _numpy_element_type(dt):
+    """Type of the elements of a NumPy array of dtype `dt`, or None if no type holds them."""
+    if dt.kind == 'b':
+        return tbool
+    elif dt.kind == 'i':
+        return tint32 if dt.itemsize <= 4 else tint64
+    elif dt.kind == 'u':
+        if dt.itemsize <= 2:
+            return tint32
+        return tint64 if dt.itemsize <= 4 else None
+    elif dt.kind == 'f':
+        return tfloat32 if dt.itemsize <= 4 else tfloat64
+    elif dt.kind == 'U':
+        return tstr
+    return None
+
+
+_binary_int32 = struct.Struct('>i')
+
+# element decoders of arrays and sets stored as a contiguous block
+_binary_fixed_width_codes = {tbool: '?', tint32: 'i', tint64: 'q', tfloat32: 'f', tfloat64: 'd'}
+
+
+def _binary_fixed_decoder(code):
+    s = struct.Struct('>' + code)
+    unpack_from = s.unpack_from
+    size = s.size
+
+    def decode(b, i):
+        return unpack_from(b, i)[0], i + size
+    return decode
+
+
+def _binary_decode_str(b, i):
+    n, = _binary_int32.unpack_from(b, i)
+    i += 4
+    return str(b[i:i + n], 'utf-8'), i + n
+
+
+def _binary_fixed_encoder(code):
+    pack = struct.Struct('>' + code).pack
+
+    def encode(x, out):
+        out += pack(x)
+    return encode
+
+
+def _binary_encode_str(x, out):
+    b = x.encode('utf-8')
+    out += _binary_int32.pack(len(b))
+    out += b
+
+
+def _binary_elements_decoder(element_type, collection):
+    code = _binary_fixed_width_codes.get(element_type)
+    if code is None:
+        decode_element = _binary_present_decoder(element_type)
+
+        def decode(b, i):
+            n, = _binary_int32.unpack_from(b, i)
+            i += 4
+            values = []
+            for _ in range(n):
+                x, i = decode_element(b, i)
+                values.append(x)
+            return collection(values) if collection is not list else values, i
+        return decode
+
+    def decode_fixed(b, i):
+        n, = _binary_int32.unpack_from(b, i)
+        has_missing = b[i + 4]
+        i += 5
+        if has_missing:
+            present = b[i:i + n]
+            i += n
+        if code == '?':
+            values = [x != 0 for x in b[i:i + n]]
+            i += n
+        else:
+            a = array.array(code)
+            size = n * a.itemsize
+            a.frombytes(b[i:i + size])
+            if sys.byteorder == 'little':
+                a.byteswap()
+            values = a.tolist()
+            i += size
+        if has_missing:
+            values = [x if p else None for x, p in zip(values, present)]
+        return collection(values) if collection is not list else values, i
+    return decode_fixed
+
+
+def _binary_elements_encoder(element_type):
+    code = _binary_fixed_width_codes.get(element_type)
+    if code is None:
+        encode_element = _binary_present_encoder(element_type)
+
+        def encode(x, out):
+            if isinstance(x, np.ndarray) and x.dtype.names is not None:
+                _binary_encode_records(element_type, x, out)
+                return
+            out += _binary_int32.pack(len(x))
+            for elt in x:
+                encode_element(elt, out)
+        return encode
+
+    def encode_fixed(x, out):
+        if isinstance(x, np.ndarray):
+            out += _binary_int32.pack(len(x))
+            out.append(0)
+            out += x.astype(_numpy_dtypes[element_type].newbyteorder('>'), copy=False).tobytes()
+            return
+        values = list(x)
+        out += _binary_int32.pack(len(values))
+        if any(elt is None for elt in values):
+            out.append(1)
+            out += bytes(elt is not None for elt in values)
+            values = [0 if elt is None else elt for elt in values]
+        else:
+            out.append(0)
+        if code == '?':
+            out += bytes(values)
+        else:
+            out += struct.pack(f'>{len(values)}{code}', *values)
+    return encode_fixed
+
+
+def _binary_encode_records(element_type, x, out):
+    """Append the encoding of an array of the structs of `element_type` in the
+    rows of the NumPy record array `x` to `out`.
+
+    If every field has a fixed-width type and a numeric or Boolean column,
+    the rows are encoded by one NumPy copy. Otherwise, each row is encoded in
+    Python.
+    """
+    out += _binary_int32.pack(len(x))
+    if all(t in _numpy_dtypes and x.dtype[f].kind in 'biuf' for f, t in element_type.items()):
+        layout = [('present', 'u1')]
+        for i, t in enumerate(element_type.values()):
+            layout.append((f'present{i}', 'u1'))
+            layout.append((f'value{i}', _numpy_dtypes[t].newbyteorder('>')))
+        rows = np.empty(len(x), dtype=layout)
+        rows['present'] = 1
+        for i, f in enumerate(element_type):
+            rows[f'present{i}'] = 1
+            rows[f'value{i}'] = x[f]
+        out += rows.tobytes()
+    else:
+        encode_element = _binary_present_encoder(element_type)
+        names = x.dtype.names
+        for row in x.tolist():
+            encode_element(dict(zip(names, row)), out)
+
+
+@lru_cache(maxsize=1024)
+def _tstruct_builder(t):
+    from hail.utils.struct import _struct_builder
+    return _struct_builder(t.fields)
+
+
+@lru_cache(maxsize=1024)
+def _binary_present_decoder(t):
+    decode = t._make_binary_decoder()
+
+    def decode_present(b, i):
+        if b[i]:
+            return decode(b, i + 1)
+        return None, i + 1
+    return decode_present
+
+
+@lru_cache(maxsize=1024)
+def _binary_present_encoder(t):
+    encode = t._make_binary_encoder()
+
+    def encode_present(x, out):
+        if x is None:
+            out.append(0)
+        else:
+            out.append(1)
+            encode(x, out)
+    return encode_present
+
+
 import pprint
 
 _old_printer = pprint.PrettyPrinter
@@ -5,6 +5,7 @@ from .table_ir import *
 from .matrix_ir import *
 from .blockmatrix_ir import *
 from .utils import *
+from .renderer import Renderer, CSERenderer
 from .matrix_reader import *
 from .table_reader import *
 from .matrix_writer import *
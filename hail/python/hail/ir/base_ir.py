@@ -1,4 +1,13 @@
 import abc
+import functools
+import math
+import weakref
+from collections.abc import Mapping
+
+import numpy as np
+
+import hail
+
 from .renderer import Renderer
 from hail.utils.java import Env
 
@@ -21,12 +30,93 @@ class BaseIR(object):
         return
 
 
+# types of values hashed as they are by tuples of them, except for signed zeros
+_primitive_types = frozenset([bool, int, float, str, type(None)])
+
+
+def _hashable(x):
+    """Hashable value equal for values whose IR renders the same.
+
+    Floating-point zeros are distinguished by their sign, as ``0.0 == -0.0``
+    in Python but they are different literals.
+    """
+    if isinstance(x, BaseIR):
+        return x
+    if isinstance(x, float):
+        if x == 0.0:
+            return float, math.copysign(1.0, x)
+        return x
+    if isinstance(x, (list, tuple)):
+        t = tuple(x)
+        # containers of primitive values, in particular large literals, are
+        # hashed without a call per element unless they hold a zero
+        types = set(map(type, t))
+        if types <= _primitive_types and (float not in types or 0.0 not in t):
+            return t
+        return tuple(_hashable(v) for v in t)
+    if isinstance(x, (set, frozenset)):
+        types = set(map(type, x))
+        if types <= _primitive_types and (float not in types or 0.0 not in x):
+            return frozenset(x)
+        return frozenset(_hashable(v) for v in x)
+    if isinstance(x, Mapping):
+        return frozenset((_hashable(k), _hashable(v)) for k, v in x.items())
+    if isinstance(x, hail.utils.Interval):
+        return hail.utils.Interval, _hashable(x.start), _hashable(x.end), x.includes_start, x.includes_end
+    if isinstance(x, np.ndarray):
+        if x.dtype.hasobject:
+            return str(x.dtype), x.shape, _hashable(x.tolist())
+        return str(x.dtype), x.shape, x.tobytes()
+    try:
+        hash(x)
+        return x
+    except TypeError:
+        return repr(x)
+
+
 class IR(BaseIR):
+    # attributes that are caches or are already covered by `children`
+    _unhashed_attributes = frozenset(['_type', '_aggregations', '_jir', '_hash', '_literal_file', 'children'])
+
     def __init__(self, *children):
         super().__init__()
         self._aggregations = None
+        self._hash = None
         self.children = children
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        eq = cls.__dict__.get('__eq__')
+        if eq is not None:
+            # structural equality: restore the structural hash that defining
+            # __eq__ removes, and short-circuit on identity and on hashes
+            @functools.wraps(eq)
+            def __eq__(self, other):
+                if self is other:
+                    return True
+                if isinstance(other, IR) and hash(self) != hash(other):
+                    return False
+                return eq(self, other)
+
+            cls.__eq__ = __eq__
+            cls.__hash__ = IR.__hash__
+            cls._eq_class = cls.__name__
+
+    def __hash__(self):
+        """Structural hash, consistent with ``__eq__``; computed once per node.
+
+        Nodes that do not define ``__eq__`` compare and hash by identity.
+        """
+        if self._hash is None:
+            if not hasattr(self, '_eq_class'):
+                self._hash = object.__hash__(self)
+            else:
+                attributes = sorted(k for k in self.__dict__ if k not in IR._unhashed_attributes)
+                self._hash = hash((self._eq_class,
+                                   tuple((k, _hashable(self.__dict__[k])) for k in attributes),
+                                   tuple(self.children)))
+        return self._hash
+
     @property
     def aggregations(self):
         if self._aggregations is None:
@@ -60,6 +150,22 @@ class IR(BaseIR):
     def bound_variables(self):
         return {v for child in self.children for v in child.bound_variables}
 
+    def renderable_bindings(self, i):
+        """Names bound by this node in the scope of child `i`."""
+        return frozenset()
+
+    def renderable_new_block(self, i):
+        """True if child `i` is not evaluated exactly once per evaluation of this node."""
+        return False
+
+    def uses_agg_context(self, i):
+        """True if child `i` is evaluated in the aggregation context."""
+        return False
+
+    def renderable_new_env(self, i):
+        """True if child `i` does not see the bindings in scope at this node."""
+        return self.uses_agg_context(i)
+
     @property
     def typ(self):
         if self._type is None:
@@ -75,6 +181,26 @@ class IR(BaseIR):
         return Env.hail().expr.ir.IRParser.parse_value_ir(code, ref_map, ir_map)
 
 
+_interned_irs = weakref.WeakValueDictionary()
+
+
+def intern_ir(x):
+    """Return the live interned node structurally equal to `x`, or intern `x`.
+
+    Interned nodes are held weakly, so a node is shared for as long as some
+    expression still refers to it. Nodes that compare by identity are
+    returned unchanged.
+    """
+    if not isinstance(x, IR) or not hasattr(x, '_eq_class'):
+        return x
+    h = hash(x)
+    y = _interned_irs.get(h)
+    if y is not None and type(y) is type(x) and y == x:
+        return y
+    _interned_irs[h] = x
+    return x
+
+
 class TableIR(BaseIR):
     def __init__(self):
         super().__init__()
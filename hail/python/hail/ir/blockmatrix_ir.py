@@ -15,8 +15,11 @@ class BlockMatrixRead(BlockMatrixIR):
     def render(self, r):
         return f'(BlockMatrixRead "{escape_str(self.path)}")'
 
+    def _input_files(self):
+        return [self.path + '/_SUCCESS']
+
     def _compute_type(self):
-        self._type = Env.backend().blockmatrix_type(self)
+        self._type = Env.backend()._read_type(self, self.path)
 
 
 class BlockMatrixMap(BlockMatrixIR):
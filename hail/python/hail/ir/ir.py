@@ -1,7 +1,11 @@
 import copy
+import hashlib
+
+import numpy as np
 
 import hail
 from hail.utils.java import escape_str, escape_id, dump_json, parsable_strings
+from hail.utils.misc import new_local_temp_file
 from hail.expr.types import *
 from hail.typecheck import *
 from .base_ir import *
@@ -265,6 +269,9 @@ class If(IR):
     def render(self, r):
         return '(If {} {} {})'.format(r(self.cond), r(self.cnsq), r(self.altr))
 
+    def renderable_new_block(self, i):
+        return i > 0
+
     def __eq__(self, other):
         return isinstance(other, If) and \
                other.cond == self.cond and \
@@ -299,6 +306,9 @@ class Let(IR):
     def bound_variables(self):
         return {self.name} | super().bound_variables
 
+    def renderable_bindings(self, i):
+        return frozenset({self.name}) if i == 1 else frozenset()
+
     def __eq__(self, other):
         return isinstance(other, Let) and \
                other.name == self.name and \
@@ -345,10 +355,6 @@ class TopLevelReference(Ref):
         new_instance = self.__class__
         return new_instance(self.name)
 
-    def __eq__(self, other):
-        return isinstance(other, TopLevelReference) and \
-               other.name == self.name
-
     def _compute_type(self, env, agg_env):
         assert self.name in env, f'{self.name} not found in {env}'
         self._type = env[self.name]
@@ -625,6 +631,12 @@ class ArraySort(IR):
     def bound_variables(self):
         return {self.l_name, self.r_name} | super().bound_variables
 
+    def renderable_bindings(self, i):
+        return frozenset({self.l_name, self.r_name}) if i == 1 else frozenset()
+
+    def renderable_new_block(self, i):
+        return i == 1
+
     def __eq__(self, other):
         return isinstance(other, ArraySort) and \
                other.a == self.a and \
@@ -774,6 +786,12 @@ class ArrayMap(IR):
     def bound_variables(self):
         return {self.name} | super().bound_variables
 
+    def renderable_bindings(self, i):
+        return frozenset({self.name}) if i == 1 else frozenset()
+
+    def renderable_new_block(self, i):
+        return i == 1
+
     def __eq__(self, other):
         return isinstance(other, ArrayMap) and \
                other.a == self.a and \
@@ -805,6 +823,12 @@ class ArrayFilter(IR):
     def bound_variables(self):
         return {self.name} | super().bound_variables
 
+    def renderable_bindings(self, i):
+        return frozenset({self.name}) if i == 1 else frozenset()
+
+    def renderable_new_block(self, i):
+        return i == 1
+
     def __eq__(self, other):
         return isinstance(other, ArrayFilter) and \
                other.a == self.a and \
@@ -836,6 +860,12 @@ class ArrayFlatMap(IR):
     def bound_variables(self):
         return {self.name} | super().bound_variables
 
+    def renderable_bindings(self, i):
+        return frozenset({self.name}) if i == 1 else frozenset()
+
+    def renderable_new_block(self, i):
+        return i == 1
+
     def __eq__(self, other):
         return isinstance(other, ArrayFlatMap) and \
                other.a == self.a and \
@@ -872,6 +902,12 @@ class ArrayFold(IR):
     def bound_variables(self):
         return {self.accum_name, self.value_name} | super().bound_variables
 
+    def renderable_bindings(self, i):
+        return frozenset({self.accum_name, self.value_name}) if i == 2 else frozenset()
+
+    def renderable_new_block(self, i):
+        return i == 2
+
     def __eq__(self, other):
         return isinstance(other, ArrayFold) and \
                other.a == self.a and \
@@ -915,6 +951,12 @@ class ArrayScan(IR):
     def bound_variables(self):
         return {self.accum_name, self.value_name} | super().bound_variables
 
+    def renderable_bindings(self, i):
+        return frozenset({self.accum_name, self.value_name}) if i == 2 else frozenset()
+
+    def renderable_new_block(self, i):
+        return i == 2
+
     def __eq__(self, other):
         return isinstance(other, ArrayScan) and \
                other.a == self.a and \
@@ -959,6 +1001,12 @@ class ArrayLeftJoinDistinct(IR):
     def bound_variables(self):
         return {self.l_name, self.r_name} | super().bound_variables
 
+    def renderable_bindings(self, i):
+        return frozenset({self.l_name, self.r_name}) if i >= 2 else frozenset()
+
+    def renderable_new_block(self, i):
+        return i >= 2
+
     def __eq__(self, other):
         return isinstance(other, ArrayLeftJoinDistinct) and \
                other.left == self.left and \
@@ -989,6 +1037,12 @@ class ArrayFor(IR):
     def bound_variables(self):
         return {self.value_name} | super().bound_variables
 
+    def renderable_bindings(self, i):
+        return frozenset({self.value_name}) if i == 1 else frozenset()
+
+    def renderable_new_block(self, i):
+        return i == 1
+
     def __eq__(self, other):
         return isinstance(other, ArrayFor) and \
                other.a == self.a and \
@@ -1016,6 +1070,12 @@ class AggFilter(IR):
     def render(self, r):
         return '(AggFilter {} {})'.format(r(self.cond), r(self.agg_ir))
 
+    def renderable_new_block(self, i):
+        return i == 1
+
+    def uses_agg_context(self, i):
+        return i == 0
+
     def __eq__(self, other):
         return isinstance(other, AggFilter) and \
                other.cond == self.cond and \
@@ -1047,6 +1107,15 @@ class AggExplode(IR):
     def bound_variables(self):
         return {self.name} | super().bound_variables
 
+    def renderable_bindings(self, i):
+        return frozenset({self.name}) if i == 1 else frozenset()
+
+    def renderable_new_block(self, i):
+        return i == 1
+
+    def uses_agg_context(self, i):
+        return i == 0
+
     def __eq__(self, other):
         return isinstance(other, AggExplode) and \
                other.array == self.array and \
@@ -1074,6 +1143,12 @@ class AggGroupBy(IR):
     def render(self, r):
         return '(AggGroupBy {} {})'.format(r(self.key), r(self.agg_ir))
 
+    def renderable_new_block(self, i):
+        return i == 1
+
+    def uses_agg_context(self, i):
+        return i == 0
+
     def __eq__(self, other):
         return isinstance(other, AggGroupBy) and \
                other.key == self.key and \
@@ -1115,6 +1190,15 @@ class AggArrayPerElement(IR):
     def bound_variables(self):
         return {self.name} | super().bound_variables
 
+    def renderable_bindings(self, i):
+        return frozenset({self.name}) if i == 1 else frozenset()
+
+    def renderable_new_block(self, i):
+        return i == 1
+
+    def uses_agg_context(self, i):
+        return i == 0
+
 
 def _register(registry, name, f):
     if name in registry:
@@ -1187,6 +1271,17 @@ class BaseApplyAggOp(IR):
         assert all(map(lambda c: len(c.aggregations) == 0, self.children))
         return [self]
 
+    def renderable_new_block(self, i):
+        return True
+
+    def renderable_new_env(self, i):
+        # all arguments are evaluated where the aggregator is initialized or updated
+        return True
+
+    def uses_agg_context(self, i):
+        n_init_op_args = len(self.init_op_args) if self.init_op_args else 0
+        return i >= len(self.constructor_args) + n_init_op_args
+
     def __eq__(self, other):
         return isinstance(other, self.__class__) and \
                other.agg_op == self.agg_op and \
@@ -1314,7 +1409,7 @@ class InsertFields(IR):
 
     def render(self, r):
         return '(InsertFields {} {} {})'.format(
-            self.old,
+            r(self.old),
             'None' if self.field_order is None else parsable_strings(self.field_order),
             ' '.join(['({} {})'.format(escape_id(f), r(x)) for (f, x) in self.fields]))
 
@@ -1491,7 +1586,7 @@ class In(IR):
 class Die(IR):
     @typecheck_method(message=IR, typ=hail_type)
     def __init__(self, message, typ):
-        super().__init__()
+        super().__init__(message)
         self.message = message
         self._typ = typ
 
@@ -1499,9 +1594,10 @@ class Die(IR):
     def typ(self):
         return self._typ
 
-    def copy(self):
+    @typecheck_method(message=IR)
+    def copy(self, message):
         new_instance = self.__class__
-        return new_instance(self.message, self._typ)
+        return new_instance(message, self._typ)
 
     def render(self, r):
         return '(Die {} {})'.format(self._typ._parsable_string(), r(self.message))
@@ -1557,6 +1653,10 @@ class Apply(IR):
     def render(self, r):
         return '(Apply {} {})'.format(escape_id(self.function), ' '.join([r(x) for x in self.args]))
 
+    def renderable_new_block(self, i):
+        # `||` and `&&` short-circuit on their second argument
+        return i == 1 and self.function in ('||', '&&')
+
     def __eq__(self, other):
         return isinstance(other, Apply) and \
                other.function == self.function and \
@@ -1588,8 +1688,9 @@ class ApplySeeded(IR):
             ' '.join([r(x) for x in self.args]))
 
     def __eq__(self, other):
-        return isinstance(other, Apply) and \
+        return isinstance(other, ApplySeeded) and \
                other.function == self.function and \
+               other.seed == self.seed and \
                other.args == self.args
 
     def _compute_type(self, env, agg_env):
@@ -1621,6 +1722,12 @@ class Uniroot(IR):
     def bound_variables(self):
         return {self.argname} | super().bound_variables
 
+    def renderable_bindings(self, i):
+        return frozenset({self.argname}) if i == 0 else frozenset()
+
+    def renderable_new_block(self, i):
+        return i == 0
+
     def __eq__(self, other):
         return isinstance(other, Uniroot) and \
                other.argname == self.argname and \
@@ -1719,6 +1826,12 @@ class TableAggregate(IR):
     def render(self, r):
         return '(TableAggregate {} {})'.format(r(self.child), r(self.query))
 
+    def renderable_new_block(self, i):
+        return i == 1
+
+    def renderable_new_env(self, i):
+        return i == 1
+
     def __eq__(self, other):
         return isinstance(other, TableAggregate) and \
                other.child == self.child and \
@@ -1744,6 +1857,12 @@ class MatrixAggregate(IR):
     def render(self, r):
         return '(MatrixAggregate {} {})'.format(r(self.child), r(self.query))
 
+    def renderable_new_block(self, i):
+        return i == 1
+
+    def renderable_new_env(self, i):
+        return i == 1
+
     def __eq__(self, other):
         return isinstance(other, MatrixAggregate) and \
                other.child == self.child and \
@@ -1978,18 +2097,56 @@ class Literal(IR):
         return Literal(self._typ, self.value)
 
     def render(self, r):
+        if r.literal_files:
+            if not hasattr(self, '_literal_file'):
+                self._literal_file = _literal_file(self._typ, self.value)
+            if self._literal_file is not None:
+                path, digest = self._literal_file
+                return f'(LiteralFile {self._typ._parsable_string()} "{escape_str(path)}" "{digest}")'
         return f'(Literal {self._typ._parsable_string()} ' \
                f'"{escape_str(self._typ._to_json(self.value))}")'
 
     def __eq__(self, other):
-        return isinstance(other, Literal) and \
-               other._typ == self._typ and \
-               other.value == self.value
+        if not (isinstance(other, Literal) and other._typ == self._typ):
+            return False
+        if isinstance(self.value, np.ndarray) or isinstance(other.value, np.ndarray):
+            return np.array_equal(self.value, other.value)
+        return other.value == self.value
 
     def _compute_type(self, env, agg_env):
         self._type = self._typ
 
 
+# literals with a binary encoding at least this long are passed in files
+_literal_file_min_bytes = 1 << 16
+
+# local files holding encoded literals, by hash of their contents
+_literal_files = {}
+
+
+def _literal_file(typ, value):
+    """Path and content hash of a local file with the binary encoding of a large literal.
+
+    Each distinct encoding is written once per session. Returns ``None`` if
+    the literal is small, or if its type has no binary encoding.
+    """
+    try:
+        b = typ._to_binary(value)
+    except NotImplementedError:
+        return None
+    if len(b) < _literal_file_min_bytes:
+        return None
+    digest = hashlib.sha256(b).hexdigest()
+    path = _literal_files.get(digest)
+    if path is None:
+        # literals may be written from several threads, see `Table.parallelize`
+        path = new_local_temp_file(f'literal-{digest}')
+        with open(path, 'wb') as f:
+            f.write(b)
+        path = _literal_files.setdefault(digest, path)
+    return path, digest
+
+
 class Join(IR):
     _idx = 0
 
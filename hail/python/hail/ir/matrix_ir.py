@@ -37,7 +37,10 @@ class MatrixRead(MatrixIR):
         return f'(MatrixRead None {self.drop_cols} {self.drop_rows} "{r(self.reader)}")'
 
     def _compute_type(self):
-        self._type = Env.backend().matrix_type(self)
+        if isinstance(self.reader, hl.ir.MatrixNativeReader):
+            self._type = Env.backend()._read_type(self, self.reader.path)
+        else:
+            self._type = Env.backend().matrix_type(self)
 
 
 class MatrixFilterRows(MatrixIR):
@@ -8,6 +8,7 @@ from ..utils.java import escape_str
 from ..genetics.reference_genome import reference_genome_type
 
 from .utils import make_filter_and_replace
+from .table_reader import _read_partition_counts
 
 
 class MatrixReader(object):
@@ -19,6 +20,11 @@ class MatrixReader(object):
     def __eq__(self, other):
         pass
 
+    def _input_files(self):
+        """Paths of the files whose modification marks a change of the data
+        read, or ``None`` if they are not known."""
+        return None
+
 
 class MatrixNativeReader(MatrixReader):
     @typecheck_method(path=str)
@@ -30,6 +36,16 @@ class MatrixNativeReader(MatrixReader):
                   'path': self.path}
         return escape_str(json.dumps(reader))
 
+    def _input_files(self):
+        return [self.path + '/_SUCCESS']
+
+    def _partition_counts(self):
+        """Number of rows of each partition, from the metadata of the matrix table."""
+        return _read_partition_counts(self.path)
+
+    def _n_cols(self):
+        return sum(_read_partition_counts(self.path + '/cols'))
+
     def __eq__(self, other):
         return isinstance(other, MatrixNativeReader) and \
                other.path == self.path
@@ -51,6 +67,9 @@ class MatrixRangeReader(MatrixReader):
                   'nPartitions': self.n_partitions}
         return escape_str(json.dumps(reader))
 
+    def _input_files(self):
+        return []
+
     def __eq__(self, other):
         return isinstance(other, MatrixRangeReader) and \
                other.n_rows == self.n_rows and \
@@ -120,6 +139,9 @@ class MatrixVCFReader(MatrixReader):
                   'partitionsJSON': self._partitions_json}
         return escape_str(json.dumps(reader))
 
+    def _input_files(self):
+        return self.path + ([self.header_file] if self.header_file else [])
+
     def __eq__(self, other):
         return isinstance(other, MatrixVCFReader) and \
                other.path == self.path and \
@@ -168,6 +190,12 @@ class MatrixBGENReader(MatrixReader):
                   }
         return escape_str(json.dumps(reader))
 
+    def _input_files(self):
+        files = self.path + list(self.index_file_map.values())
+        if self.sample_file:
+            files.append(self.sample_file)
+        return files
+
     def __eq__(self, other):
         return isinstance(other, MatrixBGENReader) and \
                other.path == self.path and \
@@ -211,6 +239,9 @@ class MatrixPLINKReader(MatrixReader):
                   'skipInvalidLoci': self.skip_invalid_loci}
         return escape_str(json.dumps(reader))
 
+    def _input_files(self):
+        return [self.bed, self.bim, self.fam]
+
     def __eq__(self, other):
         return isinstance(other, MatrixPLINKReader) and \
                other.bed == self.bed and \
@@ -246,6 +277,9 @@ class MatrixGENReader(MatrixReader):
     def render(self, r):
         return escape_str(json.dumps(self.config))
 
+    def _input_files(self):
+        return self.config['files'] + [self.config['sampleFile']]
+
     def __eq__(self, other):
         return isinstance(other, MatrixGENReader) and \
             self.config == other.config
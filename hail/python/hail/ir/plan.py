@@ -0,0 +1,347 @@
+from .base_ir import BaseIR, IR, TableIR, MatrixIR, BlockMatrixIR
+from .table_ir import *
+from .matrix_ir import *
+from .table_reader import TableNativeReader, TextTableReader
+from .matrix_reader import MatrixNativeReader, MatrixRangeReader
+
+
+def ir_children(x):
+    """The IR children of `x`, including the children of relational IR."""
+    if isinstance(x, IR):
+        return [child for child in x.children if isinstance(child, BaseIR)]
+    children = []
+    for v in vars(x).values():
+        if isinstance(v, BaseIR):
+            children.append(v)
+        elif isinstance(v, (list, tuple)):
+            children.extend(child for child in v if isinstance(child, BaseIR))
+    return children
+
+
+def relational_children(x):
+    """The relational IR run by `x`, directly or from its value IR children."""
+    children = []
+    visited = set()
+    stack = list(reversed(ir_children(x)))
+    while stack:
+        y = stack.pop()
+        if isinstance(y, (TableIR, MatrixIR, BlockMatrixIR)):
+            children.append(y)
+        elif id(y) not in visited:
+            visited.add(id(y))
+            stack.extend(reversed(ir_children(y)))
+    return children
+
+
+class Estimate(object):
+    """Estimated size of the value of a relational IR node.
+
+    A count of ``None`` is unknown. A count that is not exact is an upper
+    bound.
+    """
+    __slots__ = ['rows', 'rows_exact', 'cols', 'cols_exact', 'partitions']
+
+    def __init__(self, rows=None, rows_exact=True, cols=None, cols_exact=True, partitions=None):
+        self.rows = rows
+        self.rows_exact = rows_exact
+        self.cols = cols
+        self.cols_exact = cols_exact
+        self.partitions = partitions
+
+    def bounded(self, rows=True, cols=False):
+        return Estimate(self.rows, self.rows_exact and not rows, self.cols, self.cols_exact and not cols,
+                        self.partitions)
+
+    def with_rows(self, rows, exact):
+        return Estimate(rows, exact, self.cols, self.cols_exact, self.partitions)
+
+    def with_cols(self, cols, exact):
+        return Estimate(self.rows, self.rows_exact, cols, exact, self.partitions)
+
+    def with_partitions(self, partitions):
+        return Estimate(self.rows, self.rows_exact, self.cols, self.cols_exact, partitions)
+
+
+_unknown = Estimate()
+
+
+class PlanNode(object):
+    """A step of the plan of a pipeline, see :func:`plan`.
+
+    Attributes
+    ----------
+    ir : :class:`.BaseIR`
+        Relational IR of the step.
+    estimate : :class:`.Estimate`
+        Estimated rows, columns and partitions of its value.
+    shuffle : :obj:`str` or :obj:`None`
+        Why the step shuffles its rows, or ``None``.
+    note : :obj:`str` or :obj:`None`
+        Other costs: full scans of inputs, joins and sorts within partitions.
+    children : :obj:`list` of :class:`.PlanNode`
+    """
+
+    def __init__(self, ir, estimate, shuffle, note, children):
+        self.ir = ir
+        self.estimate = estimate
+        self.shuffle = shuffle
+        self.note = note
+        self.children = children
+
+    def nodes(self):
+        """The steps of the plan, in pre-order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+
+def _key_by_cost(old_key, new_key, is_sorted):
+    """(shuffle, note) of changing the key `old_key` of sorted data to `new_key`."""
+    n_preserved = 0
+    for old, new in zip(old_key, new_key):
+        if old != new:
+            break
+        n_preserved += 1
+    if n_preserved == len(new_key):
+        return None, None
+    if is_sorted or n_preserved > 0:
+        return None, f'sort within partitions by {list(new_key)}'
+    return f'key by {list(new_key)}, unless already sorted', None
+
+
+def _physical_key(tir):
+    # unkeying keeps the data sorted by the previous key
+    while isinstance(tir, TableKeyBy) and not tir.keys:
+        tir = tir.child
+    return tir.typ.row_key
+
+
+def _source(x):
+    """(estimate, note) of a relational IR node reading its data, or ``None`` if it does not."""
+    if isinstance(x, TableRead):
+        if isinstance(x.reader, TableNativeReader):
+            counts = x.reader._partition_counts()
+            estimate = Estimate(0 if x.drop_rows else sum(counts), partitions=len(counts))
+            return estimate, f'scan {x.reader.path}'
+        if isinstance(x.reader, TextTableReader):
+            return _unknown, f'scan {", ".join(x.reader.config["files"])}'
+        return _unknown, f'scan ({type(x.reader).__name__})'
+    if isinstance(x, MatrixRead):
+        if isinstance(x.reader, MatrixNativeReader):
+            counts = x.reader._partition_counts()
+            estimate = Estimate(0 if x.drop_rows else sum(counts),
+                                cols=0 if x.drop_cols else x.reader._n_cols(),
+                                partitions=len(counts))
+            return estimate, f'scan {x.reader.path}'
+        if isinstance(x.reader, MatrixRangeReader):
+            return Estimate(x.reader.n_rows, cols=x.reader.n_cols, partitions=x.reader.n_partitions), None
+        input_files = x.reader._input_files()
+        return _unknown, f'scan {", ".join(input_files)}' if input_files else f'scan ({type(x.reader).__name__})'
+    if isinstance(x, TableImport):
+        return _unknown, f'scan {", ".join(x.paths)}'
+    if isinstance(x, TableRange):
+        return Estimate(x.n, partitions=x.n_partitions), None
+    if isinstance(x, TableParallelize):
+        return Estimate(partitions=x.n_partitions), None
+    if isinstance(x, (JavaTable, JavaMatrix)):
+        return _unknown, 'computed or persisted in the backend'
+    return None
+
+
+def _sum(counts):
+    return None if any(c is None for c in counts) else sum(counts)
+
+
+def _product(a, b):
+    return None if a is None or b is None else a * b
+
+
+def _step(x, children):
+    """(estimate, shuffle, note) of the relational IR node `x`, given the estimates of its children."""
+    source = _source(x)
+    if source is not None:
+        estimate, note = source
+        return estimate, None, note
+
+    first = children[0] if children else _unknown
+
+    if isinstance(x, TableKeyBy):
+        return (first,) + _key_by_cost(x.child.typ.row_key, x.keys, x.is_sorted)
+    if isinstance(x, MatrixKeyRowsBy):
+        return (first,) + _key_by_cost(x.child.typ.row_key, x.keys, x.is_sorted)
+    if isinstance(x, TableKeyByAndAggregate):
+        estimate = first.bounded()
+        if x.n_partitions is not None:
+            estimate = estimate.with_partitions(x.n_partitions)
+        return estimate, f'group by {list(x.typ.row_key)}', None
+    if isinstance(x, TableOrderBy):
+        fields = [f for f, _ in x.sort_fields]
+        # the backend does not sort data already sorted by its key
+        if all(order == 'A' for _, order in x.sort_fields) and list(_physical_key(x.child)[:len(fields)]) == fields:
+            return first, None, None
+        return first, f'order by {[order + f for f, order in x.sort_fields]}', None
+    if isinstance(x, (TableRepartition, MatrixRepartition)):
+        shuffle = 'repartition' if x.strategy == RepartitionStrategy.SHUFFLE else None
+        return first.with_partitions(x.n), shuffle, None
+
+    if isinstance(x, (TableFilter, MatrixFilterRows, TableDistinct, MatrixDistinctByRow,
+                      TableAggregateByKey, MatrixAggregateRowsByKey)):
+        return first.bounded(), None, None
+    if isinstance(x, (MatrixFilterCols, MatrixCollectColsByKey, MatrixAggregateColsByKey)):
+        return first.bounded(rows=False, cols=True), None, None
+    if isinstance(x, (TableHead, MatrixRowsHead)):
+        if first.rows is None:
+            return first.with_rows(x.n, False), None, None
+        return first.with_rows(min(x.n, first.rows), first.rows_exact), None, None
+    if isinstance(x, MatrixChooseCols):
+        return first.with_cols(len(x.old_indices), True), None, None
+    if isinstance(x, (TableExplode, MatrixExplodeRows)):
+        return first.with_rows(None, False), None, None
+    if isinstance(x, MatrixExplodeCols):
+        return first.with_cols(None, False), None, None
+
+    if isinstance(x, (TableUnion, MatrixUnionRows)):
+        return (Estimate(_sum([c.rows for c in children]), all(c.rows_exact for c in children),
+                         first.cols, first.cols_exact,
+                         _sum([c.partitions for c in children])),
+                None, None)
+    if isinstance(x, MatrixUnionCols):
+        second = children[1]
+        return (Estimate(first.rows, False, _sum([first.cols, second.cols]),
+                         first.cols_exact and second.cols_exact, first.partitions),
+                None, 'join on row key, repartitions the right matrix table')
+    if isinstance(x, TableJoin):
+        return (Estimate(partitions=first.partitions), None,
+                f'{x.join_type} join, repartitions the right table')
+    if isinstance(x, (TableLeftJoinRightDistinct, TableIntervalJoin, MatrixAnnotateRowsTable)):
+        kind = 'interval join' if isinstance(x, TableIntervalJoin) else 'left join'
+        return first, None, f'{kind}, repartitions the right table'
+    if isinstance(x, MatrixAnnotateColsTable):
+        return first, None, 'left join of columns, collects the table'
+    if isinstance(x, TableMultiWayZipJoin):
+        return (Estimate(partitions=first.partitions), None,
+                f'outer join of {len(children)} tables, repartitions them')
+
+    if isinstance(x, (MatrixRowsTable, CastMatrixToTable)):
+        return Estimate(first.rows, first.rows_exact, partitions=first.partitions), None, None
+    if isinstance(x, MatrixColsTable):
+        return Estimate(first.cols, first.cols_exact), None, None
+    if isinstance(x, MatrixEntriesTable):
+        return (Estimate(_product(first.rows, first.cols), False, partitions=first.partitions),
+                None, 'sort within partitions by the column key')
+    if isinstance(x, CastTableToMatrix):
+        return Estimate(first.rows, first.rows_exact, partitions=first.partitions), None, None
+    if isinstance(x, (TableToTableApply, MatrixToTableApply, MatrixToMatrixApply)):
+        return Estimate(partitions=first.partitions), None, f'runs {x.config.get("name")}'
+
+    # steps mapping rows, columns, entries or globals
+    return first, None, None
+
+
+def plan(ir):
+    """Plan of the relational IR `ir`, with the estimated size of each step.
+
+    Estimates are computed from the IR and from the metadata of the native
+    files read, without running the pipeline.
+
+    Parameters
+    ----------
+    ir : :class:`.TableIR` or :class:`.MatrixIR`
+
+    Returns
+    -------
+    :class:`.PlanNode`
+    """
+    # post-order over the relational IR; relational nodes are never shared
+    # when executed, so shared nodes are planned once per use
+    done = []
+    stack = [(ir, None)]
+    while stack:
+        x, children = stack.pop()
+        if children is None:
+            children = relational_children(x)
+            stack.append((x, children))
+            stack.extend((child, None) for child in reversed(children))
+        else:
+            child_nodes = done[len(done) - len(children):]
+            del done[len(done) - len(children):]
+            estimate, shuffle, note = _step(x, [c.estimate for c in child_nodes])
+            done.append(PlanNode(x, estimate, shuffle, note, child_nodes))
+    return done[0]
+
+
+# steps whose partitions are the partitions of their first child
+_partition_preserving = (TableFilter, TableMapRows, TableMapGlobals, TableRename, TableExplode,
+                         TableLeftJoinRightDistinct, TableIntervalJoin, MatrixRowsTable, CastMatrixToTable,
+                         MatrixFilterRows, MatrixFilterCols, MatrixFilterEntries, MatrixMapRows, MatrixMapCols,
+                         MatrixMapEntries, MatrixMapGlobals, MatrixRename, MatrixAnnotateRowsTable,
+                         MatrixAnnotateColsTable)
+
+
+def source_partition_counts(root):
+    """Row counts of the partitions of the native file read by the plan `root`.
+
+    Returns ``None`` unless the partitions of `root` are the partitions of
+    the file, that is, unless every step between them keeps the partitions
+    of its child.
+    """
+    node = root
+    while True:
+        x = node.ir
+        if isinstance(x, (TableRead, MatrixRead)):
+            if isinstance(x.reader, (TableNativeReader, MatrixNativeReader)) and not x.drop_rows:
+                return x.reader._partition_counts()
+            return None
+        preserving = (isinstance(x, _partition_preserving)
+                      or (isinstance(x, (TableKeyBy, MatrixKeyRowsBy)) and node.shuffle is None and node.note is None))
+        if not preserving or not node.children:
+            return None
+        node = node.children[0]
+
+
+def _format_count(n, exact):
+    if n is None:
+        return '?'
+    return f'{n}' if exact else f'<={n}'
+
+
+def _format_node(node, depth):
+    e = node.estimate
+    x = node.ir
+    size = f'rows={_format_count(e.rows, e.rows_exact)}'
+    if isinstance(x, MatrixIR):
+        size += f' cols={_format_count(e.cols, e.cols_exact)}'
+    size += f' partitions={"?" if e.partitions is None else e.partitions}'
+    if isinstance(x, TableIR):
+        size += f' key={list(x.typ.row_key)}'
+    elif isinstance(x, MatrixIR):
+        size += f' row_key={list(x.typ.row_key)}'
+    line = f'{"  " * depth}{type(x).__name__} ({size})'
+    if node.shuffle is not None:
+        line += f' [SHUFFLE: {node.shuffle}]'
+    if node.note is not None:
+        line += f' [{node.note}]'
+    return line
+
+
+def format_plan(root):
+    """Text of the plan `root`, with a summary of its shuffles, scans and joins."""
+    lines = []
+    n_shuffles = n_scans = n_joins = 0
+    stack = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        lines.append(_format_node(node, depth))
+        if node.shuffle is not None:
+            n_shuffles += 1
+        if node.note is not None and node.note.startswith('scan'):
+            n_scans += 1
+        if node.note is not None and 'join' in node.note:
+            n_joins += 1
+        stack.extend((child, depth + 1) for child in reversed(node.children))
+    summary = f'{n_shuffles} shuffle{"" if n_shuffles == 1 else "s"}, ' \
+              f'{n_scans} input scan{"" if n_scans == 1 else "s"}, ' \
+              f'{n_joins} join{"" if n_joins == 1 else "s"}'
+    return '\n'.join([summary] + lines)
@@ -1,11 +1,32 @@
+import functools
+import re
+
 from hail import ir
+from hail.profiling import profiled
+
+
+_placeholder = re.compile('\x00([0-9]+)\x00')
 
 
 class Renderer(object):
-    def __init__(self, stop_at_jir=False):
+    """Renders IR to its text representation.
+
+    Rendering does not recurse: when called from within a ``render`` method,
+    the renderer returns a placeholder for the child and records it, and the
+    placeholders are expanded with an explicit stack. Rendering time is
+    linear in the length of the text, and IR of any depth can be rendered.
+
+    If `literal_files` is true, large literals are written to local files
+    and rendered as references to them (see :class:`.Literal`), for a
+    backend whose parser runs on this machine.
+    """
+
+    def __init__(self, stop_at_jir=False, literal_files=False):
         self.stop_at_jir = stop_at_jir
+        self.literal_files = literal_files
         self.count = 0
         self.jirs = {}
+        self._deferred = None
 
     def add_jir(self, jir):
         jir_id = f'm{self.count}'
@@ -13,17 +34,339 @@ class Renderer(object):
         self.jirs[jir_id] = jir
         return jir_id
 
+    @profiled('render', size=lambda text, self, x: len(text))
     def __call__(self, x):
+        if self._deferred is not None:
+            self._deferred.append(self._task(x))
+            return f'\x00{len(self._deferred) - 1}\x00'
+        return ''.join(self.chunks(x))
+
+    def chunks(self, x):
+        """Generate the text of `x` in chunks."""
+        stack = [self._task(x)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                yield item
+            else:
+                stack.extend(reversed(item()))
+
+    def write(self, x, out):
+        """Write the text of `x` to the file-like object `out`."""
+        for chunk in self.chunks(x):
+            out.write(chunk)
+
+    def _task(self, x):
+        """Rendered text of `x`, or a callable returning the pieces of its text."""
+        return functools.partial(self._expand, x)
+
+    def _expand(self, x):
         if self.stop_at_jir and hasattr(x, '_jir'):
             jir_id = self.add_jir(x._jir)
             if isinstance(x, ir.MatrixIR):
-                return f'(JavaMatrix {jir_id})'
+                return [f'(JavaMatrix {jir_id})']
             elif isinstance(x, ir.TableIR):
-                return f'(JavaTable {jir_id})'
+                return [f'(JavaTable {jir_id})']
             elif isinstance(x, ir.BlockMatrixIR):
-                return f'(JavaBlockMatrix {jir_id})'
+                return [f'(JavaBlockMatrix {jir_id})']
             else:
                 assert isinstance(x, ir.IR)
-                return f'(JavaIR {jir_id})'
+                return [f'(JavaIR {jir_id})']
         else:
-            return x.render(self)
+            return self._template(x)
+
+    def _template(self, x):
+        """Pieces of ``x.render(self)``, with its children left unexpanded."""
+        outer = self._deferred
+        self._deferred = []
+        try:
+            text = x.render(self)
+            deferred = self._deferred
+        finally:
+            self._deferred = outer
+        if not deferred:
+            return [text]
+        pieces = _placeholder.split(text)
+        pieces[1::2] = [deferred[int(i)] for i in pieces[1::2]]
+        return pieces
+
+
+class _NodeInfo(object):
+    __slots__ = ['node', 'children', 'free_vars', 'has_agg', 'pure', 'bindable']
+
+    def __init__(self, node, children, free_vars, has_agg, pure, bindable):
+        self.node = node
+        self.children = children
+        self.free_vars = free_vars
+        self.has_agg = has_agg
+        self.pure = pure
+        self.bindable = bindable
+
+
+class _KeyRenderer(object):
+    """Renders a single node, with its value IR children replaced by their canonical ids."""
+
+    def __init__(self, cse):
+        self.cse = cse
+        self.literal_files = cse.literal_files
+
+    def __call__(self, x):
+        if isinstance(x, ir.IR):
+            return f'#{self.cse._canonical(x)}'
+        return f'@{id(x)}'
+
+    def add_jir(self, jir):
+        return f'@{id(jir)}'
+
+
+def _starts_scope(node, i):
+    return (node.renderable_new_block(i)
+            or node.renderable_new_env(i)
+            or len(node.renderable_bindings(i)) > 0)
+
+
+class _Env(object):
+    """Canonical ids bound to names in a scope.
+
+    Environments made by successive bindings in one scope share a dict;
+    `limit` hides the bindings made after this environment.
+    """
+    __slots__ = ['bindings', 'limit']
+
+    def __init__(self, bindings=None, limit=0):
+        self.bindings = {} if bindings is None else bindings
+        self.limit = limit
+
+    def get(self, c):
+        b = self.bindings.get(c)
+        if b is not None and b[1] < self.limit:
+            return b[0]
+        return None
+
+    def items(self):
+        return ((c, name) for c, (name, i) in self.bindings.items() if i < self.limit)
+
+    def filter(self, f):
+        return _Env({c: (name, i) for c, (name, i) in self.bindings.items() if i < self.limit and f(c)},
+                    self.limit)
+
+    def bind(self, c, name):
+        self.bindings[c] = (name, self.limit)
+        return _Env(self.bindings, self.limit + 1)
+
+
+class _Frame(object):
+    __slots__ = ['node', 'env', 'child_scopes']
+
+    def __init__(self, node, env):
+        self.node = node
+        self.env = env
+        self.child_scopes = None
+
+    def scope_of(self, x):
+        """(bound names, starts a scope, new environment) of child `x`."""
+        if self.child_scopes is None:
+            self.child_scopes = {}
+            for i, child in enumerate(self.node.children):
+                names, scope, new_env = self.child_scopes.get(id(child), (frozenset(), False, False))
+                self.child_scopes[id(child)] = (names | self.node.renderable_bindings(i),
+                                                scope or _starts_scope(self.node, i),
+                                                new_env or self.node.renderable_new_env(i))
+        return self.child_scopes.get(id(x), (frozenset(), False, False))
+
+
+def _is_effectful(x):
+    return isinstance(x, (ir.ApplySeeded, ir.TableWrite, ir.TableExport, ir.MatrixWrite,
+                          ir.MatrixMultiWrite, ir.BlockMatrixWrite, ir.TableToValueApply,
+                          ir.MatrixToValueApply))
+
+
+def _is_bindable(x):
+    return not isinstance(x, (ir.Ref, ir.Begin, ir.ArrayFor, ir.Die, ir.Join))
+
+
+class CSERenderer(Renderer):
+    """Renderer that emits every distinct value IR subtree at most once per scope.
+
+    Subtrees of a value IR that are identical (the same object, or
+    structurally equal) and are rendered more than once in the same
+    evaluation scope are bound with a ``Let`` at the root of that scope, and
+    every occurrence is rendered as a ``Ref`` to the binding. The rendered
+    text is therefore linear in the number of distinct nodes rather than in
+    the size of the expanded tree.
+
+    A scope is a value IR reached from a relational node, or a child that its
+    parent binds names in, evaluates conditionally or repeatedly, or evaluates
+    in a different environment (see :meth:`.IR.renderable_bindings`,
+    :meth:`.IR.renderable_new_block` and :meth:`.IR.renderable_new_env`).
+    Subtrees that draw random numbers or have side effects are never bound,
+    and relational nodes are never shared.
+    """
+
+    def __init__(self, stop_at_jir=False, literal_files=False):
+        super().__init__(stop_at_jir, literal_files)
+        self.uid_count = 0
+        self._ids = {}
+        self._keys = {}
+        self._info = []
+        self._frames = []
+        self._plans = {}
+
+    def _uid(self):
+        self.uid_count += 1
+        return f'__cse_{self.uid_count}'
+
+    def _canonical(self, x):
+        """Canonical id of `x`; structurally equal nodes share an id.
+
+        Ids are assigned in post-order, so a node's id is larger than the ids
+        of all of its descendants.
+        """
+        c = self._ids.get(id(x))
+        if c is not None:
+            return c
+
+        stack = [x]
+        while stack:
+            y = stack[-1]
+            if id(y) in self._ids:
+                stack.pop()
+                continue
+            if not (self.stop_at_jir and hasattr(y, '_jir')):
+                pending = [child for child in y.children
+                           if isinstance(child, ir.IR) and id(child) not in self._ids]
+                if pending:
+                    stack.extend(pending)
+                    continue
+            stack.pop()
+            self._ids[id(y)] = self._assign_canonical(y)
+        return self._ids[id(x)]
+
+    def _assign_canonical(self, x):
+        if self.stop_at_jir and hasattr(x, '_jir'):
+            key = f'JavaIR @{id(x._jir)}'
+            children = []
+        else:
+            key = f'{type(x).__name__} {x.render(_KeyRenderer(self))}'
+            children = [(i, self._canonical(child))
+                        for i, child in enumerate(x.children)
+                        if isinstance(child, ir.IR)]
+
+        c = self._keys.get(key)
+        if c is None:
+            infos = [self._info[child] for _, child in children]
+            if isinstance(x, ir.Ref):
+                free_vars = frozenset({x.name})
+            else:
+                free_vars = frozenset(v
+                                      for (i, _), info in zip(children, infos)
+                                      for v in info.free_vars - x.renderable_bindings(i))
+            has_agg = (isinstance(x, ir.BaseApplyAggOp)
+                       or any(x.uses_agg_context(i) or info.has_agg for (i, _), info in zip(children, infos)))
+            pure = not _is_effectful(x) and all(info.pure for info in infos)
+            bindable = (pure
+                        and (len(children) > 0 or isinstance(x, ir.Literal))
+                        and _is_bindable(x))
+            c = len(self._info)
+            self._info.append(_NodeInfo(x, children, free_vars, has_agg, pure, bindable))
+            self._keys[key] = c
+        return c
+
+    def _plan(self, root, env):
+        """Nodes to bind at the root of the scope `root`, in binding order.
+
+        A node is bound if it would otherwise be rendered more than once in
+        `root`, not counting children that start their own scope, and it is
+        not already bound in `env` by an enclosing scope.
+        """
+        env = frozenset(c for c, _ in env.items())
+        plan_key = (root, env)
+        plan = self._plans.get(plan_key)
+        if plan is not None:
+            return plan
+
+        parents = {root: []}
+        stack = [root]
+        while stack:
+            c = stack.pop()
+            info = self._info[c]
+            for i, child in info.children:
+                if _starts_scope(info.node, i) or child in env:
+                    continue
+                if child not in parents:
+                    parents[child] = []
+                    stack.append(child)
+                parents[child].append(c)
+
+        # ids are in post-order, so this visits parents before their children
+        n_renders = {root: 1}
+        bound = set()
+        for c in sorted(parents, reverse=True):
+            if c == root:
+                continue
+            n = sum(1 if p in bound else n_renders[p] for p in parents[c])
+            info = self._info[c]
+            if n > 1 and info.bindable:
+                bound.add(c)
+                n = 1
+            n_renders[c] = n
+
+        plan = sorted(bound)
+        self._plans[plan_key] = plan
+        return plan
+
+    def _expand_node(self, x, env):
+        self._frames.append(_Frame(x, env))
+        try:
+            return self._template(x)
+        finally:
+            self._frames.pop()
+
+    def _expand_scope(self, x, env):
+        # `env` is not shared with any other scope, so bindings can extend it
+        pieces = []
+        plan = self._plan(self._canonical(x), env)
+        for b in plan:
+            name = self._uid()
+            pieces.append(f'(Let {name} ')
+            pieces.append(functools.partial(self._expand_node, self._info[b].node, env))
+            pieces.append(' ')
+            env = env.bind(b, name)
+        pieces.append(functools.partial(self._expand_node, x, env))
+        pieces.append(')' * len(plan))
+        return pieces
+
+    def _expand_relational(self, x):
+        # value IRs below a relational node start from an empty scope
+        self._frames.append(None)
+        try:
+            return self._expand(x)
+        finally:
+            self._frames.pop()
+
+    def _task(self, x):
+        if not isinstance(x, ir.IR) or (self.stop_at_jir and hasattr(x, '_jir')):
+            return functools.partial(self._expand_relational, x)
+
+        frame = self._frames[-1] if self._frames else None
+        if frame is None:
+            return functools.partial(self._expand_scope, x, _Env())
+
+        names, scope, new_env = frame.scope_of(x)
+        if new_env:
+            env = _Env()
+        elif scope:
+            # the non-aggregation children of AggFilter, AggExplode, etc.
+            # give a different meaning to the aggregations below them
+            agg_node = any(frame.node.uses_agg_context(i) for i in range(len(frame.node.children)))
+            env = frame.env.filter(lambda c: not (self._info[c].free_vars & names)
+                                   and not (agg_node and self._info[c].has_agg))
+        else:
+            env = frame.env
+
+        name = env.get(self._canonical(x))
+        if name is not None:
+            return f'(Ref {name})'
+        if scope:
+            return functools.partial(self._expand_scope, x, env)
+        return functools.partial(self._expand_node, x, env)
@@ -182,7 +182,10 @@ class TableRead(TableIR):
         return f'(TableRead None {self.drop_rows} "{r(self.reader)}")'
 
     def _compute_type(self):
-        self._type = Env.backend().table_type(self)
+        if isinstance(self.reader, hl.ir.TableNativeReader):
+            self._type = Env.backend()._read_type(self, self.reader.path)
+        else:
+            self._type = Env.backend().table_type(self)
 
 
 class TableImport(TableIR):
@@ -198,6 +201,9 @@ class TableImport(TableIR):
             self._typ._parsable_string(),
             escape_str(json.dumps(self.reader_options)))
 
+    def _input_files(self):
+        return list(self.paths)
+
     def _compute_type(self):
         self._type = Env.backend().table_type(self)
 
@@ -3,6 +3,7 @@ import json
 
 from hail.typecheck import *
 from hail.utils.java import escape_str
+from hail.utils.hadoop_utils import hadoop_open
 from hail.ir.utils import make_filter_and_replace
 
 class TableReader(object):
@@ -14,6 +15,17 @@ class TableReader(object):
     def __eq__(self, other):
         pass
 
+    def _input_files(self):
+        """Paths of the files whose modification marks a change of the data
+        read, or ``None`` if they are not known."""
+        return None
+
+
+def _read_partition_counts(path):
+    with hadoop_open(path + '/metadata.json.gz', 'rb') as f:
+        metadata = json.loads(f.read())
+    return metadata['components']['partition_counts']['counts']
+
 
 class TableNativeReader(TableReader):
     @typecheck_method(path=str)
@@ -25,6 +37,13 @@ class TableNativeReader(TableReader):
                   'path': self.path}
         return escape_str(json.dumps(reader))
 
+    def _input_files(self):
+        return [self.path + '/_SUCCESS']
+
+    def _partition_counts(self):
+        """Number of rows of each partition, from the metadata of the table."""
+        return _read_partition_counts(self.path)
+
     def __eq__(self, other):
         return isinstance(other, TableNativeReader) and \
                other.path == self.path
@@ -53,6 +72,9 @@ class TextTableReader(TableReader):
                   'options': self.config}
         return escape_str(json.dumps(reader))
 
+    def _input_files(self):
+        return list(self.config['files'])
+
     def __eq__(self, other):
         return isinstance(other, TextTableReader) and \
                other.config == self.config
@@ -6,7 +6,7 @@ import hail as hl
 import hail.expr.aggregators as agg
 from hail.expr import construct_expr
 from hail.ir import BlockMatrixWrite, BlockMatrixMap2, ApplyBinaryOp, Ref, F64, \
-    BlockMatrixBroadcast, ValueToBlockMatrix, MakeArray, BlockMatrixRead, JavaBlockMatrix, BlockMatrixMap,\
+    BlockMatrixBroadcast, ValueToBlockMatrix, BlockMatrixRead, JavaBlockMatrix, BlockMatrixMap,\
     ApplyUnaryOp, IR, BlockMatrixDot, tensor_shape_to_matrix_shape
 from hail.utils import new_temp_file, new_local_temp_file, local_path_uri, storage_level
 from hail.utils.java import Env, jarray, joption
@@ -2102,7 +2102,7 @@ def _to_bmir(x, block_size):
     if _is_scalar(x):
         return ValueToBlockMatrix(F64(x), [1, 1], block_size, [True, True])
     else:
-        return ValueToBlockMatrix(_ndarray_to_makearray(x), list(_ndarray_as_2d(x).shape),
+        return ValueToBlockMatrix(_ndarray_to_literal(x), list(_ndarray_as_2d(x).shape),
                                   block_size, [True, True])
 
 
@@ -2112,16 +2112,10 @@ def _broadcast_to_shape(bmir, result_shape):
                                 bmir.typ.block_size, [True for _ in result_shape])
 
 
-def _ndarray_to_makearray(ndarray):
-    data = ndarray.tolist()
-
+def _ndarray_to_literal(ndarray):
     # Flatten in the case of 2-D arrays. Would have to be flattened
     # and reshaped anyway to construct a BlockMatrix
-    if len(ndarray.shape) == 2:
-        data = [x for row in data for x in row]
-
-    data_as_ir = [F64(x) for x in data]
-    return MakeArray(data_as_ir, hl.tarray(hl.tfloat64))
+    return hl.literal(np.asarray(ndarray).ravel(), hl.tarray(hl.tfloat64))._ir
 
 
 def _broadcast_index_expr(bmir_shape, is_row_vector):
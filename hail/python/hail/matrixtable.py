@@ -10,6 +10,7 @@ from hail.expr.types import *
 from hail.expr.table_type import *
 from hail.expr.matrix_type import *
 from hail.ir import *
+from hail.ir.plan import plan, format_plan
 from hail.table import Table, ExprContainer
 from hail.typecheck import *
 from hail.utils import storage_level, LinkedList
@@ -2150,9 +2151,10 @@ class MatrixTable(ExprContainer):
     @typecheck_method(output=str,
                       overwrite=bool,
                       stage_locally=bool,
-                      _codec_spec=nullable(str))
+                      _codec_spec=nullable(str),
+                      _async=bool)
     def write(self, output: str, overwrite: bool = False, stage_locally: bool = False,
-              _codec_spec: Optional[str] = None):
+              _codec_spec: Optional[str] = None, _async: bool = False):
         """Write to disk.
 
         Examples
@@ -2176,7 +2178,10 @@ class MatrixTable(ExprContainer):
         """
 
         writer = MatrixNativeWriter(output, overwrite, stage_locally, _codec_spec)
-        Env.backend().execute(MatrixWrite(self._mir, writer))
+        write_ir = MatrixWrite(self._mir, writer)
+        if _async:
+            return Env.backend().execute_async(write_ir)
+        Env.backend().execute(write_ir)
 
     def globals_table(self) -> Table:
         """Returns a table with a single row with the globals of the matrix table.
@@ -2283,6 +2288,47 @@ class MatrixTable(ExprContainer):
 
         return Table(MatrixEntriesTable(self._mir))
 
+    @typecheck_method(fields=str,
+                      named_exprs=expr_any)
+    def collect_entry_columns(self, *fields, **named_exprs):
+        """Collect fields of the entries of the matrix into a dictionary of NumPy arrays.
+
+        Examples
+        --------
+        Collect the genotype quality and the sample ID of each entry:
+
+        >>> columns = dataset.collect_entry_columns('GQ', 's', dp=dataset.DP)
+
+        Notes
+        -----
+        `fields` are names of row, column or entry fields, and `named_exprs`
+        are expressions of the matrix. Arrays have one element per entry, in
+        row-major order. See :meth:`.Table.collect_columns` for the arrays
+        of each type.
+
+        Warning
+        -------
+        Using this method can cause out of memory errors. Only collect small matrices.
+
+        Parameters
+        ----------
+        fields : varargs of :obj:`str`
+            Fields to collect.
+        named_exprs : keyword args of :class:`.Expression`
+            Computed fields to collect.
+
+        Returns
+        -------
+        :obj:`dict` of :obj:`str` to :class:`numpy.ndarray`
+            Array of the values of each field.
+        """
+        exprs = {f: self[f] for f in fields}
+        exprs.update(named_exprs)
+        uid = Env.get_uid()
+        mt = self.select_entries(**{uid: hl.struct(**exprs)}).select_rows().select_cols()
+        ht = mt.key_cols_by().entries().key_by()
+        return ht.select(**ht[uid]).collect_columns()
+
     def index_globals(self) -> Expression:
         """Return this matrix table's global variables for use in another
         expression context.
@@ -2762,6 +2808,42 @@ class MatrixTable(ExprContainer):
                                                               e=entry_fields)
         handler(s)
 
+    @typecheck_method(optimized=bool, handler=anyfunc)
+    def explain(self, optimized=False, handler=print):
+        """Print the plan of the pipeline computing this matrix table, with estimated costs.
+
+        Examples
+        --------
+
+        >>> dataset.explain()  # doctest: +SKIP
+        0 shuffles, 1 input scan, 1 join
+        MatrixAnnotateRowsTable (rows=<=346 cols=100 partitions=4 row_key=['locus', 'alleles']) [left join, repartitions the right table]
+          MatrixFilterRows (rows=<=346 cols=100 partitions=4 row_key=['locus', 'alleles'])
+            MatrixRead (rows=346 cols=100 partitions=4 row_key=['locus', 'alleles']) [scan data/example.mt]
+          TableRead (rows=346 partitions=1 key=['locus', 'alleles']) [scan data/annotations.ht]
+
+        Notes
+        -----
+        The plan is printed in the format described in :meth:`.Table.explain`,
+        with the estimated number of columns of each matrix table step. Rows
+        are shuffled by :meth:`.key_rows_by` to fields that do not start with
+        the current row key; annotating rows or columns with another dataset
+        joins it, and the joined table is repartitioned or collected.
+
+        Parameters
+        ----------
+        optimized : :obj:`bool`
+            If true, also print the pipeline as optimized by the backend.
+        handler : function
+            Function called with the text of the plan.
+        """
+        text = format_plan(plan(self._mir))
+        if optimized:
+            optimized_ir = Env.backend()._optimized_ir(self._mir)
+            if optimized_ir is not None:
+                text += '\n\nOptimized IR:\n' + optimized_ir
+        handler(text)
+
     @typecheck_method(indices=sequenceof(int))
     def choose_cols(self, indices: List[int]) -> 'MatrixTable':
         """Choose a new set of columns from a list of old column indices.
@@ -12,11 +12,21 @@ from hail.expr.expressions import *
 from hail.expr.expressions import Expression
 from hail.typecheck import *
 from hail import Table
+from hail.utils.java import Env
 import hail
 
 palette = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
 
 
+def _collect_columns(**exprs):
+    """Collect expressions with the same source into NumPy arrays, with missing numbers as NaN."""
+    uid = Env.get_uid()
+    t = hail.struct(**exprs)._to_table(uid).key_by()
+    columns = t.select(**t[uid]).collect_columns()
+    return {k: np.ma.filled(v.astype(np.float64), np.nan) if isinstance(v, np.ma.MaskedArray) else v
+            for k, v in columns.items()}
+
+
 def output_notebook():
     """Configure the Bokeh output state to generate output in notebook
     cells when :func:`show` is called.  Calls
@@ -310,21 +320,22 @@ def histogram2d(x, y, bins=40, range=None,
     return p
 
 
-@typecheck(x=oneof(sequenceof(numeric), expr_float64), y=oneof(sequenceof(numeric), expr_float64),
-           label=oneof(nullable(str), expr_str, sequenceof(str)), title=nullable(str),
+@typecheck(x=oneof(sequenceof(numeric), np.ndarray, expr_float64), y=oneof(sequenceof(numeric), np.ndarray, expr_float64),
+           label=oneof(nullable(str), expr_str, sequenceof(str), np.ndarray), title=nullable(str),
            xlabel=nullable(str), ylabel=nullable(str), size=int, legend=bool,
-           source_fields=nullable(dictof(str, sequenceof(anytype))), collect_all=nullable(bool), n_divisions=int)
+           source_fields=nullable(dictof(str, oneof(sequenceof(anytype), np.ndarray))), collect_all=nullable(bool),
+           n_divisions=int)
 def scatter(x, y, label=None, title=None, xlabel=None, ylabel=None, size=4, legend=True,
             collect_all=False, n_divisions=500, source_fields=None):
     """Create a scatterplot.
 
     Parameters
     ----------
-    x : List[float] or :class:`.Float64Expression`
+    x : List[float], :class:`numpy.ndarray` or :class:`.Float64Expression`
         List of x-values to be plotted.
-    y : List[float] or :class:`.Float64Expression`
+    y : List[float], :class:`numpy.ndarray` or :class:`.Float64Expression`
         List of y-values to be plotted.
-    label : List[str] or :class:`.StringExpression`
+    label : List[str], :class:`numpy.ndarray` or :class:`.StringExpression`
         List of labels for x and y values, used to assign each point a label (e.g. population)
     title : str
         Title of the scatterplot.
@@ -350,19 +361,18 @@ def scatter(x, y, label=None, title=None, xlabel=None, ylabel=None, size=4, lege
     """
     if isinstance(x, Expression) and isinstance(y, Expression):
         agg_f = x._aggregation_method()
-        if isinstance(label, Expression):
-            if collect_all:
-                res = hail.tuple([x, y, label]).collect()
-                label = [point[2] for point in res]
+        if collect_all:
+            if isinstance(label, Expression):
+                columns = _collect_columns(x=x, y=y, label=label)
+                label = columns['label']
             else:
+                columns = _collect_columns(x=x, y=y)
+            x = columns['x']
+            y = columns['y']
+        else:
+            if isinstance(label, Expression):
                 res = agg_f(aggregators.downsample(x, y, label=label, n_divisions=n_divisions))
                 label = [point[2][0] for point in res]
-
-            x = [point[0] for point in res]
-            y = [point[1] for point in res]
-        else:
-            if collect_all:
-                res = hail.tuple([x, y]).collect()
             else:
                 res = agg_f(aggregators.downsample(x, y, n_divisions=n_divisions))
 
@@ -427,10 +437,10 @@ def qq(pvals, collect_all=False, n_divisions=500):
         source = pvals._indices.source
         if source is not None:
             if collect_all:
-                pvals = pvals.collect()
-                spvals = sorted(filter(lambda x: x and not(isnan(x)), pvals))
-                exp = [-log(float(i) / len(spvals), 10) for i in np.arange(1, len(spvals) + 1, 1)]
-                obs = [-log(p, 10) for p in spvals]
+                pvals = _collect_columns(pval=pvals)['pval']
+                spvals = np.sort(pvals[(pvals != 0) & ~np.isnan(pvals)])
+                exp = -np.log10(np.arange(1, len(spvals) + 1) / len(spvals))
+                obs = -np.log10(spvals)
             else:
                 if isinstance(source, Table):
                     ht = source.select(pval=pvals).key_by().persist().key_by('pval')
@@ -455,7 +465,7 @@ def qq(pvals, collect_all=False, n_divisions=500):
         x_axis_label='Expected p-value (-log10 scale)',
         y_axis_label='Observed p-value (-log10 scale)')
     p.scatter(x=exp, y=obs, color='black')
-    bound = max(max(exp), max(obs)) * 1.1
+    bound = max(np.max(exp), np.max(obs)) * 1.1
     p.line([0, bound], [0, bound], color='red')
     return p
 
@@ -514,10 +524,12 @@ def manhattan(pvals, locus=None, title=None, size=4, hover_fields=None, collect_
     pvals = -hail.log10(pvals)
 
     if collect_all:
-        res = hail.tuple([locus.global_position(), pvals, hail.struct(**hover_fields)]).collect()
-        hf_struct = [point[2] for point in res]
-        for key in hover_fields:
-            hover_fields[key] = [item[key] for item in hf_struct]
+        x_uid = Env.get_uid()
+        y_uid = Env.get_uid()
+        columns = _collect_columns(**{x_uid: locus.global_position(), y_uid: pvals}, **hover_fields)
+        x = columns.pop(x_uid)
+        y = columns.pop(y_uid)
+        hover_fields = columns
     else:
         agg_f = pvals._aggregation_method()
         res = agg_f(aggregators.downsample(locus.global_position(), pvals,
@@ -527,8 +539,9 @@ def manhattan(pvals, locus=None, title=None, size=4, hover_fields=None, collect_
         for idx, key in enumerate(list(hover_fields.keys())):
             hover_fields[key] = [field[idx] for field in fields]
 
-    x = [point[0] for point in res]
-    y = [point[1] for point in res]
+        x = [point[0] for point in res]
+        y = [point[1] for point in res]
+
     y_linear = [10 ** (-p) for p in y]
     hover_fields['p_value'] = y_linear
 
@@ -0,0 +1,257 @@
+import contextlib
+import functools
+import threading
+import time
+
+__all__ = ['FrontendProfile', 'profile', 'frontend_profile']
+
+# profiles collecting timings; profiling is disabled while this is empty
+_profiles = []
+
+# nesting depth of the phases being timed on each thread
+_depth = threading.local()
+
+# the profile enabled by the `profile_frontend` flag, which logs each action
+_session_profile = None
+
+
+class FrontendProfile(object):
+    """Counts, cumulative times and sizes of the phases of the Python front end.
+
+    A phase is timed from its outermost call: calls of a phase made from
+    within the same phase, such as the renderer rendering a child, are not
+    counted again. Times are inclusive, so the time of a phase includes the
+    time of the phases it calls; in particular, the ``execute`` phase covers
+    everything done by an action, including the time spent in the backend.
+
+    Phases are timed per thread, so actions run concurrently, for instance
+    with :meth:`.Backend.execute_async`, are each recorded. A per-action
+    report holds the phases recorded on the thread that ran the action since
+    its previous action; work done on another thread for the action, such
+    as building its expressions before submitting it, is reported with that
+    thread's next action instead.
+
+    The size of a phase is the number of characters of IR text rendered, or
+    the number of characters or bytes of results decoded.
+
+    Attributes
+    ----------
+    actions : :obj:`list` of :obj:`dict`
+        For each action, the phases run since the end of the previous action,
+        in the format of :meth:`phases_dict`, with keys ``'action'`` and
+        ``'seconds'`` for the action run and its total time.
+    """
+
+    def __init__(self):
+        self._phases = {}
+        # phases recorded by each thread since its last action
+        self._action_phases = {}
+        self._lock = threading.Lock()
+        self.actions = []
+
+    def _record(self, phase, seconds, size):
+        thread = threading.get_ident()
+        with self._lock:
+            for phases in (self._phases, self._action_phases.setdefault(thread, {})):
+                p = phases.get(phase)
+                if p is None:
+                    phases[phase] = [1, seconds, size]
+                else:
+                    p[0] += 1
+                    p[1] += seconds
+                    p[2] += size
+
+    def _end_action(self, action, seconds):
+        thread = threading.get_ident()
+        with self._lock:
+            report = {'action': action,
+                      'seconds': seconds,
+                      'phases': _phases_dict(self._action_phases.pop(thread, {}))}
+            self.actions.append(report)
+        return report
+
+    def phases_dict(self):
+        """Totals of each phase.
+
+        Returns
+        -------
+        :obj:`dict`
+            Dictionary from phase name to a dictionary with keys ``'count'``,
+            ``'seconds'`` and ``'size'``.
+        """
+        with self._lock:
+            return _phases_dict(self._phases)
+
+    def as_dict(self):
+        """Totals of each phase and the phases of each action.
+
+        Returns
+        -------
+        :obj:`dict`
+            Dictionary with keys ``'phases'`` (see :meth:`phases_dict`) and
+            ``'actions'`` (see :attr:`actions`).
+        """
+        return {'phases': self.phases_dict(), 'actions': list(self.actions)}
+
+    def __str__(self):
+        return _format_phases(self.phases_dict())
+
+    def __repr__(self):
+        return f'FrontendProfile(phases={len(self._phases)}, actions={len(self.actions)})'
+
+
+def _phases_dict(phases):
+    return {phase: {'count': count, 'seconds': seconds, 'size': size}
+            for phase, (count, seconds, size) in phases.items()}
+
+
+def _format_phases(phases):
+    lines = [f'{"phase":<20}{"count":>10}{"seconds":>12}{"size":>14}']
+    for phase, p in sorted(phases.items(), key=lambda item: -item[1]['seconds']):
+        lines.append(f'{phase:<20}{p["count"]:>10}{p["seconds"]:>12.4f}{p["size"]:>14}')
+    return '\n'.join(lines)
+
+
+def _format_action(report):
+    return (f"front end profile of '{report['action']}' ({report['seconds']:.4f}s):\n"
+            + _format_phases(report['phases']))
+
+
+def profiled(phase, size=None):
+    """Decorator recording the calls of the decorated function as `phase`.
+
+    Parameters
+    ----------
+    phase : :obj:`str`
+        Name of the phase.
+    size : function, optional
+        Function of the result and the arguments of a call giving the size
+        recorded for it.
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            if not _profiles:
+                return f(*args, **kwargs)
+            return _timed(phase, size, f, args, kwargs)
+        return wrapper
+    return decorator
+
+
+def _timed(phase, size, f, args, kwargs):
+    start = _start(phase)
+    if start is None:
+        return f(*args, **kwargs)
+    try:
+        result = f(*args, **kwargs)
+    finally:
+        setattr(_depth, phase, 0)
+    _record(phase, time.perf_counter() - start, size(result, *args, **kwargs) if size is not None else 0)
+    return result
+
+
+def _start(phase):
+    """Start time of a call of `phase`, or ``None`` if it is called from within `phase`.
+
+    A call given a start time must be ended with :func:`_end`.
+    """
+    if getattr(_depth, phase, 0) > 0:
+        return None
+    setattr(_depth, phase, 1)
+    return time.perf_counter()
+
+
+def _end(phase, start):
+    setattr(_depth, phase, 0)
+    _record(phase, time.perf_counter() - start, 0)
+
+
+def _record(phase, seconds, size):
+    for p in list(_profiles):
+        p._record(phase, seconds, size)
+
+
+def profiled_action(f):
+    """Decorator recording the calls of the decorated backend method as actions.
+
+    Each action closes the current action report of the profiles being
+    collected; the profile enabled by the ``profile_frontend`` flag logs it.
+    """
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        if not _profiles:
+            return f(*args, **kwargs)
+        start = _start('execute')
+        if start is None:
+            return f(*args, **kwargs)
+        try:
+            result = f(*args, **kwargs)
+        finally:
+            _depth.execute = 0
+        seconds = time.perf_counter() - start
+        for p in list(_profiles):
+            p._record('execute', seconds, 0)
+            report = p._end_action(f.__name__, seconds)
+            if p is _session_profile:
+                from hail.utils.java import info
+                info(_format_action(report))
+        return result
+    return wrapper
+
+
+@contextlib.contextmanager
+def profile():
+    """Profile the Python front end.
+
+    Examples
+    --------
+
+    >>> with hl.profile() as p:
+    ...     hl.eval(hl.sum(hl.range(100)))
+    >>> p.as_dict()['phases']['render']['count']  # doctest: +SKIP
+    1
+
+    Notes
+    -----
+    Within the ``with`` block, Hail records the number of calls and the
+    cumulative time of the phases of the Python front end: building
+    expressions (``construct_expr``), checking arguments (``typecheck``),
+    parsing types (``dtype``), rendering IR (``render``), converting IR to
+    the backend's representation (``to_java_ir``), asking the backend for IR
+    types (``infer_type``), decoding results (``from_json`` and
+    ``from_binary``), and running actions (``execute``). The profile is
+    also split by action.
+
+    Setting the ``profile_frontend`` flag with :func:`._set_flags` profiles
+    the whole session, and logs the profile of each action.
+
+    Returns
+    -------
+    :class:`.FrontendProfile`
+    """
+    p = FrontendProfile()
+    _profiles.append(p)
+    try:
+        yield p
+    finally:
+        _profiles.remove(p)
+
+
+def frontend_profile():
+    """The profile enabled by the ``profile_frontend`` flag, or ``None``.
+
+    Returns
+    -------
+    :class:`.FrontendProfile` or :obj:`None`
+    """
+    return _session_profile
+
+
+def _set_profile_frontend(enabled):
+    global _session_profile
+    if enabled and _session_profile is None:
+        _session_profile = FrontendProfile()
+        _profiles.append(_session_profile)
+    elif not enabled and _session_profile is not None:
+        _profiles.remove(_session_profile)
+        _session_profile = None
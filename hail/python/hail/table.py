@@ -1,3 +1,6 @@
+import concurrent.futures
+import math
+import numpy as np
 import pandas
 import pyspark
 import warnings
@@ -6,17 +9,24 @@ from typing import *
 
 import hail as hl
 from hail.expr.expressions import *
+from hail.expr.expressions.base_expression import _primitive_element_type, _holds_primitive_values
+from hail.expr.functions import _numpy_literal_value
 from hail.expr.types import *
+from hail.expr.types import _numpy_dtypes, _numpy_element_type
 from hail.expr.table_type import *
 from hail.expr.matrix_type import *
 from hail.ir import *
+from hail.ir.ir import _literal_file
+from hail.ir.plan import plan, format_plan, source_partition_counts
 from hail.typecheck import *
 from hail.utils import wrap_to_list, storage_level, LinkedList, Struct
 from hail.utils.java import *
 from hail.utils.misc import *
 
-from collections import OrderedDict, Counter
+from collections import OrderedDict, Counter, deque
+from collections.abc import Mapping
 import itertools
+import random
 
 table_type = lazy()
 
@@ -419,6 +429,70 @@ class Table(ExprContainer):
         """
         return Env.backend().execute(TableCount(self._tir))
 
+    @typecheck_method(fraction=numeric,
+                      seed=nullable(int))
+    def approx_count(self, fraction=0.05, seed=None):
+        """Estimate the number of rows in the table from a subset of its partitions.
+
+        Examples
+        --------
+
+        >>> table1.approx_count()
+        4
+
+        Notes
+        -----
+
+        If the number of rows is known without running the pipeline, for
+        instance for a table read from a file with no filter applied, the
+        row counts stored with the file are returned and no job is run.
+
+        Otherwise, the rows of a random subset of ``fraction`` of the
+        partitions (and at least one) are counted, and the count is scaled up
+        to the whole table. When the partitions of the table are those of the
+        file it was read from, the count is scaled by the number of rows the
+        file stores in the sampled partitions, otherwise by the number of
+        partitions sampled. The estimate is exact if all partitions are
+        sampled.
+
+        Parameters
+        ----------
+        fraction : :obj:`float`
+            Fraction of the partitions to count.
+        seed : :obj:`int`, optional
+            Random seed for choosing the partitions.
+
+        Returns
+        -------
+        :obj:`int`
+        """
+        if not (0 < fraction <= 1):
+            raise ValueError("Requires 'fraction' in (0,1]. Found fraction={}".format(fraction))
+
+        root = plan(self._tir)
+        if root.estimate.rows is not None and root.estimate.rows_exact:
+            return root.estimate.rows
+
+        parts = self._sample_partition_indices(fraction, seed)
+        if parts is None:
+            return self.count()
+        sampled = self._filter_partitions(parts).count()
+
+        counts = source_partition_counts(root)
+        if counts is not None and len(counts) == self.n_partitions():
+            stored = sum(counts[i] for i in parts)
+            if stored > 0:
+                return round(sampled * sum(counts) / stored)
+        return round(sampled * self.n_partitions() / len(parts))
+
+    def _sample_partition_indices(self, fraction, seed):
+        """Sorted random indices of ``fraction`` of the partitions, or ``None`` if that is all of them."""
+        n = self.n_partitions()
+        k = max(1, math.ceil(fraction * n))
+        if k >= n:
+            return None
+        return sorted(random.Random(seed).sample(range(n), k))
+
     def _force_count(self):
         return Env.backend().execute(TableToValueApply(self._tir, {'name': 'ForceCountTable'}))
 
@@ -451,14 +525,27 @@ class Table(ExprContainer):
         >>> table = hl.Table.parallelize(hl.literal(a, 'array<struct{a: int, b: int}>'))
         >>> table.show()
 
-        Warning
-        -------
-        Parallelizing very large local arrays will be slow.
+        Parallelize a NumPy record array:
+
+        >>> a = np.array([(5, 0.5), (0, 1.5)], dtype=[('a', 'i4'), ('b', 'f8')])
+        >>> table = hl.Table.parallelize(a)
+
+        Notes
+        -----
+        Large lists of rows, :class:`pandas.DataFrame` and NumPy record arrays
+        are split into chunks, which are encoded in parallel and passed to the
+        backend in local files, one partition per chunk. The fields of a
+        record array or data frame with numeric or Boolean columns are
+        encoded without visiting the rows in Python. If `schema` is not
+        given, the types of the fields of a record array or data frame are
+        those of its columns; columns of other objects take the type of
+        their values.
 
         Parameters
         ----------
         rows
-            List of row values, or expression of type ``array<struct{...}>``.
+            List of row values, :class:`pandas.DataFrame`, NumPy record array,
+            or expression of type ``array<struct{...}>``.
         schema : str or :class:`.HailType:`, optional
             Value type.
         key : Union[str, List[str]]], optional
@@ -469,16 +556,36 @@ class Table(ExprContainer):
         -------
         :class:`.Table`
         """
+        if isinstance(rows, pandas.DataFrame):
+            rows = rows.to_records(index=False)
+        if isinstance(rows, np.ndarray):
+            if rows.dtype.names is None:
+                raise TypeError("'parallelize' expects a NumPy record array, found an array of dtype '{}'"
+                                .format(rows.dtype))
+            if schema is None:
+                schema = _records_row_type(rows)
+            table = Table(_parallelize_chunks(_records_value(rows, schema), hl.tarray(schema), n_partitions))
+        elif isinstance(rows, list) and len(rows) > _parallelize_chunk_rows and None not in rows:
+            dtype = hl.tarray(schema) if schema is not None else impute_type(rows)
+            if not isinstance(dtype.element_type, tstruct):
+                raise TypeError("'parallelize' expects an array with element type 'struct', found '{}'"
+                                .format(dtype))
+            table = Table(_parallelize_chunks(_rows_records(rows, dtype.element_type), dtype, n_partitions))
+        else:
+            table = cls._parallelize_expr(rows, schema, n_partitions)
+        if key is not None:
+            table = table.key_by(*key)
+        return table
+
+    @classmethod
+    def _parallelize_expr(cls, rows, schema, n_partitions):
         rows = to_expr(rows, dtype=hl.tarray(schema) if schema is not None else None)
         if not isinstance(rows.dtype.element_type, tstruct):
             raise TypeError("'parallelize' expects an array with element type 'struct', found '{}'"
                             .format(rows.dtype))
-        table = Table(TableParallelize(MakeStruct([
+        return Table(TableParallelize(MakeStruct([
             ('rows', rows._ir),
             ('global', MakeStruct([]))]), n_partitions))
-        if key is not None:
-            table = table.key_by(*key)
-        return table
 
     @typecheck_method(keys=oneof(str, expr_any),
                       named_keys=expr_any)
@@ -1142,9 +1249,10 @@ class Table(ExprContainer):
     @typecheck_method(output=str,
                       overwrite=bool,
                       stage_locally=bool,
-                      _codec_spec=nullable(str))
+                      _codec_spec=nullable(str),
+                      _async=bool)
     def write(self, output: str, overwrite = False, stage_locally: bool = False,
-              _codec_spec: Optional[str] = None):
+              _codec_spec: Optional[str] = None, _async: bool = False):
         """Write to disk.
 
         Examples
@@ -1167,7 +1275,10 @@ class Table(ExprContainer):
             If ``True``, overwrite an existing file at the destination.
         """
 
-        Env.backend().execute(TableWrite(self._tir, output, overwrite, stage_locally, _codec_spec))
+        write_ir = TableWrite(self._tir, output, overwrite, stage_locally, _codec_spec)
+        if _async:
+            return Env.backend().execute_async(write_ir)
+        Env.backend().execute(write_ir)
 
     def _show(self, n, width, truncate, types):
         width = max(width, 8)
@@ -1664,8 +1775,8 @@ class Table(ExprContainer):
         """
         return Env.backend().unpersist_table(self)
 
-    @typecheck_method(_localize=bool)
-    def collect(self, _localize=True):
+    @typecheck_method(_localize=bool, _stream=bool)
+    def collect(self, _localize=True, _stream=False):
         """Collect the rows of the table into a local list.
 
         Examples
@@ -1683,12 +1794,15 @@ class Table(ExprContainer):
         Warning
         -------
         Using this method can cause out of memory errors. Only collect small tables.
+        Use :meth:`.iter_rows` to visit the rows of a large table.
 
         Returns
         -------
         :obj:`list` of :class:`.Struct`
             List of rows.
         """
+        if _stream:
+            return self.iter_rows()
         ir = GetField(TableCollect(self._tir), 'rows')
         e = construct_expr(ir, hl.tarray(self.row.dtype))
         if _localize:
@@ -1696,6 +1810,118 @@ class Table(ExprContainer):
         else:
             return e
 
+    @typecheck_method(batch_size=int, prefetch=int)
+    def iter_rows(self, batch_size=1, prefetch=1):
+        """Iterate over the rows of the table, collecting a few partitions at a time.
+
+        Examples
+        --------
+        Sum a field without holding the table in memory:
+
+        >>> total = sum(row.X for row in table1.iter_rows())
+
+        Notes
+        -----
+        The rows are collected `batch_size` partitions at a time, in order,
+        and `prefetch` further batches are collected in the background while
+        the current batch is consumed. At most ``batch_size * (prefetch + 1)``
+        partitions are held in memory at once, however many rows the table
+        has.
+
+        Each batch is computed separately, so the pipeline producing the
+        table runs once per batch. If the table is expensive to compute,
+        :meth:`.checkpoint` it before iterating.
+
+        Parameters
+        ----------
+        batch_size : :obj:`int`
+            Number of partitions to collect at a time.
+        prefetch : :obj:`int`
+            Number of batches to collect ahead of the consumer.
+
+        Returns
+        -------
+        iterator of :class:`.Struct`
+            Rows, in order.
+        """
+        if batch_size < 1:
+            raise ValueError(f"'iter_rows': 'batch_size' must be positive, found {batch_size}")
+        if prefetch < 0:
+            raise ValueError(f"'iter_rows': 'prefetch' must be non-negative, found {prefetch}")
+
+        n_partitions = self.n_partitions()
+        backend = Env.backend()
+
+        def fetch(start):
+            parts = list(range(start, min(start + batch_size, n_partitions)))
+            batch = self._filter_partitions(parts).collect(_localize=False)
+            return backend.execute_async(batch._ir)
+
+        def rows():
+            starts = iter(range(0, n_partitions, batch_size))
+            pending = deque()
+            try:
+                while True:
+                    pending.extend(fetch(start) for start in itertools.islice(starts, prefetch + 1 - len(pending)))
+                    if not pending:
+                        return
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        return rows()
+
+    def _collect_columns_ir(self):
+        fields = list(self.row)
+        return hl.bind(lambda rows: hl.struct(**{f: rows.map(lambda r: r[f]) for f in fields}),
+                       self.collect(_localize=False))._ir
+
+    @typecheck_method(fields=oneof(str, Expression),
+                      named_exprs=expr_any)
+    def collect_columns(self, *fields, **named_exprs):
+        """Collect fields of the table into a dictionary of NumPy arrays.
+
+        Examples
+        --------
+        Collect the `HT` and `SEX` fields of each row:
+
+        >>> columns = table1.collect_columns('HT', 'SEX')
+
+        Collect a computed field:
+
+        >>> columns = table1.collect_columns(bmi=table1.X / table1.HT ** 2)
+
+        Notes
+        -----
+        The arguments select fields as in :meth:`.select`, so key fields are
+        always collected. With no arguments, all row fields are collected.
+
+        Fields of Booleans and numbers are collected into NumPy arrays of the
+        corresponding dtype without creating a Python object per row. If a
+        field has missing values, its array is a :class:`numpy.ma.MaskedArray`
+        masking them. Fields of other types are collected into arrays of dtype
+        object, with missing values ``None``.
+
+        Warning
+        -------
+        Using this method can cause out of memory errors. Only collect small tables.
+
+        Parameters
+        ----------
+        fields : varargs of :obj:`str` or :class:`.Expression`
+            Fields to collect.
+        named_exprs : keyword args of :class:`.Expression`
+            Computed fields to collect.
+
+        Returns
+        -------
+        :obj:`dict` of :obj:`str` to :class:`numpy.ndarray`
+            Array of the values of each field, in row order.
+        """
+        t = self.select(*fields, **named_exprs) if fields or named_exprs else self
+        return Env.backend().execute_columns(t._collect_columns_ir())
+
     def describe(self, handler=print):
         """Print information about the fields in the table."""
 
@@ -1727,6 +1953,52 @@ class Table(ExprContainer):
                                                               r=row_fields)
         handler(s)
 
+    @typecheck_method(optimized=bool, handler=anyfunc)
+    def explain(self, optimized=False, handler=print):
+        """Print the plan of the pipeline computing this table, with estimated costs.
+
+        Examples
+        --------
+
+        >>> table1.explain()  # doctest: +SKIP
+        2 shuffles, 1 input scan, 0 joins
+        TableOrderBy (rows=<=1000 partitions=8 key=[]) [SHUFFLE: order by ['Dn']]
+          TableKeyByAndAggregate (rows=<=1000 partitions=8 key=['k']) [SHUFFLE: group by ['k']]
+            TableMapRows (rows=1000 partitions=8 key=['idx'])
+              TableRead (rows=1000 partitions=8 key=['idx']) [scan data/example.ht]
+
+        Notes
+        -----
+        Each line is a step of the pipeline, indented below the steps it
+        uses, with its estimated number of rows and partitions, and its
+        key. Counts are exact unless written as an upper bound (``<=``), or
+        unknown (``?``). They are computed without running the pipeline, from
+        the partition counts stored in the metadata of the native files read.
+
+        Steps marked ``SHUFFLE`` redistribute all rows across the cluster:
+        changing the key to fields that do not start with the current key
+        (:meth:`.Table.key_by`, :meth:`.MatrixTable.key_rows_by`), grouping
+        (:meth:`.GroupedTable.aggregate`), sorting (:meth:`.Table.order_by`)
+        and shuffling repartitions. Other costly steps are noted: scans of
+        input files, and joins, including the joins made by expressions that
+        index one dataset by the fields of another, which repartition the
+        joined dataset. The first line counts the shuffles, input scans and
+        joins of the plan.
+
+        Parameters
+        ----------
+        optimized : :obj:`bool`
+            If true, also print the pipeline as optimized by the backend.
+        handler : function
+            Function called with the text of the plan.
+        """
+        text = format_plan(plan(self._tir))
+        if optimized:
+            optimized_ir = Env.backend()._optimized_ir(self._tir)
+            if optimized_ir is not None:
+                text += '\n\nOptimized IR:\n' + optimized_ir
+        handler(text)
+
     @typecheck_method(name=str)
     def add_index(self, name='idx') -> 'Table':
         """Add the integer index of each row as a new row field.
@@ -1910,6 +2182,47 @@ class Table(ExprContainer):
 
         return self.filter(hl.rand_bool(p, seed))
 
+    @typecheck_method(fraction=numeric,
+                      seed=nullable(int))
+    def sample_partitions(self, fraction, seed=None) -> 'Table':
+        """Downsample the table by keeping a random subset of its partitions.
+
+        Examples
+        --------
+
+        Keep about 10% of the partitions of the table.
+
+        >>> small_table1 = table1.sample_partitions(0.1)
+
+        Notes
+        -----
+
+        Unlike :meth:`.sample`, which reads every row and keeps each with
+        probability ``p``, this method keeps whole partitions, and at least
+        one. For a table read from a file, only the files of the kept
+        partitions are read. The rows kept are not a uniform sample of the
+        rows of the table: rows stored together are kept or dropped together.
+
+        Parameters
+        ----------
+        fraction : :obj:`float`
+            Fraction of the partitions to keep.
+        seed : :obj:`int`, optional
+            Random seed.
+
+        Returns
+        -------
+        :class:`.Table`
+            Table with ``ceil(fraction * n_partitions)`` partitions.
+        """
+        if not (0 < fraction <= 1):
+            raise ValueError("Requires 'fraction' in (0,1]. Found fraction={}".format(fraction))
+
+        parts = self._sample_partition_indices(fraction, seed)
+        if parts is None:
+            return self
+        return self._filter_partitions(parts)
+
     @typecheck_method(n=int,
                       shuffle=bool)
     def repartition(self, n, shuffle=True) -> 'Table':
@@ -2725,9 +3038,14 @@ class Table(ExprContainer):
     def to_pandas(self, flatten=True):
         """Converts this table to a Pandas DataFrame.
 
-        Because conversion to Pandas is done through Spark, and Spark
-        cannot represent complex types, types are expanded before
-        flattening or conversion.
+        Because Pandas cannot represent complex types, types are expanded
+        before flattening or conversion, as in :meth:`.to_spark`.
+
+        Notes
+        -----
+        If every column is a Boolean, number or string, the table is
+        collected directly into column arrays. Otherwise it is converted
+        through a Spark DataFrame.
 
         Parameters
         ----------
@@ -2752,6 +3070,12 @@ class Table(ExprContainer):
 
         >>> t = hl.Table.from_pandas(df) # doctest: +SKIP
 
+        Notes
+        -----
+        If every column of `df` holds Booleans, 32- or 64-bit integers or
+        floats, or strings, the columns are sent to the backend as binary
+        arrays. Otherwise the DataFrame is converted through a Spark DataFrame.
+
         Parameters
         ----------
         df : :class:`.pandas.DataFrame`
@@ -2932,3 +3256,118 @@ class Table(ExprContainer):
             [t._tir for t in tables], data_field_name, global_field_name))
 
 table_type.set(Table)
+
+
+# rows per chunk of large local data passed to `Table.parallelize`
+_parallelize_chunk_rows = 1 << 16
+
+
+def _parallelize_chunks(rows, dtype, n_partitions):
+    """Table IR with the rows of the NumPy record array `rows` of type `dtype`.
+
+    The rows are split into chunks, each a literal in its own partition. If
+    the backend reads large literals from local files, the files of the
+    chunks are encoded and written by a thread pool.
+    """
+    n = len(rows)
+    n_chunks = n_partitions if n_partitions is not None else -(-n // _parallelize_chunk_rows)
+    n_chunks = max(1, min(n_chunks, n))
+    bounds = [n * i // n_chunks for i in range(n_chunks + 1)]
+    literals = [Literal(dtype, rows[start:end]) for start, end in zip(bounds, bounds[1:])]
+
+    if Env.backend().literal_files:
+        def write(lit):
+            lit._literal_file = _literal_file(lit._typ, lit.value)
+
+        with concurrent.futures.ThreadPoolExecutor(thread_name_prefix='hail-parallelize') as pool:
+            list(pool.map(write, literals))
+
+    tables = [TableParallelize(MakeStruct([('rows', lit), ('global', MakeStruct([]))]),
+                               n_partitions if len(literals) == 1 else 1)
+              for lit in literals]
+    return tables[0] if len(tables) == 1 else TableUnion(tables)
+
+
+def _records_row_type(records):
+    """Row type of the NumPy record array `records`, from the dtypes or the values of its columns."""
+    fields = []
+    for f in records.dtype.names:
+        t = _numpy_element_type(records.dtype[f])
+        if t is None:
+            values = [x for x in _records_column_values(records[f], None) if x is not None]
+            if not values:
+                raise ValueError(f"'parallelize': cannot impute the type of field '{f}' with no present values, "
+                                 f"pass 'schema'")
+            t = impute_type(values).element_type
+        fields.append((f, t))
+    return tstruct(**dict(fields))
+
+
+def _records_column_values(column, t):
+    """Values of the object column `column` of a record array, with NaN missing unless `t` is a float type."""
+    if t in (tfloat32, tfloat64):
+        return column.tolist()
+    # pandas represents missing values of object columns by NaN
+    return [None if isinstance(x, float) and x != x else x for x in column.tolist()]
+
+
+def _records_value(records, row_type):
+    """Record array with the fields of `row_type` holding the values of the NumPy record array `records`."""
+    if sorted(records.dtype.names) != sorted(row_type):
+        raise TypeError("'parallelize': fields {} of the record array do not match the schema '{}'"
+                        .format(list(records.dtype.names), row_type))
+    return _records_from_columns(len(records), row_type, lambda f: records[f])
+
+
+def _rows_records(rows, row_type):
+    """Record array with the values of the list `rows` of rows of type `row_type`."""
+    # as in `hl.literal`, rows may not have fields outside of `row_type`
+    fields = frozenset(row_type)
+    for row in rows:
+        if not (isinstance(row, Mapping) and fields.issuperset(row)):
+            raise TypeError(f"'parallelize': object did not match the passed type '{row_type}'")
+
+    def column(f):
+        try:
+            return [row[f] for row in rows]
+        except (KeyError, TypeError) as e:
+            raise TypeError(f"'parallelize': object did not match the passed type '{row_type}'") from e
+    return _records_from_columns(len(rows), row_type, column)
+
+
+def _records_from_columns(n, row_type, column):
+    """Record array of length `n` with the fields of `row_type`, holding the
+    values ``column(f)`` of each field `f`, which are lists or NumPy arrays.
+
+    Columns of numbers or Booleans are converted to the NumPy dtypes of their
+    field types, so the rows are encoded without visiting them in Python;
+    other columns are checked against their field types.
+    """
+    columns = []
+    for f, t in row_type.items():
+        values = column(f)
+        if isinstance(values, list) and values and t in _numpy_dtypes:
+            value_type = _primitive_element_type(values)
+            if value_type is not None and _holds_primitive_values(t, value_type):
+                values = np.array(values, dtype=_numpy_dtypes[t])
+        if isinstance(values, np.ndarray) and values.dtype.kind in 'biuf' and t in _numpy_dtypes:
+            try:
+                values = _numpy_literal_value(values, tarray(t))
+            except TypeError as e:
+                raise TypeError(f"'parallelize': field '{f}' does not match type '{t}'") from e
+        else:
+            if isinstance(values, np.ndarray):
+                values = _records_column_values(values, t)
+            try:
+                values = hl.literal(values, tarray(t))._ir.value
+            except TypeError as e:
+                raise TypeError(f"'parallelize': field '{f}' does not match type '{t}'") from e
+            objects = np.empty(n, dtype=object)
+            for i, x in enumerate(values):
+                objects[i] = x
+            values = objects
+        columns.append((f, values))
+    value = np.empty(n, dtype=[(f, values.dtype) for f, values in columns])
+    for f, values in columns:
+        value[f] = values
+    return value
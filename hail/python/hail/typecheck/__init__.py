@@ -22,4 +22,5 @@ __all__ = ['TypeChecker',
            'func_spec',
            'table_key_type',
            'TypecheckFailure',
+           'set_internal_checks',
            ]
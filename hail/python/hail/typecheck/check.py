@@ -2,7 +2,10 @@ import re
 import inspect
 import abc
 import collections
-from decorator import decorator
+import functools
+import sys
+
+from hail.profiling import profiled, _profiles, _start, _end
 
 
 class TypecheckFailure(Exception):
@@ -23,6 +26,9 @@ def extract(t):
 class TypeChecker(object):
     __metaclass__ = abc.ABCMeta
 
+    # whether `check` may return a value other than its argument
+    coerces = True
+
     def __init__(self):
         pass
 
@@ -48,6 +54,7 @@ class MultipleTypeChecker(TypeChecker):
             else:
                 flat_checkers.append(c)
         self.checkers = flat_checkers
+        self.coerces = any(c.coerces for c in flat_checkers)
         super(MultipleTypeChecker, self).__init__()
 
     def check(self, x, caller, param):
@@ -167,6 +174,8 @@ class SizedTupleChecker(TypeChecker):
 
 
 class LinkedListChecker(TypeChecker):
+    coerces = False
+
     def __init__(self, type):
         self.type = type
         super(LinkedListChecker, self).__init__()
@@ -184,6 +193,8 @@ class LinkedListChecker(TypeChecker):
 
 
 class AnyChecker(TypeChecker):
+    coerces = False
+
     def __init__(self):
         super(AnyChecker, self).__init__()
 
@@ -195,6 +206,8 @@ class AnyChecker(TypeChecker):
 
 
 class CharChecker(TypeChecker):
+    coerces = False
+
     def __init__(self):
         super(CharChecker, self).__init__()
 
@@ -209,6 +222,8 @@ class CharChecker(TypeChecker):
 
 
 class LiteralChecker(TypeChecker):
+    coerces = False
+
     def __init__(self, t):
         self.t = t
         super(LiteralChecker, self).__init__()
@@ -224,6 +239,8 @@ class LiteralChecker(TypeChecker):
 
 
 class LazyChecker(TypeChecker):
+    coerces = False
+
     def __init__(self):
         self.t = None
         super(LazyChecker, self).__init__()
@@ -246,6 +263,8 @@ class LazyChecker(TypeChecker):
 
 
 class ExactlyTypeChecker(TypeChecker):
+    coerces = False
+
     def __init__(self, v, reference_equality=False):
         self.v = v
         self.reference_equality = reference_equality
@@ -290,6 +309,8 @@ class CoercionChecker(TypeChecker):
 
 
 class AnyFuncChecker(TypeChecker):
+    coerces = False
+
     def __init__(self):
         super(AnyFuncChecker, self).__init__()
 
@@ -453,6 +474,7 @@ def check_meta(f, checks, is_method):
         f.__checked = True
 
 
+@profiled('typecheck')
 def check_all(f, args, kwargs, checks, is_method):
     spec = get_signature(f)
     check_meta(f, checks, is_method)
@@ -544,6 +566,174 @@ def check_all(f, args, kwargs, checks, is_method):
     return args_, kwargs_
 
 
+_config = {'check_internal_calls': True}
+
+
+def set_internal_checks(enabled):
+    """Enable or disable argument checks on calls made from within Hail.
+
+    When disabled, arguments passed to typechecked functions by code in the
+    ``hail`` package are not validated. Checks that convert their arguments,
+    for instance to expressions, still run, so Hail behaves the same on
+    correct code. Calls from outside Hail are always checked.
+
+    Parameters
+    ----------
+    enabled : :obj:`bool`
+    """
+    _config['check_internal_calls'] = enabled
+
+
+def _is_internal(frame):
+    name = frame.f_globals.get('__name__', '')
+    return name == 'hail' or name.startswith('hail.')
+
+
+def _param_error(name, arg_name, checker, arg):
+    return TypeError("{fname}: parameter '{argname}': "
+                     "expected {expected}, found {found}".format(
+        fname=name,
+        argname=arg_name,
+        expected=checker.expects(),
+        found=checker.format(arg)
+    ))
+
+
+def _check_varargs(varargs, checker, name, arg_name):
+    args_ = []
+    for j, arg in enumerate(varargs):
+        try:
+            args_.append(checker.check(arg, name, arg_name))
+        except TypecheckFailure as e:
+            raise TypeError("{fname}: parameter '*{argname}' (arg {idx} of {tot}): "
+                            "expected {expected}, found {found}".format(
+                fname=name,
+                argname=arg_name,
+                idx=j,
+                tot=len(varargs),
+                expected=checker.expects(),
+                found=checker.format(arg)
+            )) from e
+    return args_
+
+
+def _check_kwargs(kwargs, checker, name, arg_name):
+    kwargs_ = {}
+    for kwarg_name, arg in kwargs.items():
+        try:
+            kwargs_[kwarg_name] = checker.check(arg, name, arg_name)
+        except TypecheckFailure as e:
+            raise TypeError("{fname}: keyword argument '{argname}': "
+                            "expected {expected}, found {found}".format(
+                fname=name,
+                argname=kwarg_name,
+                expected=checker.expects(),
+                found=checker.format(arg))) from e
+    return kwargs_
+
+
+def _compile_checker(f, checks, is_method):
+    """Wrapper of `f` with the signature of `f` that checks its arguments.
+
+    The wrapper is generated code that lets Python bind the arguments, and
+    then runs the checks of the parameters in order, skipping parameters
+    that accept any value.
+    """
+    try:
+        check_meta(f, checks, is_method)
+    except RuntimeError as e:
+        error = e
+
+        def invalid_signature(*args, **kwargs):
+            raise error
+        return invalid_signature
+
+    spec = get_signature(f)
+    namespace = {'_tc_f': f,
+                 '_tc_name': f.__name__,
+                 '_tc_config': _config,
+                 '_tc_getframe': sys._getframe,
+                 '_tc_is_internal': _is_internal,
+                 '_tc_param_error': _param_error,
+                 '_tc_check_varargs': _check_varargs,
+                 '_tc_check_kwargs': _check_kwargs,
+                 '_tc_profiles': _profiles,
+                 '_tc_profile_start': _start,
+                 '_tc_profile_end': _end,
+                 'TypecheckFailure': TypecheckFailure}
+    params = []
+    call_args = []
+    checks_code = []
+    skippable = False
+    star = False
+    for i, (arg_name, param) in enumerate(spec.parameters.items()):
+        assert not arg_name.startswith('_tc_')
+        if param.kind == param.VAR_POSITIONAL:
+            star = True
+        elif param.kind == param.KEYWORD_ONLY and not star:
+            # keyword-only parameters with no varargs before them
+            params.append('*')
+            star = True
+        if param.kind == param.POSITIONAL_OR_KEYWORD:
+            call_args.append(arg_name)
+        elif param.kind == param.VAR_POSITIONAL:
+            call_args.append(f'*{arg_name}')
+        elif param.kind == param.KEYWORD_ONLY:
+            call_args.append(f'{arg_name}={arg_name}')
+        elif param.kind == param.VAR_KEYWORD:
+            call_args.append(f'**{arg_name}')
+        else:
+            raise RuntimeError(f'{f.__name__}: cannot typecheck positional-only parameter {arg_name}')
+
+        if param.default is not param.empty:
+            namespace[f'_tc_default_{i}'] = param.default
+            params.append(f'{arg_name}=_tc_default_{i}')
+        elif param.kind == param.VAR_POSITIONAL:
+            params.append(f'*{arg_name}')
+        elif param.kind == param.VAR_KEYWORD:
+            params.append(f'**{arg_name}')
+        else:
+            params.append(arg_name)
+
+        if i == 0 and is_method:
+            continue
+        checker = checks[arg_name]
+        if isinstance(checker, AnyChecker):
+            continue
+        namespace[f'_tc_checker_{i}'] = checker
+        if param.kind == param.VAR_POSITIONAL:
+            code = [f'if {arg_name}:',
+                    f'    {arg_name} = _tc_check_varargs({arg_name}, _tc_checker_{i}, _tc_name, {arg_name!r})']
+        elif param.kind == param.VAR_KEYWORD:
+            code = [f'if {arg_name}:',
+                    f'    {arg_name} = _tc_check_kwargs({arg_name}, _tc_checker_{i}, _tc_name, {arg_name!r})']
+        else:
+            code = ['try:',
+                    f'    {arg_name} = _tc_checker_{i}.check({arg_name}, _tc_name, {arg_name!r})',
+                    'except TypecheckFailure as e:',
+                    f'    raise _tc_param_error(_tc_name, {arg_name!r}, _tc_checker_{i}, {arg_name}) from e']
+        if not checker.coerces:
+            skippable = True
+            code = ['if _tc_check:'] + ['    ' + line for line in code]
+        checks_code.extend(code)
+
+    body = []
+    if skippable:
+        body.append("_tc_check = _tc_config['check_internal_calls'] or not _tc_is_internal(_tc_getframe(1))")
+    if checks_code:
+        body.append("_tc_start = _tc_profile_start('typecheck') if _tc_profiles else None")
+        body.append('try:')
+        body.extend('    ' + line for line in checks_code)
+        body.extend(['finally:',
+                     '    if _tc_start is not None:',
+                     "        _tc_profile_end('typecheck', _tc_start)"])
+    body.append(f'return _tc_f({", ".join(call_args)})')
+    code = (f'def _tc_checked({", ".join(params)}):\n'
+            + ''.join(f'    {line}\n' for line in body))
+    exec(compile(code, f'<typecheck {f.__module__}.{f.__qualname__}>', 'exec'), namespace)
+    return namespace['_tc_checked']
+
+
 def typecheck_method(**checkers):
     return _make_dec(checkers, is_method=True)
 
@@ -555,9 +745,7 @@ def typecheck(**checkers):
 def _make_dec(checkers, is_method):
     checkers = {k: only(v) for k, v in checkers.items()}
 
-    @decorator
-    def wrapper(__original_func, *args, **kwargs):
-        args_, kwargs_ = check_all(__original_func, args, kwargs, checkers, is_method=is_method)
-        return __original_func(*args_, **kwargs_)
+    def dec(f):
+        return functools.wraps(f)(_compile_checker(f, checkers, is_method))
 
-    return wrapper
+    return dec
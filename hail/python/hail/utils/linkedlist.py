@@ -2,23 +2,48 @@ from collections import Iterable, Iterator
 
 class ListIterator(Iterator):
     def __init__(self, node):
-        self.node = node
+        self.stack = [node]
+        self.visited = set()
 
     def __next__(self):
-        if self.node is None:
-            raise StopIteration
-        else:
-            x = self.node.value
-            self.node = self.node.prev
-            return x
+        while self.stack:
+            node = self.stack.pop()
+            if node is None or id(node) in self.visited:
+                continue
+            self.visited.add(id(node))
+            self.stack.append(node.prev)
+            if isinstance(node, ConcatNode):
+                self.stack.extend(node.heads)
+            else:
+                return node.value
+        raise StopIteration
 
 
 class ListNode(object):
+    __slots__ = ['value', 'prev']
+
     def __init__(self, value, prev):
         self.value = value
         self.prev = prev
 
+
+class ConcatNode(object):
+    """The elements of the non-empty lists starting at `heads`, followed by
+    the list starting at `prev`."""
+    __slots__ = ['heads', 'prev']
+
+    def __init__(self, heads, prev):
+        self.heads = heads
+        self.prev = prev
+
+
 class LinkedList(Iterable):
+    """Persistent list. Lists made from the same list share its nodes, so
+    :meth:`push` and :meth:`concat` take time independent of the length of
+    the lists. Iteration yields the most recently added elements first, and
+    yields elements of nodes shared by several of the concatenated lists
+    once."""
+
     def __init__(self, type):
         self.type = type
         self.node = None
@@ -33,6 +58,25 @@ class LinkedList(Iterable):
             l.node = ListNode(x, l.node)
         return l
 
+    def concat(self, *others):
+        """List with the elements of `others` added, the last list first."""
+        heads = []
+        for other in others:
+            if other.type is not self.type:
+                raise TypeError("Expected list of type '{}', found list of type '{}'".format(self.type, other.type))
+            if other.node is not None and other.node is not self.node:
+                heads.append(other.node)
+        if not heads:
+            return self
+        if self.node is None and len(heads) == 1:
+            node = heads[0]
+        else:
+            node = ConcatNode(heads, self.node)
+        l = LinkedList.__new__(LinkedList)
+        l.type = self.type
+        l.node = node
+        return l
+
     def empty(self):
         return self.node is None
 
@@ -54,8 +98,10 @@ class LinkedList(Iterable):
     def __nonzero__(self):
         return not self.empty()
 
+    __bool__ = __nonzero__
+
     def __len__(self):
         l = 0
         for _ in self:
             l += 1
-        return l
\ No newline at end of file
+        return l
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from hail.typecheck import *
 from collections import Mapping, OrderedDict
 from hail.utils.misc import get_nice_attr_error, get_nice_field_error
@@ -27,54 +29,77 @@ class Struct(Mapping):
     >>> from pprint import pprint
     >>> pprint(bar)
 
+    Structs are immutable: assigning a field or any other attribute raises
+    :class:`AttributeError`. Use :meth:`annotate` to make a struct with new
+    field values.
+
     Parameters
     ----------
     attributes
         Field names and values.
     """
 
+    # Structs with the same field names share a subclass of Struct holding
+    # the names and their indices, and each struct holds only a tuple of
+    # its values.
+    __slots__ = ['_values']
+    _struct_names = ()
+    _struct_index = {}
+
+    def __new__(cls, **kwargs):
+        self = object.__new__(_struct_class(tuple(kwargs)))
+        self._values = tuple(kwargs.values())
+        return self
+
     def __init__(self, **kwargs):
-        self._fields = kwargs
-        for k, v in kwargs.items():
-            if not k in self.__dict__:
-                self.__dict__[k] = v
+        pass
+
+    def __reduce__(self):
+        return _make_struct, (self._struct_names, self._values)
+
+    @property
+    def _fields(self):
+        return dict(zip(self._struct_names, self._values))
 
     def __contains__(self, item):
-        return item in self._fields
+        return item in self._struct_index
 
     def _get_field(self, item):
-        if item in self._fields:
-            return self._fields[item]
-        else:
+        i = self._struct_index.get(item)
+        if i is None:
             raise KeyError(get_nice_field_error(self, item))
+        return self._values[i]
 
     @typecheck_method(item=str)
     def __getitem__(self, item):
         return self._get_field(item)
 
     def __getattr__(self, item):
-        if item in self.__dict__:
-            return self.__dict__[item]
-        else:
+        # fields that are not attributes of the class, such as dunder names
+        i = self._struct_index.get(item)
+        if i is None:
             raise AttributeError(get_nice_attr_error(self, item))
+        return self._values[i]
 
     def __len__(self):
-        return len(self._fields)
+        return len(self._values)
 
     def __repr__(self):
         return str(self)
 
     def __str__(self):
-        return 'Struct({})'.format(', '.join('{}={}'.format(k, repr(v)) for k, v in self._fields.items()))
+        return 'Struct({})'.format(', '.join('{}={}'.format(k, repr(v)) for k, v in zip(self._struct_names, self._values)))
 
     def __eq__(self, other):
+        if type(other) is type(self):
+            return self._values == other._values
         return isinstance(other, Struct) and self._fields == other._fields
 
     def __hash__(self):
-        return 37 + hash(tuple(sorted(self._fields.items())))
+        return 37 + hash(tuple(sorted(zip(self._struct_names, self._values))))
 
     def __iter__(self):
-        return iter(self._fields)
+        return iter(self._struct_names)
 
     def annotate(self, **kwargs):
         """Add new fields or recompute existing fields.
@@ -95,7 +120,7 @@ class Struct(Mapping):
         :class:`.Struct`
             Struct with new or updated fields.
         """
-        d = OrderedDict(self.items())
+        d = OrderedDict(zip(self._struct_names, self._values))
         for k, v in kwargs.items():
             d[k] = v
         return Struct(**d)
@@ -147,13 +172,52 @@ class Struct(Mapping):
         :class:`.Struct`
             Struct without certain fields.
         """
-        d = OrderedDict((k, v) for k, v in self.items() if not k in args)
+        d = OrderedDict((k, v) for k, v in zip(self._struct_names, self._values) if not k in args)
         return Struct(**d)
 
 
+def _field_property(i):
+    return property(lambda self: self._values[i])
+
+
+@lru_cache(maxsize=1024)
+def _struct_class(names):
+    # fields are attributes of the class, so that, as before structs stored
+    # their fields in their __dict__, fields shadow the methods of Struct;
+    # dunder names are left to the protocol methods and served by __getattr__
+    attributes = {f: _field_property(i) for i, f in enumerate(names)
+                  if f not in _struct_attributes and not f.startswith('__')}
+    attributes['__slots__'] = ()
+    attributes['__module__'] = Struct.__module__
+    attributes['_struct_names'] = names
+    attributes['_struct_index'] = {f: i for i, f in enumerate(names)}
+    return type('Struct', (Struct,), attributes)
+
+
+_struct_attributes = {'_values', '_struct_names', '_struct_index', '_fields'}
+
+
+def _make_struct(names, values):
+    s = object.__new__(_struct_class(names))
+    s._values = values
+    return s
+
+
+def _struct_builder(names):
+    """Function building a :class:`.Struct` with fields `names` from a tuple of values."""
+    cls = _struct_class(tuple(names))
+    new = object.__new__
+
+    def build(values):
+        s = new(cls)
+        s._values = values
+        return s
+    return build
+
+
 @typecheck(struct=Struct)
 def to_dict(struct):
-    return dict(struct.items())
+    return dict(zip(struct._struct_names, struct._values))
 
 
 import pprint
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 import pytest
 import random
 from scipy.stats import pearsonr
@@ -20,6 +21,26 @@ class Tests(unittest.TestCase):
         ht = ht.key_by('new_key')
         self.assertEqual(ht._force_count(), 10)
 
+    def test_eval_many(self):
+        ht = hl.utils.range_table(10)
+        ht = ht.annotate_globals(g=5)
+        self.assertEqual(
+            hl.eval_many(hl.int32(1) + 2,
+                         ht.g,
+                         ht.aggregate(hl.agg.sum(ht.idx), _localize=False),
+                         ht.aggregate(hl.agg.count(), _localize=False),
+                         hl.str('x')),
+            [3, 5, 45, 10, 'x'])
+        self.assertEqual(hl.eval_many(), [])
+
+    def test_eval_async(self):
+        ht = hl.utils.range_table(10)
+        ht = ht.annotate_globals(g=5)
+        futures = [hl.eval(hl.int32(1) + 2, _async=True),
+                   hl.eval(ht.g, _async=True),
+                   hl.eval(ht.aggregate(hl.agg.sum(ht.idx), _localize=False), _async=True)]
+        self.assertEqual([f.result() for f in futures], [3, 5, 45])
+
     def test_seeded_same(self):
 
         def test_random_function(rand_f):
@@ -957,6 +978,24 @@ class Tests(unittest.TestCase):
                      hl.Struct(f1=1, f2=2, f3=3),
                      tstruct(f1=tint32, f2=tint32, f3=tint32))
 
+    def test_struct_fields(self):
+        s = hl.struct(a=1, keys=2, b=hl.struct(c='x'))
+        self.assertEqual(list(s), ['a', 'keys', 'b'])
+        self.assertEqual(len(s), 3)
+        self.assertIs(s.a, s['a'])
+        self.assertIs(s.b.c, s['b']['c'])
+        self.assertIs(s.keys, s['keys'])
+        self.assertTrue('a' in s)
+        self.assertFalse('d' in s)
+        self.assertRaises(AttributeError, lambda: s.d)
+        self.assertRaises(KeyError, lambda: s['d'])
+        self.assertEqual(hl.eval(s.b.c), 'x')
+
+        ht = hl.utils.range_table(1)
+        s = hl.struct(**{f'f{i}': ht.idx + i for i in range(1000)})
+        self.assertEqual(s.f999._indices, ht._row_indices)
+        self.assertEqual(len(hl.struct(x=hl.agg.sum(ht.idx), y=hl.agg.count())._aggregations), 2)
+
     def test_iter(self):
         a = hl.literal([1, 2, 3])
         self.assertRaises(hl.expr.ExpressionException, lambda: hl.eval(list(a)))
@@ -2361,6 +2400,51 @@ class Tests(unittest.TestCase):
         self.assertEqual(hl.eval(hl.literal(hl.set(['A','B']))), {'A', 'B'})
         self.assertEqual(hl.eval(hl.literal({hl.str('A'), hl.str('B')})), {'A', 'B'})
 
+    def test_literal_primitive_containers(self):
+        self.assertEqual(hl.literal([1, 2]).dtype, hl.tarray(hl.tint32))
+        self.assertEqual(hl.literal([1, 2 ** 40]).dtype, hl.tarray(hl.tint64))
+        self.assertEqual(hl.literal([1, 2.5]).dtype, hl.tarray(hl.tfloat64))
+        self.assertEqual(hl.literal([True, 1]).dtype, hl.tarray(hl.tint32))
+        self.assertEqual(hl.literal({'a', 'b'}).dtype, hl.tset(hl.tstr))
+        self.assertEqual(hl.literal({'a': 1.5}).dtype, hl.tdict(hl.tstr, hl.tfloat64))
+        self.assertEqual(hl.literal([1, 2], 'array<float64>').dtype, hl.tarray(hl.tfloat64))
+        self.assertEqual(hl.literal({1: 'a'}, 'dict<int64, str>').dtype, hl.tdict(hl.tint64, hl.tstr))
+
+        self.assertRaises(ValueError, lambda: hl.literal([2 ** 70]))
+        self.assertRaises(hl.expr.ExpressionException, lambda: hl.literal({'a': 1, 'b': 'x'}))
+        self.assertRaises(TypeError, lambda: hl.literal([1.5], 'array<int32>'))
+        self.assertRaises(TypeError, lambda: hl.literal([2 ** 40], 'array<int32>'))
+        self.assertRaises(TypeError, lambda: hl.literal({1}, 'array<int32>'))
+
+        xs = list(range(100000))
+        self.assertEqual(hl.eval(hl.sum(hl.literal(xs))), sum(xs))
+        self.assertEqual(hl.eval(hl.literal([str(x) for x in xs[:10]])), [str(x) for x in xs[:10]])
+
+    def test_literal_numpy(self):
+        self.assertEqual(hl.literal(np.arange(3)).dtype, hl.tarray(hl.tint64))
+        self.assertEqual(hl.literal(np.arange(3, dtype=np.int32)).dtype, hl.tarray(hl.tint32))
+        self.assertEqual(hl.literal(np.array([0.5], dtype=np.float32)).dtype, hl.tarray(hl.tfloat32))
+        self.assertEqual(hl.literal(np.zeros((2, 3))).dtype, hl.tarray(hl.tarray(hl.tfloat64)))
+
+        self.assertEqual(hl.eval(hl.literal(np.array([1.5, 2.5, 3.5]))), [1.5, 2.5, 3.5])
+        self.assertEqual(hl.eval(hl.literal(np.array([True, False]))), [True, False])
+        self.assertEqual(hl.eval(hl.literal(np.array([1, 2]), 'array<float64>')), [1.0, 2.0])
+        self.assertEqual(hl.eval(hl.literal(np.array([[1, 2], [3, 4]]))), [[1, 2], [3, 4]])
+        self.assertEqual(hl.eval(hl.literal(np.array(['a', 'b']))), ['a', 'b'])
+
+        x = np.arange(100000, dtype=np.float64)
+        self.assertEqual(hl.eval(hl.sum(hl.literal(x))), float(x.sum()))
+
+        self.assertRaises(TypeError, lambda: hl.literal(np.array([1.5]), 'array<int32>'))
+        self.assertRaises(TypeError, lambda: hl.literal(np.array([2 ** 40]), 'array<int32>'))
+
+        nested = [np.array([1, 2]), np.array([3])]
+        self.assertEqual(hl.literal(nested).dtype, hl.tarray(hl.tarray(hl.tint64)))
+        self.assertEqual(hl.eval(hl.literal(nested)), [[1, 2], [3]])
+        self.assertEqual(hl.eval(hl.literal(hl.Struct(a=np.array([0.5]), b=(np.array([True]), 1)))),
+                         hl.Struct(a=[0.5], b=([True], 1)))
+        self.assertEqual(hl.eval(hl.literal({'a': np.array([1], dtype=np.int32)})), {'a': [1]})
+
     def test_format(self):
         self.assertEqual(hl.eval(hl.format("%.4f %s %.3e", 0.25, 'hello', 0.114)), '0.2500 hello 1.140e-01')
         self.assertEqual(hl.eval(hl.format("%.4f %d", hl.null(hl.tint32), hl.null(hl.tint32))), 'null null')
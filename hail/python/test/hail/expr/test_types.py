@@ -1,3 +1,4 @@
+import math
 import unittest
 
 from hail.expr import coercer_from_dtype
@@ -76,6 +77,66 @@ class Tests(unittest.TestCase):
             self.assertEqual(t, dtype(p1))
             self.assertEqual(t, dtype(p2))
 
+    def test_parser_matches_grammar(self):
+        from parsimonious.exceptions import ParseError
+        from hail.expr.type_parsing import parse_type, type_grammar, type_node_visitor
+
+        for s in ['int', 'tint', 'tfloat', 'void', ' array < tint32 > ', 'ndarray<float64>',
+                  'dict<str , set<int64>>', 'struct{ }', 'tuple( )', 'ttuple(int,tuple(str))',
+                  'struct{`a\\`b`: str, c : tstruct{d:int}}', 'interval<float>', 'locus< GRCh37 >',
+                  'dict<?key, ?value:numeric>']:
+            expected = type_node_visitor.visit(type_grammar.parse(s))
+            self.assertEqual(str(expected), str(parse_type(s)))
+
+        for s in ['intx', 'array<int', 'struct{a: int,}', 'tuple(,)', 'int int', '?', 'dict<int>', '']:
+            with self.assertRaises(ParseError):
+                parse_type(s)
+
+        t = tstruct(**{f'f{i}': tarray(tint32) for i in range(100)})
+        self.assertIs(dtype(str(t)), dtype(str(t)))
+
+    def test_binary_transport_matches_json(self):
+        values = [
+            hl.literal([1, None, 3]),
+            hl.literal([1.5, None], tarray(tfloat32)),
+            hl.literal([True, None, False]),
+            hl.literal({'a': 1, 'b': None}),
+            hl.literal({hl.Interval(1, 5, True, False)}),
+            hl.literal((hl.Struct(x=None, y='foo'), [hl.Locus('1', 100)])),
+            hl.call(0, 1, phased=True),
+            hl.range(0, 1000).map(lambda i: hl.struct(i=i, s=hl.str(i), f=hl.float(i) / 3)),
+            hl.null(tarray(tint64))]
+        backend = Env.backend()
+        for v in values:
+            ir = hl.tuple([v])._ir
+            self.assertEqual(backend.execute(ir), backend._execute_json(ir))
+
+    def test_binary_encoding_roundtrip(self):
+        values = [
+            (tarray(tint32), [1, None, 3]),
+            (tarray(tfloat32), [1.5, None]),
+            (tarray(tbool), [True, None, False]),
+            (tset(tfloat64), {1.5, float('inf')}),
+            (tdict(tstr, tarray(tint64)), {'a': [1], 'b': None, None: []}),
+            (tinterval(tint32), hl.Interval(1, 5, True, False, point_type=tint32)),
+            (tstruct(x=tstr, y=ttuple(tint32, tstr)), hl.Struct(x=None, y=(1, 'foo'))),
+            (tarray(tstr), []),
+            (tint32, None)]
+        for t, v in values:
+            self.assertEqual(t._from_binary(t._to_binary(v)), v)
+
+    def test_convert_containers_from_json(self):
+        self.assertEqual(tarray(tint32)._from_json('[1, null, 3]'), [1, None, 3])
+        self.assertEqual(tarray(tfloat64)._from_json('[1.5, 2.0]'), [1.5, 2.0])
+        x = tarray(tfloat64)._from_json('[1.5, null, "NaN", "Infinity", "-Infinity"]')
+        self.assertEqual(x[:2], [1.5, None])
+        self.assertTrue(math.isnan(x[2]))
+        self.assertEqual(x[3:], [float('inf'), float('-inf')])
+        self.assertEqual(tset(tfloat32)._from_json('[1.5, null]'), {1.5, None})
+        self.assertEqual(tdict(tstr, tfloat64)._from_json('[{"key": "a", "value": 1.5}, {"key": null, "value": "NaN"}]').keys(),
+                         {'a', None})
+        self.assertEqual(tarray(tstruct(a=tfloat64))._from_json('[{"a": 1.5}, null]'), [hl.Struct(a=1.5), None])
+
     def test_coercers_can_coerce(self):
         ts = self.types_to_test()
         for t in ts:
@@ -366,6 +366,16 @@ class Tests(unittest.TestCase):
         self._assert_eq(m.T.diagonal(), np.array([1.0, 5.0]))
         self._assert_eq((m @ m.T).diagonal(), np.array([14.0, 77.0]))
 
+    def test_elementwise_ops_large_vector(self):
+        n = 100000
+        nr = np.arange(n, dtype=np.float64).reshape(1, n)
+        nc = np.ones((3, 1))
+        r = BlockMatrix.from_numpy(nr, block_size=4096)
+        c = BlockMatrix.from_numpy(nc, block_size=4096)
+
+        self._assert_eq(r + nr[0], nr + nr[0])
+        self._assert_eq(c * nr, nc * nr)
+
     def test_fill(self):
         nd = np.ones((3, 5))
         bm = BlockMatrix.fill(3, 5, 1.0)
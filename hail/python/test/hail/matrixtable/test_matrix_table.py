@@ -93,6 +93,22 @@ class Tests(unittest.TestCase):
                 assert mt_.head(100).count_rows() == 10
                 assert mt_.head(100)._force_count_rows() == 10
 
+    def test_explain(self):
+        path = new_temp_file(suffix='mt')
+        hl.utils.range_matrix_table(20, 10, 2).write(path)
+        mt = hl.read_matrix_table(path)
+        mt = mt.filter_rows(mt.row_idx < 5)
+        mt = mt.annotate_rows(x=hl.utils.range_table(20)[mt.row_idx].idx)
+
+        plans = []
+        mt.explain(handler=plans.append)
+        self.assertIn('1 input scan, 1 join', plans[0].split('\n')[0])
+        self.assertIn(f"MatrixRead (rows=20 cols=10 partitions=2 row_key=['row_idx']) [scan {path}]", plans[0])
+        self.assertIn("MatrixFilterRows (rows=<=20 cols=10", plans[0])
+
+        mt.key_rows_by(y=mt.row_idx * 2).explain(handler=plans.append)
+        self.assertIn("[SHUFFLE: key by ['y'], unless already sorted]", plans[1])
+
     def test_filter(self):
         vds = self.get_vds()
         vds = vds.annotate_globals(foo=5)
@@ -547,6 +563,19 @@ class Tests(unittest.TestCase):
         self.assertEqual(et.count(), 100)
         self.assertTrue(et.all(et.x == et.col_idx + et.row_idx))
 
+    def test_collect_entry_columns(self):
+        mt = hl.utils.range_matrix_table(4, 3, n_partitions=2)
+        mt = mt.annotate_entries(x=mt.col_idx + 10 * mt.row_idx)
+        columns = mt.collect_entry_columns('x', 'row_idx', y=hl.str(mt.col_idx))
+        self.assertEqual(list(columns), ['x', 'row_idx', 'y'])
+        self.assertEqual(list(columns['x']), [c + 10 * r for r in range(4) for c in range(3)])
+        self.assertEqual(list(columns['row_idx']), [r for r in range(4) for _ in range(3)])
+        self.assertEqual(list(columns['y']), [str(c) for _ in range(4) for c in range(3)])
+
+        columns = mt.collect_entry_columns('col_idx', row_idx=mt.x)
+        self.assertEqual(list(columns['col_idx']), [c for _ in range(4) for c in range(3)])
+        self.assertEqual(list(columns['row_idx']), [c + 10 * r for r in range(4) for c in range(3)])
+
     def test_filter_cols_required_entries(self):
         mt1 = hl.utils.range_matrix_table(10, 10, n_partitions=4)
         mt1 = mt1.filter_cols(mt1.col_idx < 3)
@@ -898,6 +927,12 @@ class Tests(unittest.TestCase):
         mt2 = hl.read_matrix_table(f)
         self.assertTrue(mt._same(mt2))
 
+    def test_write_async(self):
+        mt = self.get_vds()
+        f = new_temp_file(suffix='mt')
+        mt.write(f, _async=True).result()
+        self.assertTrue(mt._same(hl.read_matrix_table(f)))
+
     def test_nulls_in_distinct_joins(self):
 
         # MatrixAnnotateRowsTable uses left distinct join
@@ -1,5 +1,7 @@
+import math
 import unittest
 
+import numpy as np
 import pandas as pd
 import pyspark.sql
 import pytest
@@ -509,6 +511,25 @@ class Tests(unittest.TestCase):
         kt_small = kt.sample(0.01)
         self.assertTrue(kt_small.count() < kt.count())
 
+    def test_sample_partitions(self):
+        ht = hl.utils.range_table(100, 10)
+        self.assertEqual(ht.sample_partitions(0.2, seed=0).n_partitions(), 2)
+        self.assertEqual(ht.sample_partitions(0.01).n_partitions(), 1)
+        self.assertEqual(ht.sample_partitions(1.0).count(), 100)
+        with self.assertRaises(ValueError):
+            ht.sample_partitions(0)
+
+    def test_approx_count(self):
+        path = new_temp_file(suffix='ht')
+        hl.utils.range_table(1000, 10).write(path)
+        ht = hl.read_table(path)
+        self.assertEqual(ht.approx_count(), 1000)
+
+        filtered = ht.filter(ht.idx % 2 == 0)
+        self.assertEqual(filtered.approx_count(0.5, seed=0), 500)
+        self.assertEqual(filtered.approx_count(1.0), 500)
+        self.assertEqual(hl.utils.range_table(100, 10).filter(False).approx_count(), 0)
+
     def test_from_spark_works(self):
         sql_context = Env.sql_context()
         df = sql_context.createDataFrame([pyspark.sql.Row(x=5, y='foo')])
@@ -528,6 +549,138 @@ class Tests(unittest.TestCase):
 
         self.assertTrue(t._same(t2))
 
+    def test_to_pandas_columnar(self):
+        ht = hl.utils.range_table(10, 3)
+        ht = ht.annotate(x=hl.float(ht.idx) / 2,
+                         y=hl.or_missing(ht.idx % 3 != 0, ht.idx),
+                         s=hl.or_missing(ht.idx % 2 == 0, hl.str(ht.idx)),
+                         b=ht.idx < 5,
+                         t=hl.struct(z=hl.int64(ht.idx)))
+        df = ht.to_pandas()
+        self.assertEqual(list(df.columns), ['idx', 'x', 'y', 's', 'b', 't.z'])
+        self.assertEqual(list(df['idx']), list(range(10)))
+        self.assertEqual(list(df['x']), [i / 2 for i in range(10)])
+        self.assertEqual([None if pd.isnull(y) else int(y) for y in df['y']],
+                         [None if i % 3 == 0 else i for i in range(10)])
+        self.assertEqual(list(df['s']), [str(i) if i % 2 == 0 else None for i in range(10)])
+        self.assertEqual(list(df['b']), [i < 5 for i in range(10)])
+        self.assertEqual(list(df['t.z']), list(range(10)))
+
+        nested = ht.to_pandas(flatten=False)
+        self.assertEqual(list(nested['t']), [pyspark.sql.Row(z=i) for i in range(10)])
+
+    def test_collect_columns(self):
+        ht = hl.utils.range_table(10, 3)
+        ht = ht.annotate(x=hl.float(ht.idx) / 2,
+                         y=hl.or_missing(ht.idx % 3 != 0, ht.idx),
+                         s=hl.or_missing(ht.idx % 2 == 0, hl.str(ht.idx)),
+                         a=hl.range(0, ht.idx))
+        columns = ht.collect_columns()
+        self.assertEqual(list(columns), ['idx', 'x', 'y', 's', 'a'])
+        self.assertEqual(columns['idx'].dtype, np.int32)
+        self.assertTrue(np.array_equal(columns['idx'], np.arange(10)))
+        self.assertTrue(np.array_equal(columns['x'], np.arange(10) / 2))
+        self.assertIsInstance(columns['y'], np.ma.MaskedArray)
+        self.assertEqual(columns['y'].tolist(), [None if i % 3 == 0 else i for i in range(10)])
+        self.assertEqual(columns['s'].dtype, np.dtype(object))
+        self.assertEqual(list(columns['s']), [str(i) if i % 2 == 0 else None for i in range(10)])
+        self.assertEqual(list(columns['a']), [list(range(i)) for i in range(10)])
+
+        columns = ht.collect_columns('x', z=ht.idx < 5)
+        self.assertEqual(list(columns), ['idx', 'x', 'z'])
+        self.assertEqual(columns['z'].dtype, np.bool_)
+        self.assertEqual(list(columns['z']), [i < 5 for i in range(10)])
+
+        empty = ht.filter(False).collect_columns()
+        self.assertEqual({f: len(v) for f, v in empty.items()}, {f: 0 for f in ht.row})
+        self.assertEqual(empty['x'].dtype, np.float64)
+
+    def test_from_pandas_columnar(self):
+        df = pd.DataFrame({'a': pd.Series([1, 2, 3], dtype='int32'),
+                           'b': [1.5, float('nan'), 2.5],
+                           'c': ['x', None, 'z'],
+                           'd': [True, False, True]})
+        t = hl.Table.from_pandas(df, key='a')
+        self.assertEqual(t.row.dtype, hl.tstruct(a=hl.tint32, b=hl.tfloat64, c=hl.tstr, d=hl.tbool))
+        rows = t.collect()
+        self.assertEqual([(r.a, r.c, r.d) for r in rows], [(1, 'x', True), (2, None, False), (3, 'z', True)])
+        self.assertTrue(math.isnan(rows[1].b))
+
+    def test_pandas_columnar_round_trip(self):
+        ht = hl.utils.range_table(10, 3)
+        ht = ht.annotate(**{'x y': hl.float(ht.idx) / 2,
+                            's': hl.or_missing(ht.idx % 2 == 0, hl.str(ht.idx))})
+        t = hl.Table.from_pandas(ht.to_pandas(), key='idx')
+        self.assertEqual(t.row.dtype, ht.row.dtype)
+        self.assertTrue(t._same(ht))
+
+    def test_parallelize_records(self):
+        a = np.zeros(5, dtype=[('idx', 'i4'), ('x', 'f8'), ('b', '?')])
+        a['idx'] = np.arange(5)
+        a['x'] = np.arange(5) / 2
+        a['b'][::2] = True
+        t = hl.Table.parallelize(a, key='idx')
+        self.assertEqual(t.row.dtype, hl.tstruct(idx=hl.tint32, x=hl.tfloat64, b=hl.tbool))
+        self.assertEqual(t.collect(), [hl.Struct(idx=i, x=i / 2, b=i % 2 == 0) for i in range(5)])
+
+        t = hl.Table.parallelize(a, 'struct{idx: int64, x: float64, b: bool}')
+        self.assertEqual(t.idx.dtype, hl.tint64)
+
+        self.assertRaises(TypeError, lambda: hl.Table.parallelize(a, 'struct{idx: int32, x: int32, b: bool}'))
+        self.assertRaises(TypeError, lambda: hl.Table.parallelize(a, 'struct{idx: int32}'))
+        self.assertRaises(TypeError, lambda: hl.Table.parallelize(np.arange(5)))
+
+    def test_parallelize_pandas(self):
+        df = pd.DataFrame({'a': [1, 2, 3], 's': ['x', None, 'z'], 'f': [0.5, float('nan'), 1.5]})
+        t = hl.Table.parallelize(df)
+        self.assertEqual(t.row.dtype, hl.tstruct(a=hl.tint64, s=hl.tstr, f=hl.tfloat64))
+        rows = t.collect()
+        self.assertEqual([(r.a, r.s) for r in rows], [(1, 'x'), (2, None), (3, 'z')])
+        self.assertTrue(math.isnan(rows[1].f))
+
+    def test_parallelize_chunks(self):
+        n = 200000
+        rows = [{'idx': i, 'x': i / 2, 's': str(i) if i % 3 else None} for i in range(n)]
+        t = hl.Table.parallelize(rows, 'struct{idx: int32, x: float64, s: str}')
+        self.assertEqual(t.n_partitions(), 4)
+        self.assertEqual(t.count(), n)
+        self.assertEqual(t.aggregate(hl.agg.sum(t.idx)), n * (n - 1) // 2)
+        self.assertEqual(t.aggregate(hl.agg.count_where(hl.is_missing(t.s))), (n + 2) // 3)
+        t = t.key_by('idx')
+        self.assertEqual(t.filter(t.idx == 12345).collect(), [hl.Struct(idx=12345, x=12345 / 2, s='12345')])
+
+        t = hl.Table.parallelize(rows, 'struct{idx: int32, x: float64, s: str}', n_partitions=7)
+        self.assertEqual(t.n_partitions(), 7)
+        self.assertEqual(t.count(), n)
+
+        self.assertRaises(TypeError, lambda: hl.Table.parallelize(rows, 'struct{idx: int32, y: float64}'))
+
+        # the result does not depend on the number of rows
+        for m in [10, n]:
+            extra = rows[:m - 1] + [{'idx': 0, 'x': 0.0, 's': None, 'z': 1}]
+            self.assertRaises(TypeError, lambda: hl.Table.parallelize(extra, 'struct{idx: int32, x: float64, s: str}'))
+
+    def test_explain(self):
+        path = new_temp_file(suffix='ht')
+        hl.utils.range_table(100, 4).write(path)
+        ht = hl.read_table(path)
+        ht = ht.annotate(k=ht.idx % 10)
+        g = ht.group_by(ht.k).aggregate(n=hl.agg.count())
+
+        plans = []
+        g.order_by(hl.desc(g.n)).explain(handler=plans.append)
+        self.assertTrue(plans[0].startswith('2 shuffles, 1 input scan, 0 joins'))
+        self.assertIn("[SHUFFLE: group by ['k']]", plans[0])
+        self.assertIn(f"TableRead (rows=100 partitions=4 key=['idx']) [scan {path}]", plans[0])
+
+        ht.filter(ht.k > 2).order_by('idx').explain(handler=plans.append)
+        self.assertTrue(plans[1].startswith('0 shuffles, 1 input scan, 0 joins'))
+        self.assertIn("TableFilter (rows=<=100 partitions=4 key=['idx'])", plans[1])
+
+        ht.key_by('k').head(5).explain(handler=plans.append)
+        self.assertTrue(plans[2].startswith('1 shuffle'))
+        self.assertIn("TableHead (rows=5 partitions=4 key=['k'])", plans[2])
+
     def test_rename(self):
         kt = hl.utils.range_table(10)
         kt = kt.annotate_globals(foo=5, fi=3)
@@ -668,6 +821,14 @@ class Tests(unittest.TestCase):
         t2 = hl.read_table(f)
         self.assertTrue(t._same(t2))
 
+    def test_write_async(self):
+        t = hl.utils.range_table(5)
+        fs = [new_temp_file(suffix='ht') for _ in range(2)]
+        futures = [t.write(f, _async=True) for f in fs]
+        for f, future in zip(fs, futures):
+            future.result()
+            self.assertTrue(t._same(hl.read_table(f)))
+
 
     def test_read_back_same_as_exported(self):
         t, _ = create_all_values_datasets()
@@ -893,6 +1054,20 @@ class Tests(unittest.TestCase):
         ht = hl.utils.range_table(10)
         assert hl.eval(ht.collect(_localize=False)) == ht.collect()
 
+    def test_iter_rows(self):
+        ht = hl.utils.range_table(100, 8)
+        ht = ht.annotate(x=hl.str(ht.idx))
+        rows = ht.collect()
+        for batch_size in [1, 3, 8, 20]:
+            for prefetch in [0, 2]:
+                assert list(ht.iter_rows(batch_size=batch_size, prefetch=prefetch)) == rows
+        assert list(ht.collect(_stream=True)) == rows
+        assert list(ht.filter(False).iter_rows()) == []
+
+        it = ht.iter_rows()
+        assert next(it) == rows[0]
+        it.close()
+
     def test_take_localize_false(self):
         ht = hl.utils.range_table(10)
         assert hl.eval(ht.take(3, _localize=False)) == ht.take(3)
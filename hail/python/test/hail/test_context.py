@@ -1,5 +1,7 @@
 import unittest
 import hail as hl
+from hail.utils import new_temp_file
+from hail.utils.java import Env
 from .helpers import *
 
 setUpModule = startTestHailContext
@@ -9,3 +11,87 @@ tearDownModule = stopTestHailContext
 class Tests(unittest.TestCase):
     def test_init_hail_context_twice(self):
         hl.init(hl.spark_context(), idempotent=True) # Should be no error
+
+    def test_result_cache(self):
+        path = new_temp_file(suffix='ht')
+        hl.utils.range_table(10).write(path)
+        hl.enable_result_cache()
+        try:
+            cache = hl.result_cache()
+            ht = hl.read_table(path)
+            self.assertEqual(ht.count(), 10)
+            self.assertEqual(hl.read_table(path).count(), 10)
+            self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 1, 1))
+            self.assertEqual(cache.entries()[0]['inputs'], [path + '/_SUCCESS'])
+
+            hl.utils.range_table(5).write(path, overwrite=True)
+            self.assertEqual(hl.read_table(path).count(), 5)
+            self.assertEqual(cache.misses, 2)
+            self.assertEqual(len(cache), 1)
+
+            ht = hl.read_table(path)
+            self.assertEqual(ht.aggregate(hl.agg.sum(ht.idx)), 10)
+            self.assertEqual(ht.aggregate(hl.agg.sum(ht.idx)), 10)
+            self.assertEqual(cache.hits, 2)
+
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+            self.assertEqual(cache.nbytes, 0)
+        finally:
+            hl.disable_result_cache()
+        self.assertIsNone(hl.result_cache())
+
+    def test_auto_persist(self):
+        hl.enable_auto_persist(max_persisted=1)
+        try:
+            planner = hl.auto_persist()
+            ht = hl.utils.range_table(100, 4)
+            ht = ht.annotate(x=ht.idx * 2)
+            ht = ht.filter(ht.x % 3 == 0)
+            self.assertEqual(ht.count(), 34)
+            self.assertEqual(len(planner), 0)
+
+            self.assertEqual(ht.aggregate(hl.agg.sum(ht.x)), 3366)
+            self.assertEqual(planner.entries(),
+                             [{'kind': 'Table', 'ir': 'TableFilter', 'executions': 2, 'path': None}])
+            self.assertEqual(ht.count(), 34)
+            self.assertEqual(ht.head(3).idx.collect(), [0, 3, 6])
+            self.assertEqual(planner.entries()[0]['executions'], 4)
+            self.assertIn('TableFilter', planner.explain())
+
+            mt = hl.utils.range_matrix_table(10, 10)
+            mt = mt.filter_rows(mt.row_idx < 5)
+            self.assertEqual(mt.count_rows(), 5)
+            self.assertEqual(mt.count_rows(), 5)
+            self.assertEqual([e['kind'] for e in planner.entries()], ['MatrixTable'])
+            self.assertEqual(planner.n_evicted, 1)
+        finally:
+            hl.disable_auto_persist()
+        self.assertIsNone(hl.auto_persist())
+
+    def test_auto_persist_with_result_cache(self):
+        for checkpoint in [False, True]:
+            hl.enable_result_cache()
+            hl.enable_auto_persist(checkpoint=checkpoint)
+            try:
+                cache = hl.result_cache()
+                planner = hl.auto_persist()
+                ht = hl.utils.range_table(100, 4)
+                ht = ht.filter(ht.idx % 3 == 0)
+                for _ in range(3):
+                    self.assertEqual(ht.count(), 34)
+                self.assertEqual(len(planner), 0)
+                self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+                self.assertEqual(ht.aggregate(hl.agg.sum(ht.idx)), 1683)
+                self.assertEqual(len(planner), 1)
+                self.assertEqual(ht.count(), 34)
+                self.assertEqual(len(cache), 2)
+                self.assertEqual(cache.hits, 3)
+
+                futures = [Env.backend().execute_async(hl.ir.TableCount(ht.head(i)._tir)) for i in range(8)]
+                self.assertEqual([f.result() for f in futures], list(range(8)))
+                self.assertEqual(len(planner), 1)
+            finally:
+                hl.disable_auto_persist()
+                hl.disable_result_cache()
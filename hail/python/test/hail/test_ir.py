@@ -1,3 +1,4 @@
+import io
 import unittest
 import hail as hl
 import hail.ir as ir
@@ -123,10 +124,76 @@ class ValueIRTests(unittest.TestCase):
         for x in self.value_irs():
             Env.hail().expr.ir.IRParser.parse_value_ir(str(x), env, {})
 
+    def test_cse_parses(self):
+        env = {'c': hl.tbool,
+               'a': hl.tarray(hl.tint32),
+               'aa': hl.tarray(hl.tarray(hl.tint32)),
+               'da': hl.tarray(hl.ttuple(hl.tint32, hl.tstr)),
+               'nd': hl.tndarray(hl.tfloat64),
+               'v': hl.tint32,
+               's': hl.tstruct(x=hl.tint32, y=hl.tint64, z=hl.tfloat64),
+               't': hl.ttuple(hl.tint32, hl.tint64, hl.tfloat64),
+               'call': hl.tcall,
+               'x': hl.tint32}
+        env = {name: t._parsable_string() for name, t in env.items()}
+        for x in self.value_irs():
+            Env.hail().expr.ir.IRParser.parse_value_ir(ir.CSERenderer()(ir.MakeTuple([x, x])), env, {})
+
     def test_copies(self):
         for x in self.value_irs():
             self.assertEqual(x, x.copy(*x.children))
 
+    def test_structural_hash(self):
+        for x in self.value_irs():
+            y = x.copy(*x.children)
+            if x == y:
+                self.assertEqual(hash(x), hash(y))
+
+    def test_intern(self):
+        x = ir.ApplyBinaryOp('+', ir.Ref('x'), ir.I32(5))
+        y = ir.ApplyBinaryOp('+', ir.Ref('x'), ir.I32(5))
+        self.assertIs(ir.intern_ir(x), x)
+        self.assertIs(ir.intern_ir(y), x)
+        self.assertIsNot(ir.intern_ir(ir.ApplyBinaryOp('+', ir.Ref('x'), ir.I32(6))), x)
+        self.assertIs(ir.intern_ir(ir.TopLevelReference('x')).__class__, ir.TopLevelReference)
+
+        a = hl.int32(1) + hl.int32(2)
+        b = hl.int32(1) + hl.int32(2)
+        self.assertIs(a._ir, b._ir)
+
+    def test_intern_signed_zero(self):
+        self.assertNotEqual(ir.F64(0.0), ir.F64(-0.0))
+        # live expressions holding negative zeros, which interning must not share
+        negatives = [hl.float64(-0.0)]
+        self.assertEqual(str(hl.float64(0.0)._ir), '(F64 0.0)')
+        self.assertEqual(hl.eval(1 / hl.float64(0.0)), float('inf'))
+
+        pairs = [([-0.0], [0.0]),
+                 ([[-0.0]], [[0.0]]),
+                 ({-0.0: 1}, {0.0: 1}),
+                 (hl.Struct(a=-0.0), hl.Struct(a=0.0)),
+                 (hl.Interval(-0.0, 1.0), hl.Interval(0.0, 1.0))]
+        for negative, positive in pairs:
+            negatives.append(hl.literal(negative))
+            self.assertNotIn('-0.0', str(hl.literal(positive)._ir))
+        for neg in negatives:
+            self.assertIn('-0.0', str(neg._ir))
+
+    def test_render_deep(self):
+        x = ir.I32(0)
+        for i in range(20000):
+            x = ir.ApplyBinaryOp('+', x, ir.I32(1))
+        for r in [ir.Renderer(), ir.CSERenderer()]:
+            self.assertEqual(r(x).count('(ApplyBinaryPrimOp'), 20000)
+
+        out = io.StringIO()
+        ir.Renderer().write(x, out)
+        self.assertEqual(out.getvalue(), str(x))
+
+    def test_seeded_equality(self):
+        self.assertNotEqual(ir.ApplySeeded('rand_unif', 1, ir.F64(0), ir.F64(1)),
+                            ir.ApplySeeded('rand_unif', 2, ir.F64(0), ir.F64(1)))
+
 
 class TableIRTests(unittest.TestCase):
 
@@ -191,6 +258,33 @@ class TableIRTests(unittest.TestCase):
         for x in self.table_irs():
             Env.hail().expr.ir.IRParser.parse_table_ir(str(x))
 
+    def test_read_type_cache(self):
+        path = resource('backward_compatability/1.0.0/table/0.ht')
+        backend = Env.backend()
+        t1 = hl.read_table(path)
+        self.assertIn(('TableRead', path), backend._read_types)
+        t2 = hl.read_table(path)
+        self.assertEqual(t1._tir.typ, t2._tir.typ)
+
+        backend._clear_read_types(ir.TableWrite(hl.utils.range_table(1)._tir, new_temp_file(), False, True, None))
+        self.assertEqual(len(backend._read_types), 0)
+
+        hl.read_table(path)
+        write = ir.TableWrite(hl.utils.range_table(1)._tir, new_temp_file(), False, True, None)
+        backend.execute_batch([ir.TableCount(hl.read_table(path)._tir), write])
+        self.assertEqual(len(backend._read_types), 0)
+
+    def test_parse_cache(self):
+        backend = Env.backend()
+        hits = backend.parse_cache.hits
+        t1 = ir.TableRange(17, 3)
+        t2 = ir.TableRange(17, 3)
+        backend._to_java_ir(t1)
+        backend._to_java_ir(t2)
+        self.assertIs(t1._jir, t2._jir)
+        self.assertGreater(backend.parse_cache.hits, hits)
+        self.assertLessEqual(len(backend.parse_cache), backend.parse_cache.capacity)
+
     def test_matrix_ir_parses(self):
         hl.index_bgen(resource('example.8bits.bgen'),
                       reference_genome=hl.get_reference('GRCh37'),
@@ -320,3 +414,85 @@ class ValueTests(unittest.TestCase):
                     None))
             new_globals = hl.eval(hl.Table(map_globals_ir).globals)
             self.assertEquals(new_globals, hl.Struct(foo=v))
+
+    def test_literal_files(self):
+        min_bytes = ir.ir._literal_file_min_bytes
+        ir.ir._literal_file_min_bytes = 0
+        try:
+            self.test_value_same_after_parsing()
+        finally:
+            ir.ir._literal_file_min_bytes = min_bytes
+
+        ids = hl.literal({f'1:{i}:A:T' for i in range(100_000)})
+        text = ir.CSERenderer(literal_files=True)(ids._ir)
+        self.assertTrue(text.startswith('(LiteralFile Set[String] '))
+        self.assertLess(len(text), 1000)
+
+        ht = hl.utils.range_table(200_000)
+        self.assertEqual(ht.filter(ids.contains(hl.str('1:') + hl.str(ht.idx) + ':A:T')).count(), 100_000)
+        self.assertEqual(ht.filter(ids.contains(hl.str(ht.idx))).count(), 0)
+
+
+class CSETests(unittest.TestCase):
+    def test_shared_subtree_rendered_once(self):
+        x = ir.GetField(ir.Ref('row'), 'x')
+        y = ir.ApplyBinaryOp('+', x, x)
+        for _ in range(50):
+            y = ir.ApplyBinaryOp('+', y, y)
+        self.assertLess(len(ir.CSERenderer()(y)), 5000)
+
+    def test_structurally_equal_subtrees(self):
+        def sum_x():
+            x = ir.GetField(ir.Ref('row'), 'x')
+            return ir.ApplyBinaryOp('+', x, x)
+        self.assertEqual(
+            ir.CSERenderer()(ir.MakeTuple([sum_x(), sum_x()])),
+            '(Let __cse_1 (GetField x (Ref row)) '
+            '(Let __cse_2 (ApplyBinaryPrimOp `+` (Ref __cse_1) (Ref __cse_1)) '
+            '(MakeTuple (Ref __cse_2) (Ref __cse_2))))')
+
+    def test_not_lifted_out_of_binding(self):
+        e = ir.GetField(ir.Ref('elt'), 'x')
+        body = ir.MakeTuple([ir.ApplyBinaryOp('+', e, e), ir.ApplyBinaryOp('+', e, e)])
+        self.assertEqual(
+            ir.CSERenderer()(ir.ArrayMap(ir.Ref('a'), 'elt', body)),
+            '(ArrayMap elt (Ref a) '
+            '(Let __cse_1 (GetField x (Ref elt)) '
+            '(Let __cse_2 (ApplyBinaryPrimOp `+` (Ref __cse_1) (Ref __cse_1)) '
+            '(MakeTuple (Ref __cse_2) (Ref __cse_2)))))')
+
+    def test_not_lifted_out_of_branch(self):
+        s = ir.ApplyBinaryOp('+', ir.Ref('x'), ir.Ref('x'))
+        self.assertEqual(
+            ir.CSERenderer()(ir.If(ir.Ref('c'), ir.MakeTuple([s, s]), ir.MakeTuple([s]))),
+            '(If (Ref c) '
+            '(Let __cse_1 (ApplyBinaryPrimOp `+` (Ref x) (Ref x)) (MakeTuple (Ref __cse_1) (Ref __cse_1))) '
+            '(MakeTuple (ApplyBinaryPrimOp `+` (Ref x) (Ref x))))')
+
+    def test_aggregations(self):
+        s = ir.ApplyBinaryOp('+', ir.Ref('x'), ir.Ref('x'))
+        agg = ir.ApplyAggOp('Sum', [], None, [s])
+        self.assertEqual(
+            ir.CSERenderer()(ir.MakeTuple([agg, agg, s])),
+            '(Let __cse_1 (ApplyAggOp Sum () None ((ApplyBinaryPrimOp `+` (Ref x) (Ref x)))) '
+            '(MakeTuple (Ref __cse_1) (Ref __cse_1) (ApplyBinaryPrimOp `+` (Ref x) (Ref x))))')
+
+    def test_random_functions_not_shared(self):
+        x = ir.ApplySeeded('rand_unif', 0, ir.F64(0.0), ir.F64(1.0))
+        self.assertEqual(
+            ir.CSERenderer()(ir.MakeTuple([x, x])),
+            '(MakeTuple (ApplySeeded rand_unif 0 (F64 0.0) (F64 1.0)) (ApplySeeded rand_unif 0 (F64 0.0) (F64 1.0)))')
+
+    def test_relational_children_start_new_scope(self):
+        x = ir.GetField(ir.Ref('row'), 'idx')
+        s = ir.ApplyBinaryOp('+', x, x)
+        filtered = ir.TableFilter(ir.TableRange(10, 1), ir.ApplyComparisonOp('EQ', s, s))
+        self.assertEqual(
+            ir.CSERenderer()(ir.MakeTuple([ir.TableCount(filtered), s, s])),
+            '(Let __cse_1 (GetField idx (Ref row)) '
+            '(Let __cse_2 (ApplyBinaryPrimOp `+` (Ref __cse_1) (Ref __cse_1)) '
+            '(MakeTuple (TableCount (TableFilter (TableRange 10 1) '
+            '(Let __cse_3 (GetField idx (Ref row)) '
+            '(Let __cse_4 (ApplyBinaryPrimOp `+` (Ref __cse_3) (Ref __cse_3)) '
+            '(ApplyComparisonOp EQ (Ref __cse_4) (Ref __cse_4)))))) '
+            '(Ref __cse_2) (Ref __cse_2))))')
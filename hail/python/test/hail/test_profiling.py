@@ -0,0 +1,62 @@
+import unittest
+
+import hail as hl
+from hail.profiling import frontend_profile
+from hail.utils.java import Env
+from .helpers import *
+
+setUpModule = startTestHailContext
+tearDownModule = stopTestHailContext
+
+
+class Tests(unittest.TestCase):
+    def test_profile(self):
+        with hl.profile() as p:
+            ht = hl.utils.range_table(10)
+            ht = ht.annotate(x=ht.idx * 2)
+            self.assertEqual(ht.aggregate(hl.agg.sum(ht.x)), 90)
+            hl.eval(hl.literal([1, 2, 3]))
+
+        phases = p.as_dict()['phases']
+        for phase in ['construct_expr', 'typecheck', 'render', 'to_java_ir', 'execute']:
+            self.assertGreater(phases[phase]['count'], 0)
+            self.assertGreaterEqual(phases[phase]['seconds'], 0)
+        self.assertGreater(phases['render']['size'], 0)
+        self.assertEqual(phases['execute']['count'], 2)
+
+        actions = p.as_dict()['actions']
+        self.assertEqual(len(actions), 2)
+        self.assertEqual(actions[0]['phases']['execute']['count'], 1)
+        self.assertIn('construct_expr', actions[0]['phases'])
+
+        n = phases['construct_expr']['count']
+        hl.literal(1) + 1
+        self.assertEqual(p.phases_dict()['construct_expr']['count'], n)
+        self.assertIn('render', str(p))
+
+    def test_profile_concurrent_actions(self):
+        backend = Env.backend()
+        with hl.profile() as p:
+            irs = [hl.ir.TableCount(hl.utils.range_table(n, 4)._tir) for n in [100, 200]]
+            futures = [backend.execute_async(x) for x in irs]
+            self.assertEqual([f.result() for f in futures], [100, 200])
+            hl.eval(hl.literal(1) + 1)
+
+        phases = p.phases_dict()
+        self.assertEqual(phases['execute']['count'], 3)
+        self.assertGreaterEqual(phases['render']['count'], 3)
+        actions = p.as_dict()['actions']
+        self.assertEqual(len(actions), 3)
+        for action in actions:
+            self.assertEqual(action['phases']['execute']['count'], 1)
+            self.assertIn('render', action['phases'])
+
+    def test_profile_frontend_flag(self):
+        hl._set_flags(profile_frontend='1')
+        try:
+            p = frontend_profile()
+            hl.eval(hl.literal(1) + 1)
+            self.assertEqual(len(p.actions), 1)
+        finally:
+            hl._set_flags(profile_frontend=None)
+        self.assertIsNone(frontend_profile())
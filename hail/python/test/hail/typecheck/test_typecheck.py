@@ -1,5 +1,10 @@
+import importlib
+import inspect
+import pkgutil
 import unittest
 
+import hail
+
 from hail.typecheck.check import *
 
 
@@ -269,6 +274,25 @@ class Tests(unittest.TestCase):
         with self.assertRaises(TypeError):
             f(1, '2', a=2)
 
+    def test_keyword_only(self):
+        @typecheck(a=int, b=int)
+        def f(a=1, *, b):
+            return a, b
+
+        self.assertEqual(f(b=2), (1, 2))
+        self.assertEqual(inspect.signature(f).parameters['b'].kind, inspect.Parameter.KEYWORD_ONLY)
+
+        @typecheck(a=int, b=int)
+        def g(a, *, b=3):
+            return a, b
+
+        self.assertEqual(g(1), (1, 3))
+        self.assertEqual(g(1, b=5), (1, 5))
+        with self.assertRaises(TypeError):
+            g(1, 5)
+        with self.assertRaises(TypeError):
+            g(1, b='5')
+
     def test_extra_args(self):
         @typecheck(x=int)
         def f(x):
@@ -277,3 +301,50 @@ class Tests(unittest.TestCase):
         f(1)
         with self.assertRaises(TypeError):
             f(1, 2)
+
+    def test_signature(self):
+        def f(a, b='5', *c, d, e=None, **g):
+            pass
+
+        checked = typecheck(a=int, b=str, c=int, d=int, e=nullable(int), g=int)(f)
+        self.assertEqual(inspect.signature(checked), inspect.signature(f))
+        self.assertEqual(checked.__name__, 'f')
+
+    def test_internal_checks(self):
+        @typecheck(x=int, y=sequenceof(int))
+        def f(x, y):
+            return x, y
+
+        internal = {'__name__': 'hail.internal', 'f': f}
+        set_internal_checks(False)
+        try:
+            # calls from outside hail are checked
+            self.assertRaises(TypeError, lambda: f('1', [2]))
+            # calls from hail skip validation, but still coerce
+            self.assertEqual(eval("f('1', (2,))", internal), ('1', [2]))
+        finally:
+            set_internal_checks(True)
+        self.assertRaises(TypeError, lambda: eval("f('1', (2,))", internal))
+
+    def test_hail_signatures(self):
+        # an invalid signature is only reported when the function is called
+        invalid = []
+        for m in pkgutil.walk_packages(hail.__path__, 'hail.'):
+            if m.name.startswith('hail.docs'):
+                continue
+            try:
+                module = importlib.import_module(m.name)
+            except ImportError:
+                continue
+            members = list(vars(module).items())
+            for name, c in list(members):
+                if inspect.isclass(c) and c.__module__ == m.name:
+                    members.extend((f'{name}.{k}', v) for k, v in vars(c).items())
+            for name, f in members:
+                f = getattr(f, '__func__', f)
+                if isinstance(f, property):
+                    f = f.fget
+                code = getattr(f, '__code__', None)
+                if code is not None and code.co_name == 'invalid_signature':
+                    invalid.append(f'{m.name}.{name}')
+        self.assertEqual(invalid, [])
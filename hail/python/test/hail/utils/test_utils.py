@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 import hail as hl
@@ -126,6 +127,16 @@ class Tests(unittest.TestCase):
         self.assertEqual(list(ll5), [3, 2, 1])
         self.assertEqual(list(ll6), [5, 4, 1])
 
+        self.assertEqual(list(ll5.concat(ll.push(4))), [4, 3, 2, 1])
+        self.assertEqual(list(ll.concat(ll.push(1), ll.push(3, 2))), [2, 3, 1])
+        self.assertEqual(sorted(ll5.concat(ll6)), [1, 2, 3, 4, 5])
+        self.assertEqual(list(ll4.concat(ll, ll4)), [1])
+        self.assertEqual(list(ll.concat(ll)), [])
+        self.assertIs(ll5.concat(ll), ll5)
+        if ll.concat(ll):
+            self.fail('empty linked list had an implicit boolean value of True')
+        self.assertEqual(len(ll5.concat(ll6)), 5)
+
     def test_struct_ops(self):
         s = Struct(a=1, b=2, c=3)
 
@@ -139,6 +150,50 @@ class Tests(unittest.TestCase):
         self.assertEqual(s.annotate(x=5), Struct(a=1, b=2, c=3, x=5))
         self.assertEqual(s.annotate(**{'a': 5, 'x': 10, 'y': 15}), Struct(a=5, b=2, c=3, x=10, y=15))
 
+    def test_struct_representation(self):
+        s = Struct(**{'a': 1, '1kg': 2, 'values': [3]})
+        self.assertEqual(s.a, 1)
+        self.assertEqual(s['1kg'], 2)
+        # fields shadow the methods of Struct
+        self.assertEqual(s.values, [3])
+        self.assertEqual(list(s), ['a', '1kg', 'values'])
+        self.assertEqual(dict(s), {'a': 1, '1kg': 2, 'values': [3]})
+        self.assertFalse(hasattr(s, '__dict__'))
+
+        self.assertEqual(Struct(a=1, b=2), Struct(b=2, a=1))
+        self.assertEqual(hash(Struct(a=1, b=2)), hash(Struct(b=2, a=1)))
+        self.assertNotEqual(Struct(a=1, b=2), Struct(a=1))
+        self.assertNotEqual(Struct(a=1), {'a': 1})
+        self.assertIs(type(Struct(a=1, b=2)), type(Struct(a=3, b=4)))
+        self.assertEqual(pickle.loads(pickle.dumps(s)), s)
+
+        with self.assertRaises(AttributeError):
+            s.b
+        with self.assertRaises(KeyError):
+            s['b']
+
+        t = hl.tstruct(a=hl.tint32, b=hl.tstr)
+        self.assertEqual(t._convert_from_json({'a': 1, 'b': None}), Struct(a=1, b=None))
+
+        # dunder fields do not replace the protocol methods
+        d = Struct(**{'__len__': 3, 'x': 1})
+        self.assertEqual(len(d), 2)
+        self.assertEqual(d['__len__'], 3)
+        self.assertEqual(Struct(__foo__=4).__foo__, 4)
+
+        # names used internally do not shadow fields
+        internal = Struct(_index=3, _names=4, _struct_index=5, _struct_names=6)
+        self.assertEqual((internal._index, internal._names), (3, 4))
+        self.assertEqual(internal._struct_index['_index'], 0)
+        self.assertEqual(internal['_struct_names'], 6)
+
+        # structs are immutable
+        with self.assertRaises(AttributeError):
+            s.a = 2
+        with self.assertRaises(AttributeError):
+            s.z = 2
+        self.assertEqual(s.annotate(a=2).a, 2)
+
     def test_expr_exception_results_in_fatal_error(self):
         df = range_table(10)
         df = df.annotate(x=[1,2])
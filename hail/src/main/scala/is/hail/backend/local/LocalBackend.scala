@@ -1,6 +1,6 @@
 package is.hail.backend.local
 
-import is.hail.expr.JSONAnnotationImpex
+import is.hail.expr.{BinaryAnnotationImpex, JSONAnnotationImpex}
 import is.hail.expr.ir._
 import org.json4s.jackson.JsonMethods
 
@@ -12,6 +12,12 @@ object LocalBackend {
       JSONAnnotationImpex.exportAnnotation(value, t))
   }
 
+  def executeBinary(ir: IR): Array[Byte] = {
+    val t = ir.typ
+    val value = execute(ir)
+    BinaryAnnotationImpex.exportAnnotation(value, t)
+  }
+
   def execute(ir0: IR): Any = {
     var ir = ir0
 
@@ -3,7 +3,7 @@ package is.hail.backend.spark
 import is.hail.HailContext
 import is.hail.annotations.{Region, SafeRow}
 import is.hail.cxx.CXXUnsupportedOperation
-import is.hail.expr.JSONAnnotationImpex
+import is.hail.expr.{BinaryAnnotationImpex, JSONAnnotationImpex}
 import is.hail.expr.ir._
 import is.hail.expr.types.physical.PTuple
 import is.hail.utils._
@@ -18,6 +18,12 @@ object SparkBackend {
       JSONAnnotationImpex.exportAnnotation(value, t))
   }
 
+  def executeBinary(ir: IR): Array[Byte] = {
+    val t = ir.typ
+    val value = execute(HailContext.get.sc, ir)
+    BinaryAnnotationImpex.exportAnnotation(value, t)
+  }
+
   def executeOrError(sc: SparkContext, ir0: IR, optimize: Boolean = true): Any = {
     var ir = ir0
 
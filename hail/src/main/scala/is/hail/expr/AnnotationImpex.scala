@@ -1,5 +1,8 @@
 package is.hail.expr
 
+import java.io.{ByteArrayInputStream, ByteArrayOutputStream, DataInputStream, DataOutputStream}
+import java.nio.charset.StandardCharsets
+
 import is.hail.annotations.Annotation
 import is.hail.expr.ir.functions.UtilFunctions
 import is.hail.expr.types._
@@ -69,6 +72,177 @@ case class JSONExtractReferenceGenome(name: String, contigs: Array[JSONExtractCo
     contigs.map(c => (c.name, c.length)).toMap, xContigs, yContigs, mtContigs, par.map(_.toLocusTuple))
 }
 
+object BinaryAnnotationImpex {
+  // Big-endian encoding of an annotation of a known type, read by
+  // HailType._from_binary in Python. Each value is preceded by a byte that is 1
+  // if it is present and 0 if it is missing. Arrays and sets of numbers and
+  // Booleans are written as a length, a byte flagging whether any element is
+  // missing, the per-element presence bytes if so, and then the fixed-width
+  // elements, with missing elements written as zero.
+  def exportAnnotation(a: Annotation, t: Type): Array[Byte] = {
+    val bos = new ByteArrayOutputStream()
+    val out = new DataOutputStream(bos)
+    writeNullable(out, a, t)
+    out.flush()
+    bos.toByteArray
+  }
+
+  def isFixedWidth(t: Type): Boolean = t match {
+    case _: TBoolean | _: TInt32 | _: TInt64 | _: TFloat32 | _: TFloat64 => true
+    case _ => false
+  }
+
+  private def writeNullable(out: DataOutputStream, a: Annotation, t: Type) {
+    if (a == null)
+      out.writeBoolean(false)
+    else {
+      out.writeBoolean(true)
+      write(out, a, t)
+    }
+  }
+
+  private def writeString(out: DataOutputStream, s: String) {
+    val bytes = s.getBytes(StandardCharsets.UTF_8)
+    out.writeInt(bytes.length)
+    out.write(bytes)
+  }
+
+  private def writeZero(out: DataOutputStream, t: Type) {
+    (t: @unchecked) match {
+      case _: TBoolean => out.writeBoolean(false)
+      case _: TInt32 => out.writeInt(0)
+      case _: TInt64 => out.writeLong(0)
+      case _: TFloat32 => out.writeFloat(0)
+      case _: TFloat64 => out.writeDouble(0)
+    }
+  }
+
+  private def writeElements(out: DataOutputStream, elems: Iterable[Any], elementType: Type) {
+    out.writeInt(elems.size)
+    if (isFixedWidth(elementType)) {
+      val hasMissing = elems.exists(_ == null)
+      out.writeBoolean(hasMissing)
+      if (hasMissing)
+        elems.foreach(elem => out.writeBoolean(elem != null))
+      elems.foreach { elem =>
+        if (elem == null)
+          writeZero(out, elementType)
+        else
+          write(out, elem, elementType)
+      }
+    } else
+      elems.foreach(elem => writeNullable(out, elem, elementType))
+  }
+
+  private def write(out: DataOutputStream, a: Annotation, t: Type) {
+    (t: @unchecked) match {
+      case _: TBoolean => out.writeBoolean(a.asInstanceOf[Boolean])
+      case _: TInt32 => out.writeInt(a.asInstanceOf[Int])
+      case _: TInt64 => out.writeLong(a.asInstanceOf[Long])
+      case _: TFloat32 => out.writeFloat(a.asInstanceOf[Float])
+      case _: TFloat64 => out.writeDouble(a.asInstanceOf[Double])
+      case _: TString => writeString(out, a.asInstanceOf[String])
+      case TVoid =>
+      case TArray(elementType, _) =>
+        writeElements(out, a.asInstanceOf[Seq[Any]], elementType)
+      case TSet(elementType, _) =>
+        writeElements(out, a.asInstanceOf[Set[Any]], elementType)
+      case TDict(keyType, valueType, _) =>
+        val m = a.asInstanceOf[Map[_, _]]
+        out.writeInt(m.size)
+        m.foreach { case (k, v) =>
+          writeNullable(out, k, keyType)
+          writeNullable(out, v, valueType)
+        }
+      case _: TCall => out.writeInt(a.asInstanceOf[Call])
+      case TLocus(_, _) =>
+        val l = a.asInstanceOf[Locus]
+        writeString(out, l.contig)
+        out.writeInt(l.position)
+      case TInterval(pointType, _) =>
+        val i = a.asInstanceOf[Interval]
+        writeNullable(out, i.start, pointType)
+        writeNullable(out, i.end, pointType)
+        out.writeBoolean(i.includesStart)
+        out.writeBoolean(i.includesEnd)
+      case TStruct(fields, _) =>
+        val row = a.asInstanceOf[Row]
+        var i = 0
+        while (i < fields.length) {
+          writeNullable(out, row.get(i), fields(i).typ)
+          i += 1
+        }
+      case TTuple(types, _) =>
+        val row = a.asInstanceOf[Row]
+        var i = 0
+        while (i < types.length) {
+          writeNullable(out, row.get(i), types(i))
+          i += 1
+        }
+    }
+  }
+
+  // Inverse of exportAnnotation.
+  def importAnnotation(bytes: Array[Byte], t: Type): Annotation = {
+    val in = new DataInputStream(new ByteArrayInputStream(bytes))
+    readNullable(in, t)
+  }
+
+  private def readNullable(in: DataInputStream, t: Type): Annotation = {
+    if (in.readBoolean())
+      read(in, t)
+    else
+      null
+  }
+
+  private def readString(in: DataInputStream): String = {
+    val bytes = new Array[Byte](in.readInt())
+    in.readFully(bytes)
+    new String(bytes, StandardCharsets.UTF_8)
+  }
+
+  private def readElements(in: DataInputStream, elementType: Type): IndexedSeq[Any] = {
+    val n = in.readInt()
+    if (isFixedWidth(elementType)) {
+      val present = if (in.readBoolean()) Array.fill(n)(in.readBoolean()) else null
+      Array.tabulate[Any](n) { i =>
+        val elem = read(in, elementType)
+        if (present == null || present(i)) elem else null
+      }
+    } else
+      Array.fill[Any](n)(readNullable(in, elementType))
+  }
+
+  private def read(in: DataInputStream, t: Type): Annotation = {
+    t match {
+      case _: TBoolean => in.readBoolean()
+      case _: TInt32 => in.readInt()
+      case _: TInt64 => in.readLong()
+      case _: TFloat32 => in.readFloat()
+      case _: TFloat64 => in.readDouble()
+      case _: TString => readString(in)
+      case TArray(elementType, _) => readElements(in, elementType).toFastIndexedSeq
+      case TSet(elementType, _) => readElements(in, elementType).toSet
+      case TDict(keyType, valueType, _) =>
+        val n = in.readInt()
+        Array.fill(n)((readNullable(in, keyType), readNullable(in, valueType))).toMap
+      case _: TCall => in.readInt()
+      case TLocus(_, _) =>
+        val contig = readString(in)
+        Locus(contig, in.readInt())
+      case TInterval(pointType, _) =>
+        val start = readNullable(in, pointType)
+        val end = readNullable(in, pointType)
+        val includesStart = in.readBoolean()
+        Interval(start, end, includesStart, in.readBoolean())
+      case TStruct(fields, _) => Row.fromSeq(fields.map(f => readNullable(in, f.typ)))
+      case TTuple(types, _) => Row.fromSeq(types.map(readNullable(in, _)))
+      case TVoid => null
+      case _ => fatal(s"cannot import binary annotation of type $t")
+    }
+  }
+}
+
 object JSONAnnotationImpex {
   def exportType(t: Type): Type = t
 
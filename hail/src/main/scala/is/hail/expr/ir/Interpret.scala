@@ -4,7 +4,7 @@ import is.hail.{HailContext, Uploader, stats}
 import is.hail.annotations.aggregators.RegionValueAggregator
 import is.hail.annotations._
 import is.hail.asm4s.AsmFunction3
-import is.hail.expr.{JSONAnnotationImpex, TypedAggregator}
+import is.hail.expr.{BinaryAnnotationImpex, JSONAnnotationImpex, TypedAggregator}
 import is.hail.expr.types._
 import is.hail.expr.types.physical.PTuple
 import is.hail.expr.types.virtual._
@@ -24,6 +24,12 @@ object Interpret {
       JSONAnnotationImpex.exportAnnotation(value, t))
   }
 
+  def interpretBinary(ir: IR): Array[Byte] = {
+    val t = ir.typ
+    val value = Interpret[Any](ir)
+    BinaryAnnotationImpex.exportAnnotation(value, t)
+  }
+
   def apply(tir: TableIR): TableValue =
     apply(tir, optimize = true)
 
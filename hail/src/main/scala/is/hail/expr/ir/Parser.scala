@@ -2,7 +2,7 @@ package is.hail.expr.ir
 
 import is.hail.HailContext
 import is.hail.expr.ir.functions.RelationalFunctions
-import is.hail.expr.{JSONAnnotationImpex, ParserUtils}
+import is.hail.expr.{BinaryAnnotationImpex, JSONAnnotationImpex, ParserUtils}
 import is.hail.expr.types.{MatrixType, TableType}
 import is.hail.expr.types.virtual._
 import is.hail.expr.types.physical.PType
@@ -491,6 +491,32 @@ object IRParser {
     (typ, v)
   }
 
+  // Values of large literals, which Python writes once to a local file in the
+  // encoding of BinaryAnnotationImpex, keyed by type and content hash
+  private val literalFileCacheCapacity = 64
+  private val literalFileCache = new java.util.LinkedHashMap[(Type, String), Any](literalFileCacheCapacity, 0.75f, true) {
+    override def removeEldestEntry(eldest: java.util.Map.Entry[(Type, String), Any]): Boolean =
+      size() > literalFileCacheCapacity
+  }
+
+  def ir_value_file(it: TokenIterator): (Type, Any) = {
+    val typ = type_expr(it)
+    val path = string_literal(it)
+    val hash = string_literal(it)
+    val key = (typ, hash)
+    val v = literalFileCache.synchronized {
+      if (literalFileCache.containsKey(key))
+        literalFileCache.get(key)
+      else {
+        val bytes = java.nio.file.Files.readAllBytes(java.nio.file.Paths.get(path))
+        val v = BinaryAnnotationImpex.importAnnotation(bytes, typ)
+        literalFileCache.put(key, v)
+        v
+      }
+    }
+    (typ, v)
+  }
+
   def named_value_irs(env: IRParserEnvironment)(it: TokenIterator): Array[(String, IR)] =
     repUntil(it, named_value_ir(env), PunctuationToken(")"))
 
@@ -531,6 +557,9 @@ object IRParser {
       case "Literal" =>
         val (t, v) = ir_value(it)
         Literal.coerce(t, v)
+      case "LiteralFile" =>
+        val (t, v) = ir_value_file(it)
+        Literal.coerce(t, v)
       case "Void" => Void()
       case "Cast" =>
         val typ = type_expr(it)
@@ -58,6 +58,19 @@ object Table {
     Table(hc, df.rdd, signature, key)
   }
 
+  // `bytes` is the binary encoding (see BinaryAnnotationImpex) of a struct
+  // with the fields of `signature`, each an array holding one column
+  def fromBinaryColumns(hc: HailContext, bytes: Array[Byte], signature: String,
+    key: java.util.ArrayList[String]): Table = {
+    val rowType = IRParser.parseStructType(signature)
+    val columnsType = TStruct(rowType.fields.map(f => f.name -> TArray(f.typ)): _*)
+    val columns = BinaryAnnotationImpex.importAnnotation(bytes, columnsType).asInstanceOf[Row]
+      .toSeq.map(_.asInstanceOf[IndexedSeq[Any]]).toArray
+    val nRows = if (columns.isEmpty) 0 else columns(0).length
+    val rows = Array.tabulate(nRows)(i => Row.fromSeq(columns.map(_(i))))
+    Table(hc, hc.sc.parallelize(rows), rowType, key.asScala.toArray.toFastIndexedSeq)
+  }
+
   def read(hc: HailContext, path: String): Table =
     new Table(hc, TableIR.read(hc, path, dropRows = false, None))
 